@@ -1,17 +1,29 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.core.security import verify_password, get_password_hash, create_access_token
+from app.core.query_counter import statement_budget
+from app.core.security import (
+    PasswordHashBusyError,
+    create_access_token,
+    get_password_hash_async,
+    verify_password_async,
+)
 from app.schemas.schemas import UserCreate, UserLogin, Token, UserResponse
 from app.models.models import User
 
 router = APIRouter()
 
-@router.post("/register", response_model=Token, status_code=status.HTTP_201_CREATED)
-async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+@router.post(
+    "/register",
+    response_model=Token,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(statement_budget(3))],
+)
+async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
     """新規ユーザー登録"""
     # メールアドレスの重複チェック
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await db.scalar(select(User).where(User.email == user_data.email))
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -19,7 +31,7 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         )
     
     # ユーザー作成
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await get_password_hash_async(user_data.password)
     new_user = User(
         email=user_data.email,
         username=user_data.username,
@@ -27,8 +39,8 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
     )
     
     db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    await db.commit()
+    await db.refresh(new_user)
     
     # トークン生成
     access_token = create_access_token(data={"sub": new_user.email, "user_id": new_user.id})
@@ -39,12 +51,22 @@ async def register(user_data: UserCreate, db: Session = Depends(get_db)):
         "user": UserResponse.model_validate(new_user)
     }
 
-@router.post("/login", response_model=Token)
-async def login(user_data: UserLogin, db: Session = Depends(get_db)):
+@router.post("/login", response_model=Token, dependencies=[Depends(statement_budget(1))])
+async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     """ユーザーログイン"""
     # ユーザー検索
-    user = db.query(User).filter(User.email == user_data.email).first()
-    if not user or not verify_password(user_data.password, user.hashed_password):
+    user = await db.scalar(select(User).where(User.email == user_data.email))
+    try:
+        verified = user is not None and await verify_password_async(
+            user_data.password, user.hashed_password, sheddable=True
+        )
+    except PasswordHashBusyError:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress, try again shortly",
+            headers={"Retry-After": "1"},
+        )
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
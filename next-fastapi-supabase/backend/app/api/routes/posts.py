@@ -1,32 +1,64 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
 from app.core.database import get_db
-from app.schemas.schemas import PostCreate, PostUpdate, PostResponse
+from app.core.loading import NO_RELATIONS, POST_WITH_AUTHOR
+from app.core.pagination import InvalidCursorError
+from app.core.post_search import SORT_KEYS, PostFilters, build_posts_query, paginate
+from app.core.query_counter import statement_budget
+from app.schemas.schemas import PostCreate, PostUpdate, PostResponse, PostDetailResponse
 from app.models.models import Post
 
 router = APIRouter()
 
-@router.get("/", response_model=List[PostResponse])
+@router.get("/", response_model=List[PostDetailResponse], dependencies=[Depends(statement_budget(1))])
 async def get_posts(
-    skip: int = 0,
-    limit: int = 100,
-    published: bool = None,
-    db: Session = Depends(get_db)
+    response: Response,
+    q: Optional[str] = Query(None, max_length=200, description="タイトル・本文の全文検索"),
+    author_id: Optional[str] = None,
+    published: Optional[bool] = None,
+    created_after: Optional[datetime] = Query(None, description="この日時以降に作成（含む）"),
+    created_before: Optional[datetime] = Query(None, description="この日時より前に作成"),
+    sort: str = Query("-created_at", description=f"並び順: {', '.join(SORT_KEYS)}"),
+    cursor: Optional[str] = Query(None, description="前のレスポンスの X-Next-Cursor"),
+    limit: int = Query(100, ge=1, le=100),
+    skip: int = Query(0, ge=0, description="非推奨: cursor を使う"),
+    db: AsyncSession = Depends(get_db)
 ):
-    """投稿一覧を取得"""
-    query = db.query(Post)
-    
-    if published is not None:
-        query = query.filter(Post.published == published)
+    """投稿一覧を取得（検索・絞り込み・キーセットページング）
+
+    次ページがあれば X-Next-Cursor ヘッダーにカーソルを返す。
+    """
+    if sort not in SORT_KEYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"sort must be one of: {', '.join(SORT_KEYS)}"
+        )
+    filters = PostFilters(
+        q=q.strip() if q else None,
+        author_id=author_id,
+        published=published,
+        created_after=created_after,
+        created_before=created_before,
+    )
+    try:
+        query = POST_WITH_AUTHOR.apply(build_posts_query(filters, sort, limit, cursor))
+    except (InvalidCursorError, ValueError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    if cursor is None and skip:
+        query = query.offset(skip)
     
-    posts = query.offset(skip).limit(limit).all()
+    result = await db.execute(query)
+    posts, next_cursor = paginate(result.all(), sort, limit)
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = next_cursor
     return posts
 
-@router.get("/{post_id}", response_model=PostResponse)
-async def get_post(post_id: str, db: Session = Depends(get_db)):
+@router.get("/{post_id}", response_model=PostDetailResponse, dependencies=[Depends(statement_budget(1))])
+async def get_post(post_id: str, db: AsyncSession = Depends(get_db)):
     """特定の投稿を取得"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await POST_WITH_AUTHOR.get(db, Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -34,27 +66,32 @@ async def get_post(post_id: str, db: Session = Depends(get_db)):
         )
     return post
 
-@router.post("/", response_model=PostResponse, status_code=status.HTTP_201_CREATED)
+@router.post(
+    "/",
+    response_model=PostResponse,
+    status_code=status.HTTP_201_CREATED,
+    dependencies=[Depends(statement_budget(2))],
+)
 async def create_post(
     post_data: PostCreate,
     author_id: str,  # 実際はJWT認証から取得
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """新規投稿を作成"""
     new_post = Post(**post_data.model_dump(), author_id=author_id)
     db.add(new_post)
-    db.commit()
-    db.refresh(new_post)
+    await db.commit()
+    await db.refresh(new_post)
     return new_post
 
-@router.put("/{post_id}", response_model=PostResponse)
+@router.put("/{post_id}", response_model=PostResponse, dependencies=[Depends(statement_budget(3))])
 async def update_post(
     post_id: str,
     post_data: PostUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """投稿を更新"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await NO_RELATIONS.get(db, Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -64,20 +101,20 @@ async def update_post(
     for key, value in post_data.model_dump().items():
         setattr(post, key, value)
     
-    db.commit()
-    db.refresh(post)
+    await db.commit()
+    await db.refresh(post)
     return post
 
-@router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_post(post_id: str, db: Session = Depends(get_db)):
+@router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(statement_budget(2))])
+async def delete_post(post_id: str, db: AsyncSession = Depends(get_db)):
     """投稿を削除"""
-    post = db.query(Post).filter(Post.id == post_id).first()
+    post = await NO_RELATIONS.get(db, Post, post_id)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Post not found"
         )
     
-    db.delete(post)
-    db.commit()
+    await db.delete(post)
+    await db.commit()
     return None
@@ -1,22 +1,24 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 from app.core.database import get_db
+from app.core.query_counter import statement_budget
 from app.schemas.schemas import UserResponse
 from app.models.models import User
 
 router = APIRouter()
 
-@router.get("/", response_model=List[UserResponse])
-async def get_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.get("/", response_model=List[UserResponse], dependencies=[Depends(statement_budget(1))])
+async def get_users(skip: int = 0, limit: int = 100, db: AsyncSession = Depends(get_db)):
     """ユーザー一覧を取得"""
-    users = db.query(User).offset(skip).limit(limit).all()
-    return users
+    result = await db.execute(select(User).offset(skip).limit(limit))
+    return result.scalars().all()
 
-@router.get("/{user_id}", response_model=UserResponse)
-async def get_user(user_id: str, db: Session = Depends(get_db)):
+@router.get("/{user_id}", response_model=UserResponse, dependencies=[Depends(statement_budget(1))])
+async def get_user(user_id: str, db: AsyncSession = Depends(get_db)):
     """特定のユーザーを取得"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -24,16 +26,16 @@ async def get_user(user_id: str, db: Session = Depends(get_db)):
         )
     return user
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_user(user_id: str, db: Session = Depends(get_db)):
-    """ユーザーを削除"""
-    user = db.query(User).filter(User.id == user_id).first()
+@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[Depends(statement_budget(2))])
+async def delete_user(user_id: str, db: AsyncSession = Depends(get_db)):
+    """ユーザーを削除（投稿は DB の ON DELETE CASCADE で削除される）"""
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found"
         )
     
-    db.delete(user)
-    db.commit()
+    await db.delete(user)
+    await db.commit()
     return None
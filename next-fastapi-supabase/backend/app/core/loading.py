@@ -0,0 +1,37 @@
+from typing import Any, Optional, Type, TypeVar
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm.interfaces import ORMOption
+from app.models.models import Post
+
+ModelT = TypeVar("ModelT")
+
+class LoadPolicy:
+    """ルートが必要とするリレーションの読み込み方法
+
+    リレーションは lazy="raise_on_sql" なので、ここで宣言していないリレーションに
+    触れると暗黙の遅延ロード（行ごとの SELECT）ではなく例外になる。
+
+    使い方:
+        result = await db.execute(POST_WITH_AUTHOR.apply(select(Post)))
+        post = await POST_WITH_AUTHOR.get(db, Post, post_id)
+    """
+
+    def __init__(self, *options: ORMOption):
+        self.options = options
+
+    def apply(self, statement: Select) -> Select:
+        """SELECT 文に読み込みオプションを付ける"""
+        return statement.options(*self.options) if self.options else statement
+
+    async def get(self, db: AsyncSession, model: Type[ModelT], ident: Any) -> Optional[ModelT]:
+        """主キーで 1 件取得（オプション付き）"""
+        return await db.get(model, ident, options=self.options)
+
+# リレーションを読み込まない
+NO_RELATIONS = LoadPolicy()
+# 投稿 + 作成者（多対一は JOIN で同じ SELECT に含める）
+POST_WITH_AUTHOR = LoadPolicy(joinedload(Post.author))
+# 一対多（例: ユーザー + 投稿一覧）を返すルートを追加するときは、
+# selectinload で IN 句の追加 SELECT 1 回にまとめるポリシーをここに定義する
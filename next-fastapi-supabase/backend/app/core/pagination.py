@@ -0,0 +1,24 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+
+class InvalidCursorError(ValueError):
+    """カーソルが壊れている、または別の並び順で発行されたときの例外"""
+
+def encode_cursor(sort: str, values: List[Any]) -> str:
+    """キーセットページングのカーソルを作成（最後の行の並び替えキー + 並び順）"""
+    payload = [sort, [value.isoformat() if isinstance(value, datetime) else value for value in values]]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+def decode_cursor(cursor: str, sort: str) -> List[Any]:
+    """カーソルを復元。並び順が一致しなければ InvalidCursorError"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, values = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if cursor_sort != sort or not isinstance(values, list):
+        raise InvalidCursorError("Cursor was issued for a different sort order")
+    return values
@@ -0,0 +1,148 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.sql.elements import ColumnElement
+from app.core.config import settings
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.models.models import Post
+
+# 全文検索の設定。search_vector 列（migrations/002_post_search.sql）と同じものを使う
+SEARCH_CONFIG = "simple"
+
+@dataclass(frozen=True)
+class SortKey:
+    """ホワイトリストに登録された並び順（同じ値の行は id で順序を決める）"""
+
+    column: Optional[str]  # Post の列名。None は検索語との関連度
+    descending: bool
+
+    @property
+    def requires_search(self) -> bool:
+        return self.column is None
+
+# sort パラメータで指定できる並び順
+SORT_KEYS = {
+    "-created_at": SortKey("created_at", descending=True),
+    "created_at": SortKey("created_at", descending=False),
+    "-title": SortKey("title", descending=True),
+    "title": SortKey("title", descending=False),
+    "relevance": SortKey(None, descending=True),  # q が必要
+}
+
+@dataclass
+class PostFilters:
+    """投稿一覧の絞り込み条件"""
+
+    q: Optional[str] = None
+    author_id: Optional[str] = None
+    published: Optional[bool] = None
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+def search_query(q: str) -> ColumnElement:
+    """ユーザー入力を tsquery に変換（"..." や -除外 など Web 検索風の構文に対応）"""
+    return func.websearch_to_tsquery(SEARCH_CONFIG, q)
+
+def build_posts_query(
+    filters: PostFilters,
+    sort: str,
+    limit: int,
+    cursor: Optional[str] = None,
+    relevance_candidates: Optional[int] = None,
+) -> Select:
+    """絞り込み・並び替え・キーセットページングを適用した SELECT を作成
+
+    次ページの有無を判定するため limit + 1 件取得する（paginate を参照）。
+    関連度順のときは各行に関連度（sort_value）も付く。関連度の計算は一致した
+    行数に比例するため、一致した投稿のうち新しい relevance_candidates 件
+    （省略時は SEARCH_RELEVANCE_CANDIDATES、0 = 無制限）だけを順位付けする。
+
+    Raises:
+        KeyError: sort がホワイトリストにない
+        ValueError: relevance を q なしで指定した
+        InvalidCursorError: カーソルが不正
+    """
+    key = SORT_KEYS[sort]
+    tsquery = search_query(filters.q) if filters.q else None
+    if key.requires_search and tsquery is None:
+        raise ValueError(f"sort={sort} requires q")
+
+    conditions: List[ColumnElement] = []
+    if tsquery is not None:
+        # GIN インデックス（idx_posts_search_vector）で絞り込む
+        conditions.append(Post.search_vector.op("@@")(tsquery))
+    if filters.author_id is not None:
+        conditions.append(Post.author_id == filters.author_id)
+    if filters.published is not None:
+        conditions.append(Post.published == filters.published)
+    if filters.created_after is not None:
+        conditions.append(Post.created_at >= filters.created_after)
+    if filters.created_before is not None:
+        conditions.append(Post.created_at < filters.created_before)
+
+    if relevance_candidates is None:
+        relevance_candidates = settings.SEARCH_RELEVANCE_CANDIDATES
+    if key.requires_search and relevance_candidates:
+        candidates = (
+            select(Post.id)
+            .where(*conditions)
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .limit(relevance_candidates)
+        )
+        conditions = [Post.id.in_(candidates)]
+
+    if key.requires_search:
+        sort_column = func.ts_rank_cd(Post.search_vector, tsquery)
+    else:
+        sort_column = getattr(Post, key.column)
+
+    if cursor is not None:
+        value, last_id = cursor_position(cursor, sort)
+        # 行値比較 (sort_column, id) < (...) は複合インデックスの範囲スキャンになる
+        position = tuple_(sort_column, Post.id)
+        boundary = tuple_(value, last_id)
+        conditions.append(position < boundary if key.descending else position > boundary)
+
+    order = (sort_column.desc(), Post.id.desc()) if key.descending else (sort_column.asc(), Post.id.asc())
+    statement = select(Post).where(*conditions).order_by(*order).limit(limit + 1)
+    if key.requires_search:
+        statement = statement.add_columns(sort_column.label("sort_value"))
+    return statement
+
+def cursor_position(cursor: str, sort: str) -> Tuple[Any, str]:
+    """カーソルから (並び替えキーの値, id) を復元し、並び順に合う型か検証する
+
+    カーソルは署名していないため、クライアントが書き換えた値がそのまま届く。
+
+    Raises:
+        InvalidCursorError: 要素数や型が並び順と合わない
+    """
+    key = SORT_KEYS[sort]
+    values = decode_cursor(cursor, sort)
+    if len(values) != 2 or not isinstance(values[1], str):
+        raise InvalidCursorError("Malformed cursor")
+    value, last_id = values
+    if key.requires_search:
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    else:
+        valid = isinstance(value, str)
+    if not valid:
+        raise InvalidCursorError("Malformed cursor")
+    if key.column == "created_at":
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError as exc:
+            raise InvalidCursorError("Malformed cursor") from exc
+    return value, last_id
+
+def paginate(rows: Sequence[Any], sort: str, limit: int) -> Tuple[List[Post], Optional[str]]:
+    """limit + 1 行の結果（result.all()）を 1 ページ分の投稿と次ページのカーソルに分ける"""
+    key = SORT_KEYS[sort]
+    posts = [row[0] for row in rows[:limit]]
+    if len(rows) <= limit:
+        return posts, None
+
+    last = rows[limit - 1]
+    value = last.sort_value if key.requires_search else getattr(last[0], key.column)
+    return posts, encode_cursor(sort, [value, last[0].id])
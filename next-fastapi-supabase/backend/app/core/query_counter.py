@@ -0,0 +1,88 @@
+import logging
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from app.core.config import settings
+
+logger = logging.getLogger("app.query_counter")
+
+class StatementBudgetExceeded(RuntimeError):
+    """リクエスト中の SQL 文の数がルートの上限を超えたときの例外（raise モード）"""
+
+@dataclass
+class StatementCounter:
+    """1 リクエスト中に実行された SQL 文の数"""
+
+    route: str
+    budget: int
+    count: int = 0
+    statements: Counter = field(default_factory=Counter)
+    reported: bool = False  # raise モードで送出時にログ済み
+
+    def report(self) -> str:
+        """上限超過時のメッセージ（最も多く繰り返された文を含む）"""
+        statement, repeats = self.statements.most_common(1)[0]
+        return (
+            f"{self.route} executed {self.count} SQL statements (budget {self.budget}); "
+            f"most repeated ({repeats}x): {' '.join(statement.split())[:200]}"
+        )
+
+_current_counter: ContextVar[Optional[StatementCounter]] = ContextVar("statement_counter", default=None)
+
+def _count_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    counter = _current_counter.get()
+    if counter is None:
+        return
+    counter.count += 1
+    counter.statements[statement] += 1
+    if counter.count > counter.budget and settings.QUERY_COUNTER_MODE == "raise":
+        report = counter.report()
+        counter.reported = True
+        logger.warning(report)
+        raise StatementBudgetExceeded(report)
+
+def install_statement_counter(engine: AsyncEngine) -> None:
+    """エンジンで実行される SQL 文を数えるイベントを登録"""
+    event.listen(engine.sync_engine, "before_cursor_execute", _count_statement)
+
+def statement_budget(max_statements: int):
+    """ルートの SQL 文の上限を宣言する依存関数
+
+    使い方:
+        @router.get("/", dependencies=[Depends(statement_budget(1))])
+    """
+    async def set_budget() -> None:
+        counter = _current_counter.get()
+        if counter is not None:
+            counter.budget = max_statements
+    return set_budget
+
+class StatementCounterMiddleware:
+    """リクエストごとに SQL 文を数え、上限超過をログに出す（N+1 検出）
+
+    QUERY_COUNTER_MODE:
+        off   - 何もしない（本番）
+        log   - 超過したリクエストを WARNING で記録（開発時）
+        raise - 上限を超えた時点で StatementBudgetExceeded を送出（テスト時）
+    """
+
+    def __init__(self, app, default_budget: int = 10):
+        self.app = app
+        self.default_budget = default_budget
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or settings.QUERY_COUNTER_MODE == "off":
+            await self.app(scope, receive, send)
+            return
+
+        counter = StatementCounter(route=f"{scope['method']} {scope['path']}", budget=self.default_budget)
+        token = _current_counter.set(counter)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_counter.reset(token)
+            if counter.count > counter.budget and not counter.reported:
+                logger.warning(counter.report())
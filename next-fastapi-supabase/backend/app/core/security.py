@@ -1,6 +1,13 @@
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
-from jose import JWTError, jwt
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 from app.core.config import settings
 
@@ -17,6 +24,116 @@ def get_password_hash(password: str) -> str:
     """パスワードをハッシュ化"""
     return pwd_context.hash(password)
 
+class PasswordHashBusyError(Exception):
+    """ハッシュ待ちキューが上限に達し、リクエストを拒否したときの例外"""
+
+class PasswordHasher:
+    """bcrypt のハッシュ化・検証を上限付きワーカープールで実行する
+
+    bcrypt は 1 回 100〜300ms かかるため、async ハンドラから直接呼ぶと
+    イベントループ全体が止まる。同時実行数を workers に制限し、
+    sheddable=True の呼び出しは待ち数が max_queue 以上なら拒否する。
+    """
+
+    def __init__(self, workers: int = 4, executor: str = "thread", max_queue: int = 0):
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash executor: {executor!r}")
+        self.workers = workers
+        self.executor_kind = executor
+        self.max_queue = max_queue
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.in_flight = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.workers)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run(self, func, *args, sheddable: bool = False):
+        semaphore = self._get_semaphore()
+        if sheddable and self.max_queue and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise PasswordHashBusyError("Password hashing queue is full")
+
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        start = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.wait_seconds_total += time.perf_counter() - start
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    async def hash(self, password: str, sheddable: bool = False) -> str:
+        """パスワードをワーカープールでハッシュ化"""
+        return await self._run(get_password_hash, password, sheddable=sheddable)
+
+    async def verify(self, plain_password: str, hashed_password: str, sheddable: bool = False) -> bool:
+        """パスワードをワーカープールで検証"""
+        return await self._run(verify_password, plain_password, hashed_password, sheddable=sheddable)
+
+    def stats(self) -> dict:
+        """プール設定とキュー深さのメトリクス"""
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "peak_queue_depth": self.peak_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": self.wait_seconds_total / self.completed * 1000 if self.completed else 0.0,
+        }
+
+    def shutdown(self):
+        """ワーカープールを終了（次回利用時に再生成）"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    executor=settings.PASSWORD_HASH_EXECUTOR,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+async def get_password_hash_async(password: str) -> str:
+    """パスワードをハッシュ化（イベントループをブロックしない）"""
+    return await password_hasher.hash(password)
+
+async def verify_password_async(plain_password: str, hashed_password: str, sheddable: bool = False) -> bool:
+    """パスワードを検証（イベントループをブロックしない。sheddable=True なら混雑時に PasswordHashBusyError）"""
+    return await password_hasher.verify(plain_password, hashed_password, sheddable=sheddable)
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """JWTアクセストークンを作成"""
     to_encode = data.copy()
@@ -29,10 +146,81 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     encoded_jwt = jwt.encode(to_encode, settings.SUPABASE_JWT_SECRET, algorithm=ALGORITHM)
     return encoded_jwt
 
+class TokenVerifier:
+    """検証済み JWT のクレームを LRU に保持し、再検証を省く
+
+    同じトークンが何度も送られてくるため、トークンの SHA-256 ダイジェスト
+    （トークン本体は保持しない）をキーにクレームをキャッシュする。
+    エントリはトークン自身の exp で失効する。exp のないトークンと
+    検証に失敗したトークンはキャッシュしない。鍵オブジェクトは起動時に一度だけ作る。
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, max_entries: int = 10000):
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self._key = jwk.construct(secret_key, algorithm)
+        self._algorithms = [algorithm]
+        self._entries: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def verify(self, token: str) -> Optional[dict]:
+        """有効なトークンならクレームのコピーを、無効・期限切れなら None を返す"""
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        entry = self._entries.get(digest)
+        if entry is not None:
+            expires_at, claims = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return dict(claims)
+            del self._entries[digest]
+
+        self.misses += 1
+        try:
+            claims = jwt.decode(token, self._key, algorithms=self._algorithms)
+        except JWTError:
+            return None
+
+        expires_at = claims.get("exp")
+        if self.max_entries and isinstance(expires_at, (int, float)) and expires_at > time.time():
+            self._entries[digest] = (float(expires_at), claims)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return dict(claims)
+
+    def stats(self) -> dict:
+        """キャッシュ件数とヒット・ミス数"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+token_verifier = TokenVerifier(
+    settings.SUPABASE_JWT_SECRET,
+    ALGORITHM,
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+)
+
 def decode_token(token: str) -> dict:
-    """JWTトークンをデコード"""
-    try:
-        payload = jwt.decode(token, settings.SUPABASE_JWT_SECRET, algorithms=[ALGORITHM])
-        return payload
-    except JWTError:
-        return None
+    """JWTトークンをデコード（検証済みトークンはキャッシュから返す）"""
+    return token_verifier.verify(token)
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+async def get_token_claims(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+) -> dict:
+    """Bearer トークンのクレームを返す依存関数（無効なら 401）"""
+    claims = decode_token(credentials.credentials) if credentials else None
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
@@ -1,8 +1,227 @@
-from supabase import create_client, Client
+import asyncio
+import email.utils
+import logging
+import random
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+import httpx
 from app.core.config import settings
 
-def get_supabase_client() -> Client:
-    """Supabaseクライアントを取得"""
-    return create_client(settings.SUPABASE_URL, settings.SUPABASE_KEY)
+logger = logging.getLogger("app.supabase")
 
-supabase: Client = get_supabase_client()
+# 冪等なメソッドだけ自動で再試行する（POST / PATCH は retry=True を明示したときのみ）
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+RETRY_STATUS_CODES = frozenset({429, 502, 503, 504})
+LATENCY_SAMPLES = 1000
+
+@dataclass
+class ServiceMetrics:
+    """サービス（rest / auth / storage / functions）ごとのリクエスト数とレイテンシ"""
+
+    requests: int = 0
+    errors: int = 0
+    retries: int = 0
+    latency_ms_total: float = 0.0
+    recent_latency_ms: Deque[float] = field(default_factory=lambda: deque(maxlen=LATENCY_SAMPLES))
+
+    def observe(self, latency_ms: float, failed: bool) -> None:
+        self.requests += 1
+        self.errors += int(failed)
+        self.latency_ms_total += latency_ms
+        self.recent_latency_ms.append(latency_ms)
+
+    def snapshot(self) -> dict:
+        ordered = sorted(self.recent_latency_ms)
+
+        def percentile(pct: int) -> float:
+            return ordered[min(len(ordered) - 1, len(ordered) * pct // 100)] if ordered else 0.0
+
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "retries": self.retries,
+            "avg_ms": self.latency_ms_total / self.requests if self.requests else 0.0,
+            "p50_ms": percentile(50),
+            "p95_ms": percentile(95),
+            "p99_ms": percentile(99),
+        }
+
+class SupabaseClient:
+    """Supabase の REST API（/rest/v1, /auth/v1, /storage/v1 ...）を呼ぶ非同期クライアント
+
+    全リクエストで 1 つの httpx.AsyncClient（HTTP/2・keep-alive の接続プール）を共有する。
+    接続プールは最初の呼び出しか start() で作るので、import 時には通信しない
+    （fork するワーカーでも各プロセスが自分のプールを持つ）。
+    一時的な失敗（接続エラー・タイムアウト・429/502/503/504）はジッター付き指数
+    バックオフで再試行する。Retry-After ヘッダーがあればその秒数だけ待つが、
+    retry_after_max を超える指定のときは再試行せずにそのレスポンスを返す。
+
+    使い方:
+        posts = await supabase.select("posts", {"select": "id,title", "limit": "20"})
+        response = await supabase.request("GET", "/auth/v1/settings", timeout=2.0)
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key: str,
+        timeout: float = 10.0,
+        connect_timeout: float = 3.0,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+        max_retries: int = 2,
+        retry_backoff: float = 0.2,
+        retry_backoff_max: float = 2.0,
+        retry_after_max: float = 30.0,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        self.url = url.rstrip("/")
+        self.key = key
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_backoff_max = retry_backoff_max
+        self.retry_after_max = retry_after_max
+        self.transport = transport  # テストで httpx.MockTransport を渡す
+        self._client: Optional[httpx.AsyncClient] = None
+        self._metrics: Dict[str, ServiceMetrics] = {}
+
+    def _get_client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.url,
+                headers={"apikey": self.key, "Authorization": f"Bearer {self.key}"},
+                timeout=self.timeout,
+                limits=self.limits,
+                http2=self.http2,
+                transport=self.transport,
+            )
+        return self._client
+
+    async def start(self) -> None:
+        """接続プールを作成（lifespan の起動時に呼ぶ）"""
+        self._get_client()
+
+    async def aclose(self) -> None:
+        """接続プールを閉じる（次回利用時に再生成）"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> Optional[float]:
+        """再試行までの待ち秒数。Retry-After が retry_after_max を超えるときは None（再試行しない）"""
+        retry_after = response.headers.get("Retry-After") if response is not None else None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = 0.0
+            delay = max(delay, 0.0)
+            return delay if delay <= self.retry_after_max else None
+        # フルジッター: 同時に失敗したリクエストが同じ瞬間に再送しないようにする
+        return random.uniform(0, min(self.retry_backoff_max, self.retry_backoff * 2 ** attempt))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        timeout: Optional[float] = None,
+        retry: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """リクエストを送り、レスポンスを返す（ステータスの確認は呼び出し側で行う）
+
+        timeout: この呼び出しだけのタイムアウト秒数（省略時は SUPABASE_TIMEOUT）
+        retry: 再試行するか（省略時は冪等なメソッドのみ）
+        kwargs: params / json / headers など httpx.AsyncClient.request の引数
+        """
+        method = method.upper()
+        if retry is None:
+            retry = method in IDEMPOTENT_METHODS
+        if timeout is not None:
+            kwargs["timeout"] = httpx.Timeout(timeout, connect=min(timeout, self.timeout.connect))
+        metrics = self._metrics.setdefault(path.strip("/").split("/", 1)[0] or "root", ServiceMetrics())
+        client = self._get_client()
+
+        attempt = 0
+        while True:
+            response: Optional[httpx.Response] = None
+            error: Optional[httpx.TransportError] = None
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+            except httpx.TransportError as exc:
+                error = exc
+            failed = error is not None or response.status_code >= 500
+            metrics.observe((time.perf_counter() - start) * 1000, failed)
+
+            retryable = error is not None or response.status_code in RETRY_STATUS_CODES
+            delay = self._backoff(attempt, response) if retry and retryable and attempt < self.max_retries else None
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+
+            attempt += 1
+            metrics.retries += 1
+            logger.info(
+                "Retrying %s %s in %.2fs (attempt %d/%d): %s",
+                method, path, delay, attempt, self.max_retries,
+                error or f"HTTP {response.status_code}",
+            )
+            if response is not None:
+                await response.aclose()
+            await asyncio.sleep(delay)
+
+    async def select(self, table: str, params: Optional[dict] = None, *, timeout: Optional[float] = None) -> list:
+        """PostgREST でテーブルを検索（params は select / order / limit / 列=eq.値 など）"""
+        response = await self.request("GET", f"/rest/v1/{table}", params=params, timeout=timeout)
+        response.raise_for_status()
+        return response.json()
+
+    async def rpc(self, function: str, payload: Optional[dict] = None, *, timeout: Optional[float] = None) -> Any:
+        """PostgREST で SQL 関数を呼び出す（POST なので再試行しない）"""
+        response = await self.request("POST", f"/rest/v1/rpc/{function}", json=payload or {}, timeout=timeout)
+        response.raise_for_status()
+        return response.json() if response.content else None
+
+    def stats(self) -> dict:
+        """接続プールの設定とサービスごとのリクエスト数・レイテンシ"""
+        return {
+            "connected": self._client is not None and not self._client.is_closed,
+            "http2": self.http2,
+            "max_connections": self.limits.max_connections,
+            "services": {name: metrics.snapshot() for name, metrics in self._metrics.items()},
+        }
+
+supabase = SupabaseClient(
+    settings.SUPABASE_URL,
+    settings.SUPABASE_KEY,
+    timeout=settings.SUPABASE_TIMEOUT,
+    connect_timeout=settings.SUPABASE_CONNECT_TIMEOUT,
+    max_connections=settings.SUPABASE_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.SUPABASE_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry=settings.SUPABASE_KEEPALIVE_EXPIRY,
+    http2=settings.SUPABASE_HTTP2,
+    max_retries=settings.SUPABASE_MAX_RETRIES,
+    retry_backoff=settings.SUPABASE_RETRY_BACKOFF,
+    retry_after_max=settings.SUPABASE_RETRY_AFTER_MAX,
+)
+
+def get_supabase_client() -> SupabaseClient:
+    """Supabaseクライアントを取得（プロセス内で共有）"""
+    return supabase
@@ -1,12 +1,29 @@
-from fastapi import FastAPI
+import secrets
+from contextlib import asynccontextmanager
+from typing import Optional
+from fastapi import Depends, FastAPI, Header, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
+from app.core.database import engine
+from app.core.query_counter import StatementCounterMiddleware
+from app.core.security import password_hasher
+from app.core.supabase import supabase
 from app.api.routes import auth, users, posts
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """起動・終了処理"""
+    await supabase.start()
+    yield
+    await supabase.aclose()
+    password_hasher.shutdown()
+    await engine.dispose()
+
 app = FastAPI(
     title="Next.js + FastAPI + Supabase API",
     description="Full-stack application with Supabase authentication",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS設定
@@ -16,8 +33,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 投稿一覧の次ページカーソルをブラウザから読めるようにする
+    expose_headers=["X-Next-Cursor"],
 )
 
+# リクエストごとの SQL 文の数を数える（QUERY_COUNTER_MODE が off 以外のとき）
+app.add_middleware(StatementCounterMiddleware, default_budget=settings.QUERY_COUNTER_DEFAULT_BUDGET)
+
 # ルーターを登録
 app.include_router(auth.router, prefix="/api/auth", tags=["auth"])
 app.include_router(users.router, prefix="/api/users", tags=["users"])
@@ -36,5 +58,16 @@ async def health_check():
     return {
         "status": "healthy",
         "database": "connected",
-        "supabase": "connected"
     }
+
+def require_metrics_token(authorization: Optional[str] = Header(None)) -> None:
+    """METRICS_TOKEN を Bearer トークンとして持つリクエストだけ通す（未設定なら 404）"""
+    if not settings.METRICS_TOKEN:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if not secrets.compare_digest(authorization or "", f"Bearer {settings.METRICS_TOKEN}"):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid metrics token")
+
+@app.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """運用向けの内部メトリクス（Supabase クライアントの接続プールとレイテンシ）"""
+    return {"supabase": supabase.stats()}
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, Boolean, DateTime, ForeignKey, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Computed, String, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 from sqlalchemy.sql import func
 from app.core.database import Base
 import uuid
@@ -14,7 +15,15 @@ class User(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
-    posts = relationship("Post", back_populates="author", cascade="all, delete-orphan")
+    # 読み込みは app.core.loading のポリシーで明示する（暗黙の遅延ロードは例外）。
+    # 削除時は DB の ON DELETE CASCADE に任せ、投稿を 1 件ずつ読み込んで消さない
+    posts = relationship(
+        "Post",
+        back_populates="author",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise_on_sql",
+    )
 
 class Post(Base):
     __tablename__ = "posts"
@@ -26,5 +35,18 @@ class Post(Base):
     author_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # 全文検索用。DB の生成列なので書き込み時に自動更新される（migrations/002_post_search.sql）。
+    # 検索条件でのみ使い、通常の SELECT では読み込まない
+    search_vector = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        raiseload=True,
+    )
     
-    author = relationship("User", back_populates="posts")
+    author = relationship("User", back_populates="posts", lazy="raise_on_sql")
@@ -44,3 +44,14 @@ class PostResponse(PostBase):
     
     class Config:
         from_attributes = True
+
+class AuthorResponse(BaseModel):
+    id: str
+    username: str
+    
+    class Config:
+        from_attributes = True
+
+class PostDetailResponse(PostResponse):
+    """作成者付きの投稿（POST_WITH_AUTHOR で読み込んだ Post から生成）"""
+    author: AuthorResponse
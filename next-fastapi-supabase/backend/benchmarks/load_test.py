@@ -0,0 +1,79 @@
+"""負荷テスト: 起動中の API に同時リクエストを送り RPS とレイテンシを計測する
+
+同期セッション版（変更前のコミット）と AsyncSession 版で同じコマンドを実行し、
+出力を比較する。DB 呼び出しがイベントループを止めていると、同時接続数を
+増やしても RPS が伸びず p99 だけが悪化する。
+
+使い方:
+    uvicorn app.main:app --port 8000 --workers 1
+    python -m benchmarks.load_test --url http://localhost:8000 \\
+        --path /api/posts/?limit=20 --path /api/users/?limit=20 \\
+        --concurrency 64 --duration 20
+"""
+
+import argparse
+import asyncio
+import itertools
+import statistics
+import time
+
+import httpx
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def worker(
+    client: httpx.AsyncClient,
+    paths: "itertools.cycle[str]",
+    deadline: float,
+    latencies: list[float],
+    errors: list[int],
+) -> None:
+    """締め切りまでリクエストを送り続け、レイテンシ（ms）を記録する"""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(next(paths))
+            failed = response.status_code >= 500
+        except httpx.HTTPError:
+            failed = True
+        latencies.append((time.perf_counter() - start) * 1000)
+        if failed:
+            errors.append(1)
+
+
+async def run(url: str, paths: list[str], concurrency: int, duration: float) -> None:
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=30.0) as client:
+        # ウォームアップ（接続確立・プール作成）
+        await asyncio.gather(*(client.get(path) for path in paths))
+
+        latencies: list[float] = []
+        errors: list[int] = []
+        cycle = itertools.cycle(paths)
+        started = time.perf_counter()
+        deadline = started + duration
+        await asyncio.gather(
+            *(worker(client, cycle, deadline, latencies, errors) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - started
+
+    print(f"{'requests':<12} {len(latencies)}")
+    print(f"{'errors':<12} {len(errors)}")
+    print(f"{'rps':<12} {len(latencies) / elapsed:.1f}")
+    print(f"{'mean ms':<12} {statistics.fmean(latencies):.2f}")
+    for pct in (50, 95, 99):
+        print(f"{f'p{pct} ms':<12} {percentile(latencies, pct):.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default="http://localhost:8000")
+    parser.add_argument("--path", action="append", dest="paths", help="繰り返し可")
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=20.0, help="計測秒数")
+    args = parser.parse_args()
+    asyncio.run(run(args.url, args.paths or ["/api/posts/?limit=20"], args.concurrency, args.duration))
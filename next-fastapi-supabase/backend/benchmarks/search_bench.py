@@ -0,0 +1,136 @@
+"""投稿検索ベンチマーク: GET /api/posts/ と同じ SELECT を直接 DB に発行してレイテンシを計測する
+
+--seed で架空の投稿を generate_series で投入できる（単語は w1, w2, ... で、番号が小さいほど
+多くの投稿に出現する）。migrations/002_post_search.sql を適用済みの DB で実行すること。
+
+使い方:
+    python -m benchmarks.search_bench --seed 10000000   # 投入（時間がかかる）
+    python -m benchmarks.search_bench --runs 50 --explain
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import text
+
+from app.core.database import AsyncSessionLocal, engine
+from app.core.loading import POST_WITH_AUTHOR
+from app.core.post_search import PostFilters, build_posts_query, paginate
+
+# 単語 w<n> の n を log 一様に選ぶ（n=1 が最頻出、VOCABULARY まで）
+VOCABULARY = 5000
+SEED_BATCH = 500_000
+SEED_SQL = """
+INSERT INTO posts (id, title, content, published, author_id, created_at, updated_at)
+SELECT
+    gen_random_uuid()::text,
+    (SELECT string_agg('w' || floor(exp(random() * ln(:vocabulary)))::int, ' ') FROM generate_series(1, 3 + 0 * g)),
+    (SELECT string_agg('w' || floor(exp(random() * ln(:vocabulary)))::int, ' ') FROM generate_series(1, 20 + 0 * g)),
+    random() < 0.8,
+    authors.ids[1 + g % array_length(authors.ids, 1)],
+    -- 実運用と同じく作成日時順に物理配置される（created_at と挿入順が相関する）
+    now() - interval '365 days' * (1 - (:offset + g)::float / :total),
+    now()
+FROM generate_series(1, :count) AS g,
+     (SELECT array_agg(id) AS ids FROM users) AS authors
+"""
+
+
+async def seed(total: int) -> None:
+    """架空の投稿を SEED_BATCH 件ずつ投入して ANALYZE する"""
+    async with engine.begin() as conn:
+        if not await conn.scalar(text("SELECT count(*) FROM users")):
+            raise SystemExit("users テーブルが空です。先にユーザーを作成してください")
+    inserted = 0
+    while inserted < total:
+        count = min(SEED_BATCH, total - inserted)
+        started = time.perf_counter()
+        async with engine.begin() as conn:
+            await conn.execute(text(SEED_SQL), {"count": count, "offset": inserted, "total": total, "vocabulary": VOCABULARY})
+        inserted += count
+        print(f"inserted {inserted}/{total} ({time.perf_counter() - started:.1f}s)")
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("VACUUM ANALYZE posts"))
+
+
+async def scenarios() -> list[tuple[str, PostFilters, str]]:
+    """計測するクエリ（ルートと同じ絞り込み・並び順の組み合わせ）"""
+    async with AsyncSessionLocal() as db:
+        author_id = await db.scalar(text("SELECT author_id FROM posts LIMIT 1"))
+    last_month = datetime.now(timezone.utc) - timedelta(days=30)
+    return [
+        ("newest", PostFilters(), "-created_at"),
+        ("published newest", PostFilters(published=True), "-created_at"),
+        ("author newest", PostFilters(author_id=str(author_id)), "-created_at"),
+        ("last 30 days oldest", PostFilters(created_after=last_month), "created_at"),
+        ("title", PostFilters(), "title"),
+        ("search rare newest", PostFilters(q=f"w{VOCABULARY - 1}"), "-created_at"),
+        ("search rare relevance", PostFilters(q=f"w{VOCABULARY - 1}"), "relevance"),
+        ("search phrase relevance", PostFilters(q="w40 w41"), "relevance"),
+        ("search common newest", PostFilters(q="w7"), "-created_at"),
+        ("search common relevance", PostFilters(q="w7"), "relevance"),
+    ]
+
+
+async def measure(filters: PostFilters, sort: str, limit: int, runs: int, explain: bool) -> tuple[list[float], list[float]]:
+    """1 ページ目と（あれば）2 ページ目のレイテンシ（ms）を runs 回ずつ計測"""
+    first: list[float] = []
+    second: list[float] = []
+    async with AsyncSessionLocal() as db:
+        statement = POST_WITH_AUTHOR.apply(build_posts_query(filters, sort, limit))
+        if explain:
+            plan = await db.execute(text("EXPLAIN (ANALYZE, BUFFERS) " + str(
+                statement.compile(engine.sync_engine, compile_kwargs={"literal_binds": True})
+            )))
+            print("\n".join(f"    {line}" for line, in plan))
+        cursor = None
+        for _ in range(runs):
+            started = time.perf_counter()
+            _, cursor = paginate((await db.execute(statement)).all(), sort, limit)
+            first.append((time.perf_counter() - started) * 1000)
+        if cursor is not None:
+            statement = POST_WITH_AUTHOR.apply(build_posts_query(filters, sort, limit, cursor))
+            for _ in range(runs):
+                started = time.perf_counter()
+                (await db.execute(statement)).all()
+                second.append((time.perf_counter() - started) * 1000)
+    return first, second
+
+
+def summary(samples: list[float]) -> str:
+    if not samples:
+        return f"{'-':>8} {'-':>8}"
+    ordered = sorted(samples)
+    return f"{statistics.median(ordered):8.2f} {ordered[int(len(ordered) * 0.95) - 1]:8.2f}"
+
+
+async def run(limit: int, runs: int, explain: bool) -> None:
+    async with AsyncSessionLocal() as db:
+        total = await db.scalar(text("SELECT reltuples::bigint FROM pg_class WHERE relname = 'posts'"))
+    print(f"posts ~{total}, limit {limit}, {runs} runs")
+    print(f"{'query':<26} {'p50 ms':>8} {'p95 ms':>8} {'next p50':>8} {'next p95':>8}")
+    for name, filters, sort in await scenarios():
+        if explain:
+            print(f"{name}:")
+        first, second = await measure(filters, sort, limit, runs, explain)
+        print(f"{name:<26} {summary(first)} {summary(second)}")
+    await engine.dispose()
+
+
+async def main(args: argparse.Namespace) -> None:
+    if args.seed:
+        await seed(args.seed)
+    await run(args.limit, args.runs, args.explain)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seed", type=int, default=0, help="投入する投稿数")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--explain", action="store_true", help="EXPLAIN ANALYZE を表示")
+    asyncio.run(main(parser.parse_args()))
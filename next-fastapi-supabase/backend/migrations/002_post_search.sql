@@ -0,0 +1,16 @@
+-- Full-text search column for posts (generated, so it is kept up to date on every write)
+ALTER TABLE posts
+    ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A') ||
+        setweight(to_tsvector('simple'::regconfig, coalesce(content, '')), 'B')
+    ) STORED;
+
+-- Create indexes
+-- On a populated table, run these with CREATE INDEX CONCURRENTLY instead
+CREATE INDEX IF NOT EXISTS idx_posts_search_vector ON posts USING GIN (search_vector);
+-- Keyset pagination: (sort key, id) for every whitelisted sort and filter combination
+CREATE INDEX IF NOT EXISTS idx_posts_created_at_id ON posts(created_at, id);
+CREATE INDEX IF NOT EXISTS idx_posts_author_created_at_id ON posts(author_id, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_posts_published_created_at_id ON posts(published, created_at, id);
+CREATE INDEX IF NOT EXISTS idx_posts_title_id ON posts(title, id);
@@ -0,0 +1,123 @@
+"""キーセットページングのカーソルとクエリ組み立てのテスト（DB 不要）"""
+
+import base64
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.core.post_search import PostFilters, build_posts_query, cursor_position, paginate
+
+
+def raw_cursor(payload) -> str:
+    """クライアントが書き換えたカーソルを再現する"""
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+
+
+def compile_sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+CREATED = datetime(2026, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+class TestCursor:
+    def test_round_trip(self):
+        cursor = encode_cursor("-created_at", [CREATED, "p1"])
+
+        assert decode_cursor(cursor, "-created_at") == [CREATED.isoformat(), "p1"]
+        assert cursor_position(cursor, "-created_at") == (CREATED, "p1")
+
+    def test_relevance_round_trip(self):
+        cursor = encode_cursor("relevance", [0.25, "p1"])
+
+        assert cursor_position(cursor, "relevance") == (0.25, "p1")
+
+    def test_other_sort_rejected(self):
+        cursor = encode_cursor("title", ["a", "p1"])
+
+        with pytest.raises(InvalidCursorError):
+            decode_cursor(cursor, "-title")
+
+    @pytest.mark.parametrize("cursor", ["!!!", raw_cursor("x"), raw_cursor(["title"]), raw_cursor(["title", "a"])])
+    def test_malformed(self, cursor):
+        with pytest.raises(InvalidCursorError):
+            cursor_position(cursor, "title")
+
+    @pytest.mark.parametrize(
+        "sort, values",
+        [
+            ("-created_at", [1, "x"]),
+            ("-created_at", ["not a date", "x"]),
+            ("-created_at", [CREATED.isoformat(), 1]),
+            ("-created_at", [CREATED.isoformat()]),
+            ("title", [None, "x"]),
+            ("title", ["a", "x", "extra"]),
+            ("relevance", ["0.5", "x"]),
+            ("relevance", [True, "x"]),
+        ],
+    )
+    def test_tampered_values(self, sort, values):
+        with pytest.raises(InvalidCursorError):
+            cursor_position(raw_cursor([sort, values]), sort)
+
+
+class TestBuildPostsQuery:
+    def test_fetches_one_extra_row(self):
+        sql = compile_sql(build_posts_query(PostFilters(), "-created_at", 20))
+
+        assert "LIMIT 21" in sql
+        assert "ORDER BY posts.created_at DESC, posts.id DESC" in sql
+
+    def test_cursor_bounds_follow_direction(self):
+        descending = build_posts_query(PostFilters(), "-title", 10, encode_cursor("-title", ["m", "p1"]))
+        ascending = build_posts_query(PostFilters(), "title", 10, encode_cursor("title", ["m", "p1"]))
+
+        assert "(posts.title, posts.id) < ('m', 'p1')" in compile_sql(descending)
+        assert "(posts.title, posts.id) > ('m', 'p1')" in compile_sql(ascending)
+
+    def test_relevance_requires_q(self):
+        with pytest.raises(ValueError):
+            build_posts_query(PostFilters(), "relevance", 10)
+
+    def test_relevance_candidates_bounded(self):
+        # REGCONFIG はリテラル化できないのでバインド値で確認する
+        compiled = build_posts_query(PostFilters(q="fastapi"), "relevance", 10, relevance_candidates=500).compile(
+            dialect=postgresql.dialect()
+        )
+
+        assert "posts.id IN (SELECT posts.id" in str(compiled)
+        assert sorted(value for value in compiled.params.values() if isinstance(value, int)) == [11, 500]
+
+    def test_relevance_candidates_unbounded(self):
+        compiled = build_posts_query(PostFilters(q="fastapi"), "relevance", 10, relevance_candidates=0).compile(
+            dialect=postgresql.dialect()
+        )
+
+        assert "posts.id IN" not in str(compiled)
+        assert "ts_rank_cd" in str(compiled)
+
+    def test_tampered_cursor(self):
+        with pytest.raises(InvalidCursorError):
+            build_posts_query(PostFilters(), "-created_at", 10, raw_cursor(["-created_at", [1, "x"]]))
+
+
+class TestPaginate:
+    @staticmethod
+    def rows(count):
+        return [(SimpleNamespace(id=f"p{i}", title=f"t{i}"),) for i in range(count)]
+
+    def test_last_page_has_no_cursor(self):
+        posts, cursor = paginate(self.rows(3), "title", 3)
+
+        assert len(posts) == 3
+        assert cursor is None
+
+    def test_cursor_points_at_last_returned_row(self):
+        posts, cursor = paginate(self.rows(4), "title", 3)
+
+        assert [post.id for post in posts] == ["p0", "p1", "p2"]
+        assert cursor_position(cursor, "title") == ("t2", "p2")
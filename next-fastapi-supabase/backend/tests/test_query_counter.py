@@ -0,0 +1,120 @@
+"""N+1 検出（StatementCounterMiddleware）と読み込みポリシーのテスト"""
+
+import logging
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import lazyload
+from sqlalchemy.pool import StaticPool
+
+from app.core.config import settings
+from app.core.loading import POST_WITH_AUTHOR
+from app.core.query_counter import (
+    StatementBudgetExceeded,
+    StatementCounterMiddleware,
+    install_statement_counter,
+    statement_budget,
+)
+from app.models.models import Post
+
+pytest.importorskip("aiosqlite")
+
+# Post.search_vector（PostgreSQL の生成列）は通常の SELECT に含まれないので省く
+SCHEMA = [
+    "CREATE TABLE users (id TEXT PRIMARY KEY, email TEXT, username TEXT, hashed_password TEXT,"
+    " created_at TIMESTAMP, updated_at TIMESTAMP)",
+    "CREATE TABLE posts (id TEXT PRIMARY KEY, title TEXT, content TEXT, published BOOLEAN,"
+    " author_id TEXT REFERENCES users (id), created_at TIMESTAMP, updated_at TIMESTAMP)",
+]
+
+
+@pytest_asyncio.fixture
+async def session_factory():
+    """作成者の異なる投稿 3 件を入れたインメモリ SQLite"""
+    engine = create_async_engine("sqlite+aiosqlite://", poolclass=StaticPool)
+    install_statement_counter(engine)
+    async with engine.begin() as conn:
+        for statement in SCHEMA:
+            await conn.execute(text(statement))
+        for i in range(3):
+            await conn.execute(
+                text("INSERT INTO users (id, email, username, hashed_password) VALUES (:id, :email, :name, 'x')"),
+                {"id": f"u{i}", "email": f"u{i}@example.com", "name": f"user{i}"},
+            )
+            await conn.execute(
+                text("INSERT INTO posts (id, title, published, author_id) VALUES (:id, 'title', 1, :author)"),
+                {"id": f"p{i}", "author": f"u{i}"},
+            )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def build_app(session_factory) -> StatementCounterMiddleware:
+    """投稿と作成者名を返すルートを、遅延ロード版と POST_WITH_AUTHOR 版で用意する"""
+    app = FastAPI()
+
+    async def get_session():
+        async with session_factory() as db:
+            yield db
+
+    @app.get("/lazy", dependencies=[Depends(statement_budget(1))])
+    async def lazy(db=Depends(get_session)):
+        # lazy="raise_on_sql" を上書きして、作成者を 1 件ずつ遅延ロードする（N+1）
+        posts = (await db.execute(select(Post).options(lazyload(Post.author)))).scalars().all()
+        return await db.run_sync(lambda _: [post.author.username for post in posts])
+
+    @app.get("/eager", dependencies=[Depends(statement_budget(1))])
+    async def eager(db=Depends(get_session)):
+        posts = (await db.execute(POST_WITH_AUTHOR.apply(select(Post)))).scalars().all()
+        return [post.author.username for post in posts]
+
+    return StatementCounterMiddleware(app, default_budget=10)
+
+
+def client(app) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_raise_mode_catches_lazy_loading(session_factory, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "QUERY_COUNTER_MODE", "raise")
+    caplog.set_level(logging.WARNING, logger="app.query_counter")
+
+    async with client(build_app(session_factory)) as c:
+        with pytest.raises(StatementBudgetExceeded, match=r"GET /lazy executed 2 SQL statements \(budget 1\)"):
+            await c.get("/lazy")
+
+    # 送出前に 1 回だけ記録する（ミドルウェアでは重ねて記録しない）
+    assert len(caplog.records) == 1
+
+
+@pytest.mark.asyncio
+async def test_log_mode_reports_lazy_loading(session_factory, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "QUERY_COUNTER_MODE", "log")
+    caplog.set_level(logging.WARNING, logger="app.query_counter")
+
+    async with client(build_app(session_factory)) as c:
+        response = await c.get("/lazy")
+
+    assert response.json() == ["user0", "user1", "user2"]
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "executed 4 SQL statements (budget 1)" in message
+    assert "most repeated (3x): SELECT users.id" in message
+
+
+@pytest.mark.asyncio
+async def test_eager_loading_policy_stays_within_budget(session_factory, monkeypatch, caplog):
+    monkeypatch.setattr(settings, "QUERY_COUNTER_MODE", "raise")
+    caplog.set_level(logging.WARNING, logger="app.query_counter")
+
+    async with client(build_app(session_factory)) as c:
+        response = await c.get("/eager")
+
+    assert response.status_code == 200
+    assert sorted(response.json()) == ["user0", "user1", "user2"]
+    assert caplog.records == []
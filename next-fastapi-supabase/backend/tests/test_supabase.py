@@ -0,0 +1,174 @@
+"""Supabase クライアントの再試行・バックオフ・メトリクスのテスト（httpx.MockTransport を使う）"""
+
+import email.utils
+import time
+
+import httpx
+import pytest
+
+from app.core import supabase as supabase_module
+from app.core.config import settings
+from app.core.supabase import ServiceMetrics, SupabaseClient
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """asyncio.sleep を待たずに待ち秒数だけ記録する"""
+    delays = []
+
+    async def fake_sleep(delay):
+        delays.append(delay)
+
+    monkeypatch.setattr(supabase_module.asyncio, "sleep", fake_sleep)
+    return delays
+
+
+def make_client(responses, **kwargs):
+    """responses を順に返す MockTransport 付きのクライアント（送ったリクエストも記録）"""
+    sent = []
+    queue = list(responses)
+
+    def handler(request):
+        sent.append(request)
+        result = queue.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    kwargs.setdefault("http2", False)
+    client = SupabaseClient("https://example.supabase.co", "key", transport=httpx.MockTransport(handler), **kwargs)
+    return client, sent
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors(sleeps):
+    client, sent = make_client([
+        httpx.ConnectError("refused"),
+        httpx.Response(503),
+        httpx.Response(200, json=[{"id": 1}]),
+    ])
+
+    assert await client.select("posts") == [{"id": 1}]
+    assert len(sent) == 3
+    assert sent[0].headers["apikey"] == "key"
+    assert client.stats()["services"]["rest"]["retries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(sleeps):
+    client, sent = make_client([httpx.Response(503)] * 3, max_retries=2)
+
+    response = await client.request("GET", "/rest/v1/posts")
+
+    assert response.status_code == 503
+    assert len(sent) == 3
+    assert client.stats()["services"]["rest"]["errors"] == 3
+
+
+@pytest.mark.asyncio
+async def test_transport_error_raised_after_retries(sleeps):
+    client, sent = make_client([httpx.ConnectError("refused")] * 2, max_retries=1)
+
+    with pytest.raises(httpx.ConnectError):
+        await client.request("GET", "/rest/v1/posts")
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_post_not_retried_by_default(sleeps):
+    client, sent = make_client([httpx.Response(503)])
+
+    response = await client.request("POST", "/rest/v1/rpc/touch")
+
+    assert response.status_code == 503
+    assert len(sent) == 1
+    assert sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_backoff_is_jittered_and_capped(sleeps):
+    client, _ = make_client([httpx.Response(502)] * 6, max_retries=5, retry_backoff=0.5, retry_backoff_max=1.0)
+
+    await client.request("GET", "/rest/v1/posts")
+
+    assert len(sleeps) == 5
+    for attempt, delay in enumerate(sleeps):
+        assert 0 <= delay <= min(1.0, 0.5 * 2 ** attempt)
+
+
+@pytest.mark.asyncio
+async def test_retry_after_seconds_honoured_beyond_backoff_max(sleeps):
+    client, sent = make_client(
+        [httpx.Response(429, headers={"Retry-After": "5"}), httpx.Response(200, json=[])],
+        retry_backoff_max=2.0,
+    )
+
+    await client.select("posts")
+
+    assert sleeps == [5.0]
+    assert len(sent) == 2
+
+
+@pytest.mark.asyncio
+async def test_retry_after_http_date(sleeps):
+    retry_at = email.utils.formatdate(time.time() + 10, usegmt=True)
+    client, _ = make_client([httpx.Response(503, headers={"Retry-After": retry_at}), httpx.Response(200, json=[])])
+
+    await client.select("posts")
+
+    assert 8 <= sleeps[0] <= 10
+
+
+@pytest.mark.asyncio
+async def test_retry_after_above_ceiling_returns_response(sleeps):
+    client, sent = make_client([httpx.Response(429, headers={"Retry-After": "120"})], retry_after_max=30.0)
+
+    response = await client.request("GET", "/rest/v1/posts")
+
+    assert response.status_code == 429
+    assert len(sent) == 1
+    assert sleeps == []
+
+
+def test_latency_percentiles():
+    metrics = ServiceMetrics()
+    for latency in range(1, 101):
+        metrics.observe(float(latency), failed=latency > 98)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["requests"] == 100
+    assert snapshot["errors"] == 2
+    assert snapshot["avg_ms"] == 50.5
+    assert (snapshot["p50_ms"], snapshot["p95_ms"], snapshot["p99_ms"]) == (51.0, 96.0, 100.0)
+
+
+def test_empty_metrics():
+    assert ServiceMetrics().snapshot()["p99_ms"] == 0.0
+
+
+class TestMetricsEndpoint:
+    @pytest.fixture
+    def client(self):
+        from fastapi.testclient import TestClient
+
+        from app.main import app
+
+        return TestClient(app)
+
+    def test_health_has_no_client_stats(self, client):
+        assert "supabase" not in client.get("/health").json()
+
+    def test_disabled_without_token(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "")
+
+        assert client.get("/metrics").status_code == 404
+
+    def test_requires_token(self, client, monkeypatch):
+        monkeypatch.setattr(settings, "METRICS_TOKEN", "s3cret")
+
+        assert client.get("/metrics").status_code == 401
+        assert client.get("/metrics", headers={"Authorization": "Bearer wrong"}).status_code == 401
+        response = client.get("/metrics", headers={"Authorization": "Bearer s3cret"})
+        assert response.status_code == 200
+        assert "services" in response.json()["supabase"]
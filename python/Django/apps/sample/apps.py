@@ -33,3 +33,7 @@ class SampleConfig(AppConfig):
     name = 'apps.sample'
     label = 'sample'  # This sets the app_label to 'sample' for model references
     verbose_name = 'Sample'
+
+    def ready(self):
+        # モデル変更時に API レスポンスのキャッシュを無効化する
+        from . import signals  # noqa: F401
@@ -0,0 +1,147 @@
+import asyncio
+import math
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from ...models import Category, Sample
+
+
+async def fetch(reader, writer, host, path):
+    """keep-alive の接続で GET を 1 回送り、ステータスコードを返します。"""
+    writer.write(f'GET {path} HTTP/1.1\r\nHost: {host}\r\nAccept: application/json\r\n\r\n'.encode())
+    await writer.drain()
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionError('connection closed')
+    length = 0
+    while (line := await reader.readline()) not in (b'\r\n', b''):
+        name, _, value = line.decode('latin-1').partition(':')
+        if name.lower() == 'content-length':
+            length = int(value)
+    await reader.readexactly(length)
+    return int(status_line.split()[1])
+
+
+async def load(host, port, path, concurrency, duration):
+    """concurrency 本の接続から duration 秒間リクエストを送り続けます。"""
+    latencies = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        nonlocal errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    status = await fetch(reader, writer, host, path)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    errors += 1
+                    writer.close()
+                    reader, writer = await asyncio.open_connection(host, port)
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+                errors += status != 200
+        finally:
+            writer.close()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors
+
+
+class Command(BaseCommand):
+    """
+    uvicorn で起動した API のスループットとレイテンシを同時接続数ごとに計測します。
+
+    レスポンスキャッシュ（API_CACHE_ENABLED）を無効にしたサーバーを起動し、
+    一覧・詳細・著者別・検索・カテゴリ一覧のエンドポイントに負荷をかけます。
+
+    使い方:
+        python manage.py asgi_bench
+        python manage.py asgi_bench --concurrency 1 16 64 256 --duration 10
+        python manage.py asgi_bench --url http://localhost:8000   # 起動済みのサーバーを計測
+    """
+
+    help = 'uvicorn 上の API のスループット（req/s）とレイテンシを同時接続数ごとに計測します'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--url', help='計測するサーバー（省略時は uvicorn を起動）')
+        parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32, 128])
+        parser.add_argument('--duration', type=float, default=5.0, help='1 回の計測秒数')
+        parser.add_argument('--threads', type=int, help='起動する uvicorn の ASGI_THREADS（同期処理のスレッド数）')
+
+    def handle(self, *args, **options):
+        sample = Sample.objects.order_by('-created_at').first()
+        category = Category.objects.first()
+        if sample is None:
+            raise CommandError('サンプルがありません。search_bench --seed などで投入してください')
+        paths = [
+            ('list', '/api/sample/samples/?limit=20'),
+            ('retrieve', f'/api/sample/samples/{sample.id}/'),
+            ('by_author', f'/api/sample/samples/by_author/?author_id={sample.author_id}&limit=20'),
+            ('search', f'/api/sample/samples/search/?q={sample.title.split()[0]}'),
+        ]
+        if category is not None:
+            paths.append(('categories', '/api/sample/categories/'))
+
+        server = None
+        if options['url']:
+            url = urlsplit(options['url'])
+            host, port = url.hostname, url.port or 80
+        else:
+            host, port = '127.0.0.1', self.free_port()
+            server = self.start_server(port, options['threads'])
+        try:
+            self.stdout.write(f"{'endpoint':<12} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'errors':>7}")
+            for name, path in paths:
+                for concurrency in options['concurrency']:
+                    latencies, errors = asyncio.run(load(host, port, path, concurrency, options['duration']))
+                    ordered = sorted(latencies) or [0.0]
+                    p99 = ordered[max(0, math.ceil(len(ordered) * 0.99) - 1)]
+                    self.stdout.write(
+                        f'{name:<12} {concurrency:>5} {len(latencies) / options["duration"]:>9.1f} '
+                        f'{statistics.median(ordered):>8.2f} {p99:>8.2f} {errors:>7}'
+                    )
+        finally:
+            if server is not None:
+                server.terminate()
+                server.wait()
+
+    @staticmethod
+    def free_port():
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def start_server(self, port, threads):
+        env = {**os.environ, 'API_CACHE_ENABLED': 'False', 'DEBUG': 'False'}
+        if threads:
+            env['ASGI_THREADS'] = str(threads)
+        server = subprocess.Popen(
+            [
+                sys.executable, '-m', 'uvicorn', settings.ASGI_APPLICATION.rsplit('.', 1)[0] + ':application',
+                '--host', '127.0.0.1', '--port', str(port), '--no-access-log', '--log-level', 'warning',
+            ],
+            cwd=settings.BASE_DIR,
+            env=env,
+        )
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(('127.0.0.1', port), timeout=1).close()
+                return server
+            except OSError:
+                if server.poll() is not None:
+                    raise CommandError('uvicorn の起動に失敗しました')
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError('uvicorn が起動しませんでした')
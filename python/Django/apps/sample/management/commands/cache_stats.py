@@ -0,0 +1,78 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.urls import get_resolver
+
+from core.cache import get_cache, get_versions, invalidate, registered_namespaces, stat_key
+
+
+class Command(BaseCommand):
+    """
+    API レスポンスキャッシュのヒット率を表示します。
+
+    使い方:
+        python manage.py cache_stats
+        python manage.py cache_stats --reset
+        python manage.py cache_stats --invalidate samples
+    """
+
+    help = 'API レスポンスキャッシュの名前空間ごとのバージョン・ヒット数・ミス数を表示します'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reset', action='store_true', help='ヒット数・ミス数を 0 に戻す')
+        parser.add_argument(
+            '--invalidate', nargs='+', metavar='NAMESPACE', default=[],
+            help='指定した名前空間のキャッシュを無効化する',
+        )
+
+    def handle(self, *args, **options):
+        # URLconf を読み込んで @cached_action を付けたビューを登録させる
+        get_resolver().url_patterns
+        namespaces = sorted(registered_namespaces)
+        cache = get_cache()
+
+        if options['invalidate']:
+            invalidate(*options['invalidate'])
+            self.stdout.write(self.style.SUCCESS(f"Invalidated: {', '.join(options['invalidate'])}"))
+        if options['reset']:
+            cache.delete_many([stat_key(namespace, kind) for namespace in namespaces for kind in ('hits', 'misses')])
+            self.stdout.write(self.style.SUCCESS('Counters reset'))
+
+        config = settings.CACHES[settings.API_CACHE_ALIAS]
+        self.stdout.write(f"Backend: {config['BACKEND']} ({config.get('LOCATION') or 'default'})")
+        self.stdout.write(f"Enabled: {settings.API_CACHE_ENABLED}, timeout: {settings.API_CACHE_TIMEOUT}s")
+
+        versions = get_versions(namespaces)
+        counters = cache.get_many([stat_key(namespace, kind) for namespace in namespaces for kind in ('hits', 'misses')])
+        self.stdout.write(f"{'namespace':<12} {'version':>15} {'hits':>8} {'misses':>8} {'hit rate':>8}")
+        for namespace in namespaces:
+            hits = counters.get(stat_key(namespace, 'hits'), 0)
+            misses = counters.get(stat_key(namespace, 'misses'), 0)
+            total = hits + misses
+            rate = f'{hits / total:.1%}' if total else '-'
+            self.stdout.write(f'{namespace:<12} {versions[namespace]:>15} {hits:>8} {misses:>8} {rate:>8}')
+
+        for line in self.backend_info(cache):
+            self.stdout.write(line)
+
+    def backend_info(self, cache):
+        """
+        バックエンド固有の情報（エントリ数・Redis の統計）を返します。
+        """
+        if hasattr(cache, '_cache') and isinstance(cache._cache, dict):
+            # LocMemCache: このプロセスのエントリだけ
+            return [f'Entries (this process): {len(cache._cache)}']
+        client = None
+        if hasattr(cache, '_cache') and hasattr(cache._cache, 'get_client'):
+            client = cache._cache.get_client(write=False)  # django.core.cache.backends.redis
+        elif hasattr(cache, 'client') and hasattr(cache.client, 'get_client'):
+            client = cache.client.get_client(write=False)  # django-redis
+        if client is None:
+            return []
+        stats = client.info('stats')
+        memory = client.info('memory')
+        return [
+            f'Redis keys: {client.dbsize()}',
+            f"Redis keyspace hits/misses: {stats.get('keyspace_hits')}/{stats.get('keyspace_misses')}",
+            f"Redis evicted keys: {stats.get('evicted_keys')}",
+            f"Redis used memory: {memory.get('used_memory_human')}",
+        ]
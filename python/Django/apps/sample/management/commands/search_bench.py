@@ -0,0 +1,117 @@
+import math
+import random
+import statistics
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from ...models import Sample
+from ...repositories.sample_repository import SampleRepository
+from ...service.sample_service import SampleService
+
+# 単語 w<n> の n を log 一様に選ぶ（n が小さいほど多くのサンプルに出現する）
+VOCABULARY = 5000
+SEED_BATCH = 10_000
+BENCH_SLUG_PREFIX = 'bench-'
+
+
+def random_words(rng, count):
+    return ' '.join(f'w{int(math.exp(rng.random() * math.log(VOCABULARY)))}' for _ in range(count))
+
+
+class Command(BaseCommand):
+    """
+    サンプル検索（SampleService.search_samples）のレイテンシを計測します。
+
+    使い方:
+        python manage.py search_bench --seed 1000000   # ベンチマーク用のサンプルを投入
+        python manage.py search_bench --runs 30 --explain
+        python manage.py search_bench --clear          # 投入したサンプルを削除
+    """
+
+    help = 'サンプル検索のレイテンシ（p50 / p95）を計測します'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--seed', type=int, default=0, help='投入するサンプル数')
+        parser.add_argument('--clear', action='store_true', help='投入したサンプルを削除して終了')
+        parser.add_argument('--runs', type=int, default=20)
+        parser.add_argument('--limit', type=int, default=20)
+        parser.add_argument('--explain', action='store_true', help='EXPLAIN ANALYZE を表示（PostgreSQL のみ）')
+
+    def handle(self, *args, **options):
+        if options['clear']:
+            deleted, _ = Sample.objects.filter(slug__startswith=BENCH_SLUG_PREFIX).delete()
+            self.stdout.write(f'Deleted {deleted} rows')
+            return
+        if options['seed']:
+            self.seed(options['seed'])
+
+        self.stdout.write(f'{connection.vendor}, samples: {Sample.objects.count()}, limit {options["limit"]}, {options["runs"]} runs')
+        self.stdout.write(f"{'query':<24} {'p50 ms':>8} {'p95 ms':>8} {'page 6 p50':>10} {'hits':>6}")
+        for name, query in self.scenarios():
+            if options['explain'] and connection.vendor == 'postgresql':
+                self.explain(query, options['limit'])
+            first, hits = self.measure(query, 0, options['limit'], options['runs'])
+            deep, _ = self.measure(query, options['limit'] * 5, options['limit'], options['runs'])
+            self.stdout.write(
+                f'{name:<24} {statistics.median(first):8.2f} {self.p95(first):8.2f} '
+                f'{statistics.median(deep):10.2f} {hits:>6}'
+            )
+
+    def seed(self, total):
+        """w<n> の単語からなるサンプルを SEED_BATCH 件ずつ bulk_create します。"""
+        User = get_user_model()
+        author, _ = User.objects.get_or_create(email='search-bench@example.com')
+        rng = random.Random(0)
+        offset = Sample.objects.filter(slug__startswith=BENCH_SLUG_PREFIX).count()
+        created = 0
+        while created < total:
+            count = min(SEED_BATCH, total - created)
+            started = time.perf_counter()
+            Sample.objects.bulk_create([
+                Sample(
+                    title=random_words(rng, 4),
+                    slug=f'{BENCH_SLUG_PREFIX}{offset + created + i}',
+                    content=random_words(rng, 40),
+                    author=author,
+                    is_published=True,
+                )
+                for i in range(count)
+            ])
+            created += count
+            self.stdout.write(f'created {created}/{total} ({time.perf_counter() - started:.1f}s)')
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute('ANALYZE sample_sample')
+
+    def scenarios(self):
+        return [
+            ('rare word', f'w{VOCABULARY - 1}'),
+            ('common word', 'w3'),
+            ('two words', 'w40 w41'),
+            ('phrase', '"w2 w3"'),
+            ('title substring', f'w{VOCABULARY // 10 - 1}'),
+            ('no match', 'nothing-matches-this'),
+        ]
+
+    def measure(self, query, skip, limit, runs):
+        service = SampleService()
+        timings = []
+        hits = 0
+        for _ in range(runs):
+            started = time.perf_counter()
+            hits = len(service.search_samples(query=query, skip=skip, limit=limit))
+            timings.append((time.perf_counter() - started) * 1000)
+        return timings, hits
+
+    def explain(self, query, limit):
+        queryset = SampleRepository.search(query)[:limit]
+        self.stdout.write(f'{query}:')
+        self.stdout.write(queryset.explain(analyze=True, buffers=True))
+
+    @staticmethod
+    def p95(timings):
+        ordered = sorted(timings)
+        return ordered[max(0, math.ceil(len(ordered) * 0.95) - 1)]
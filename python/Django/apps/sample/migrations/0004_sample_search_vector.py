@@ -0,0 +1,84 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+# search_vector は BEFORE INSERT / UPDATE トリガーで更新する（QuerySet.update や bulk_create でも最新に保たれる）。
+# 設定は apps/sample/repositories/sample_search.py の SEARCH_CONFIG と合わせる。
+CREATE_TRIGGER = """
+CREATE FUNCTION sample_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector :=
+        setweight(to_tsvector('simple', coalesce(NEW.title, '')), 'A') ||
+        setweight(to_tsvector('simple', coalesce(NEW.excerpt, '')), 'B') ||
+        setweight(to_tsvector('simple', coalesce(NEW.content, '')), 'C');
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sample_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF title, excerpt, content ON sample_sample
+    FOR EACH ROW EXECUTE FUNCTION sample_search_vector_update();
+
+UPDATE sample_sample SET title = title;
+"""
+
+DROP_TRIGGER = """
+DROP TRIGGER IF EXISTS sample_search_vector_trigger ON sample_sample;
+DROP FUNCTION IF EXISTS sample_search_vector_update();
+"""
+
+INDEXES = [
+    django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='sample_search_vector_gin'),
+    django.contrib.postgres.indexes.GinIndex(
+        django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'),
+        name='sample_title_trgm_gin',
+    ),
+]
+
+
+def create_search_objects(apps, schema_editor):
+    """トリガーと GIN インデックスは PostgreSQL でのみ作成する（SQLite では部分一致検索になる）"""
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(CREATE_TRIGGER)
+    Sample = apps.get_model('sample', 'Sample')
+    for index in INDEXES:
+        schema_editor.add_index(Sample, index)
+
+
+def drop_search_objects(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    Sample = apps.get_model('sample', 'Sample')
+    for index in INDEXES:
+        schema_editor.remove_index(Sample, index)
+    schema_editor.execute(DROP_TRIGGER)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("sample", "0003_about"),
+    ]
+
+    operations = [
+        # PostgreSQL 以外では何もしない
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="sample",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True, verbose_name="search vector"
+            ),
+        ),
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.AddIndex(model_name="sample", index=index) for index in INDEXES
+            ],
+            database_operations=[
+                migrations.RunPython(create_search_objects, drop_search_objects),
+            ],
+        ),
+    ]
@@ -1,4 +1,7 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models.functions import Upper
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from .category_model import Category
@@ -22,6 +25,7 @@ class Sample(models.Model):
     - likes_count: いいね数。
     - created_at: 作成日時。
     - updated_at: 更新日時。
+    - search_vector: 全文検索用の tsvector（PostgreSQL のトリガーが title / excerpt / content から更新）。
     """
 
     title = models.CharField(_('title'), max_length=255)
@@ -54,6 +58,8 @@ class Sample(models.Model):
     created_at = models.DateTimeField(_('created at'), auto_now_add=True)
     updated_at = models.DateTimeField(_('updated at'), auto_now=True)
 
+    search_vector = SearchVectorField(_('search vector'), null=True, editable=False)
+
     class Meta:
         verbose_name = _('sample')
         verbose_name_plural = _('samples')
@@ -63,6 +69,9 @@ class Sample(models.Model):
             models.Index(fields=['-created_at']),
             models.Index(fields=['is_published', '-published_at']),
             models.Index(fields=['author', '-created_at']),
+            # PostgreSQL のみ作成（migrations/0004_sample_search_vector.py）
+            GinIndex(fields=['search_vector'], name='sample_search_vector_gin'),
+            GinIndex(OpClass(Upper('title'), name='gin_trgm_ops'), name='sample_title_trgm_gin'),
         ]
 
     def __str__(self):
@@ -1,6 +1,20 @@
-from typing import Optional
-from django.db.models import QuerySet, Q
+from collections import defaultdict
+from typing import Dict, Optional
+from django.db.models import F, QuerySet
 from ..models import Sample
+from .sample_search import get_search_backend
+
+# SampleSerializer が出力する列。author / category はネストしたシリアライザ
+# （UserSerializer / CategorySerializer）の列で、同じ SELECT に JOIN して読み込む
+SAMPLE_RELATED = ('author', 'category')
+SAMPLE_FIELDS = (
+    'id', 'title', 'slug', 'content', 'excerpt', 'is_published', 'published_at',
+    'views_count', 'likes_count', 'created_at', 'updated_at',
+    'author__id', 'author__email', 'author__first_name', 'author__last_name',
+    'author__is_active', 'author__is_staff', 'author__date_joined',
+    'category__id', 'category__name', 'category__slug', 'category__description',
+    'category__created_at', 'category__updated_at',
+)
 
 class SampleRepository:
     """
@@ -8,6 +22,24 @@ class SampleRepository:
     データベース操作をカプセル化し、サービス層に提供します。
     """
 
+    @staticmethod
+    def with_relations(queryset: Optional[QuerySet] = None) -> QuerySet:
+        """
+        作成者とカテゴリを JOIN し、SampleSerializer が出力する列だけを読み込みます。
+
+        シリアライズ時に行ごとの追加クエリ（N+1）が発生しないよう、
+        サンプルを返すクエリには必ずこれを適用します。
+
+        パラメータ:
+        - queryset: 対象のクエリセット（省略時はすべてのサンプル）。
+
+        戻り値:
+        - QuerySet: select_related / only を適用したクエリセット。
+        """
+        if queryset is None:
+            queryset = Sample.objects.all()
+        return queryset.select_related(*SAMPLE_RELATED).only(*SAMPLE_FIELDS)
+
     @staticmethod
     def get_all_samples() -> QuerySet:
         """
@@ -81,31 +113,61 @@ class SampleRepository:
         return sample
 
     @staticmethod
-    def increment_views(sample: Sample) -> Sample:
+    def increment_views(sample: Sample, count: int = 1) -> Sample:
         """
         サンプルの閲覧数をインクリメントします。
 
+        `views_count = views_count + count` の UPDATE を発行するため、
+        同時に実行されても加算が失われず、他の列や updated_at も変更しません。
+
         パラメータ:
         - sample: 対象のサンプルオブジェクト。
+        - count: 加算する閲覧数。
 
         戻り値:
         - Sample: 更新されたサンプルオブジェクト。
         """
-        sample.views_count += 1
-        sample.save()
+        Sample.objects.filter(id=sample.id).update(views_count=F('views_count') + count)
+        sample.refresh_from_db(fields=['views_count'])
         return sample
 
+    @staticmethod
+    def add_views(deltas: Dict[int, int]) -> int:
+        """
+        複数のサンプルの閲覧数をまとめて加算します。
+
+        加算する値が同じサンプルを 1 つの UPDATE にまとめます。
+
+        パラメータ:
+        - deltas: サンプルIDと加算する閲覧数の辞書。
+
+        戻り値:
+        - int: 更新された行数。
+        """
+        ids_by_count = defaultdict(list)
+        for sample_id, count in deltas.items():
+            if count:
+                ids_by_count[count].append(sample_id)
+        return sum(
+            Sample.objects.filter(id__in=sample_ids).update(views_count=F('views_count') + count)
+            for count, sample_ids in ids_by_count.items()
+        )
+
     @staticmethod
     def search(query: str) -> QuerySet:
         """
-        クエリ文字列に基づいてサンプルを検索します。
+        クエリ文字列に基づいてサンプルを検索し、関連度の高い順に返します。
+
+        PostgreSQL では全文検索（search_vector）とタイトルのトライグラム検索、
+        それ以外のデータベースでは部分一致で検索します（sample_search.py を参照）。
 
         パラメータ:
-        - query: 検索クエリ文字列。
+        - query: 検索クエリ文字列（"..." でフレーズ、-単語 で除外）。
 
         戻り値:
-        - QuerySet: 一致するサンプルのリスト。
+        - QuerySet: 一致するサンプルのリスト（rank 注釈付き）。空のクエリでは 0 件。
         """
-        return Sample.objects.filter(
-            Q(title__icontains=query) | Q(content__icontains=query)
-        ).select_related('author', 'category').all()
\ No newline at end of file
+        query = query.strip()
+        if not query:
+            return Sample.objects.none()
+        return get_search_backend().search(SampleRepository.with_relations(), query)
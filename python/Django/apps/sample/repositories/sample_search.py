@@ -0,0 +1,64 @@
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank, TrigramSimilarity
+from django.db import connection
+from django.db.models import Case, F, FloatField, Q, QuerySet, Value, When
+
+# 全文検索の設定。search_vector を更新するトリガー（migrations/0004_sample_search_vector.py）と同じものを使う
+SEARCH_CONFIG = 'simple'
+
+
+class PostgresSampleSearch:
+    """
+    PostgreSQL の全文検索でサンプルを検索するバックエンド。
+
+    - 本文などの単語: search_vector（title: A / excerpt: B / content: C の重み付き）を
+      GIN インデックス（sample_search_vector_gin）で検索します。
+    - タイトルの部分一致: UPPER(title) のトライグラム GIN インデックス
+      （sample_title_trgm_gin）で ILIKE '%q%' を検索します。単語に分割されない
+      日本語のタイトルや単語の一部でもヒットします。
+
+    関連度（ts_rank_cd + タイトルとのトライグラム類似度）の高い順に並べます。
+    関連度の計算は一致した行数に比例するため、一致したサンプルのうち新しい
+    SEARCH_RANK_CANDIDATES 件（0 = 無制限）だけを順位付けします。
+    """
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type='websearch')
+        matches = Q(search_vector=search_query) | Q(title__icontains=query)
+        if settings.SEARCH_RANK_CANDIDATES:
+            # 一致する行が多い単語でも created_at のインデックスを新しい順にたどって打ち切れる
+            candidates = queryset.filter(matches).order_by('-created_at', '-id').values('id')
+            matches = Q(id__in=candidates[:settings.SEARCH_RANK_CANDIDATES])
+        return queryset.filter(matches).annotate(
+            rank=SearchRank(F('search_vector'), search_query, cover_density=True)
+            + TrigramSimilarity('title', query),
+        ).order_by('-rank', '-created_at', '-id')
+
+
+class SimpleSampleSearch:
+    """
+    PostgreSQL 以外（テストで使う SQLite など）のためのバックエンド。
+
+    タイトルまたは本文の部分一致で検索し、タイトルに一致したものを先に並べます。
+    インデックスは使えないため、少量のデータ向けです。
+    """
+
+    def search(self, queryset: QuerySet, query: str) -> QuerySet:
+        return queryset.filter(
+            Q(title__icontains=query) | Q(content__icontains=query)
+        ).annotate(
+            rank=Case(
+                When(title__icontains=query, then=Value(1.0)),
+                default=Value(0.0),
+                output_field=FloatField(),
+            ),
+        ).order_by('-rank', '-created_at', '-id')
+
+
+def get_search_backend():
+    """
+    接続中のデータベースに応じた検索バックエンドを返します。
+    """
+    if connection.vendor == 'postgresql':
+        return PostgresSampleSearch()
+    return SimpleSampleSearch()
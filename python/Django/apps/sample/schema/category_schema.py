@@ -17,7 +17,7 @@ class CategoryQuery(graphene.ObjectType):
     def resolve_categories(self, info):
         """全てのカテゴリを取得。"""
         service = CategoryService()
-        return service.get_categories()
+        return service.get_all_categories()
 
     def resolve_category(self, info, id):
         """IDでカテゴリを取得。"""
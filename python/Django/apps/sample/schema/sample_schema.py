@@ -1,7 +1,7 @@
 import graphene
 from graphene_django import DjangoObjectType
 from ..models import Sample
-from ..service.services import SampleService
+from ..service.sample_service import SampleService
 from apps.users.schema import UserType
 from .category_schema import CategoryType
 
@@ -52,6 +52,12 @@ class SampleQuery(graphene.ObjectType):
         skip=graphene.Int(default_value=0),
         limit=graphene.Int(default_value=100)
     )
+    search_samples = graphene.List(
+        SampleType,
+        query=graphene.String(required=True),
+        skip=graphene.Int(default_value=0),
+        limit=graphene.Int(default_value=20)
+    )
 
     def resolve_samples(self, info, skip=0, limit=100, published_only=False):
         """ページネーション付きで全てのサンプルを取得。"""
@@ -73,6 +79,11 @@ class SampleQuery(graphene.ObjectType):
         service = SampleService()
         return service.get_samples_by_author(author_id=author_id, skip=skip, limit=limit)
 
+    def resolve_search_samples(self, info, query, skip=0, limit=20):
+        """全文検索で関連度の高い順にサンプルを取得（limit は最大 100）。"""
+        service = SampleService()
+        return service.search_samples(query=query, skip=skip, limit=min(limit, 100))
+
 class CreateSample(graphene.Mutation):
     """新しいサンプルを作成するミューテーション。"""
     class Arguments:
@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from core.serializers import ValuesSerializer
 from ..models.sample_model import Sample
 from ..models.category_model import Category
 from ..models.sample_model import Sample
@@ -63,6 +64,20 @@ class SampleSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
 
+class SampleValuesSerializer(ValuesSerializer):
+    """
+    SampleSerializer と同じ JSON を .values() の行から生成する読み取り専用シリアライザ。
+
+    一覧・著者別・検索のように件数の多いレスポンスで使用します。
+    モデルインスタンスを生成せず、author / category は JOIN した列から組み立てます。
+
+    使い方:
+        rows = queryset.values(*SampleValuesSerializer.columns())
+        data = SampleValuesSerializer.many(rows)
+    """
+
+    serializer_class = SampleSerializer
+
 class SampleCreateSerializer(serializers.ModelSerializer):
     """
     サンプルモデルの作成操作用シリアライザ。
@@ -15,4 +15,16 @@ class CategoryService:
         """
         IDで特定のカテゴリを取得します。
         """
-        return Category.objects.get(id=category_id)
\ No newline at end of file
+        return Category.objects.get(id=category_id)
+
+    async def aget_all_categories(self):
+        """
+        get_all_categories の非同期版（評価済みのリストを返します）。
+        """
+        return [category async for category in Category.objects.all()]
+
+    async def aget_category(self, category_id):
+        """
+        get_category の非同期版。
+        """
+        return await Category.objects.aget(id=category_id)
@@ -1,4 +1,6 @@
 from ..models.sample_model import Sample
+from ..repositories.sample_repository import SAMPLE_RELATED, SampleRepository
+from .view_counter_service import get_view_counter
 
 class SampleService:
     """
@@ -9,16 +11,79 @@ class SampleService:
         """
         サンプルデータを取得します。
         """
-        queryset = Sample.objects.all()
+        queryset = self.get_samples_queryset(published_only=published_only)
+        return get_view_counter().apply_pending(list(queryset[skip:skip + limit]))
+
+    def get_samples_queryset(self, published_only=False):
+        """
+        一覧用のクエリセットを返します（未評価。ページングはビューのページネーションで行います）。
+        """
+        queryset = SampleRepository.with_relations()
         if published_only:
             queryset = queryset.filter(is_published=True)
-        return queryset[skip:skip + limit]
+        return queryset
+
+    def get_samples_by_author_queryset(self, author_id):
+        """
+        著者で絞り込んだ一覧用のクエリセットを返します。
+        """
+        return SampleRepository.with_relations().filter(author_id=author_id)
+
+    def search_samples_queryset(self, query):
+        """
+        検索結果のクエリセットを関連度の高い順で返します（未評価）。
+        """
+        return SampleRepository.search(query)
 
     def get_sample(self, sample_id):
         """
         IDで特定のサンプルを取得します。
         """
-        return Sample.objects.get(id=sample_id)
+        return get_view_counter().apply_pending(SampleRepository.with_relations().get(id=sample_id))
+
+    def get_samples_by_author(self, author_id, skip=0, limit=100):
+        """
+        著者IDでサンプルを取得します。
+        """
+        queryset = self.get_samples_by_author_queryset(author_id)
+        return get_view_counter().apply_pending(list(queryset[skip:skip + limit]))
+
+    def get_sample_by_slug(self, slug):
+        """
+        スラッグで特定のサンプルを取得します。
+        """
+        return get_view_counter().apply_pending(SampleRepository.with_relations().get(slug=slug))
+
+    def search_samples(self, query, skip=0, limit=20):
+        """
+        サンプルを検索し、関連度の高い順に skip 件目から limit 件を返します。
+        """
+        queryset = SampleRepository.search(query)
+        return get_view_counter().apply_pending(list(queryset[skip:skip + limit]))
+
+    # ------------------------------------------------------------
+    # 非同期版（async ビューから使用）。Django の非同期 ORM で読み込むため、
+    # 呼び出し側のイベントループをブロックしません。
+    # ------------------------------------------------------------
+
+    async def aget_sample(self, sample_id):
+        """
+        get_sample の非同期版。
+        """
+        sample = await SampleRepository.with_relations().aget(id=sample_id)
+        return await get_view_counter().aapply_pending(sample)
+
+    async def aapply_pending(self, samples):
+        """
+        ページネーションで取得したサンプルに、未反映の閲覧数を加算します。
+        """
+        return await get_view_counter().aapply_pending(samples)
+
+    async def aincrement_views(self, sample_id):
+        """
+        increment_views の非同期版。
+        """
+        await get_view_counter().aincrement(sample_id)
 
     def create_sample(self, author_id, **data):
         """
@@ -30,7 +95,7 @@ class SampleService:
         """
         サンプルを更新します。
         """
-        sample = Sample.objects.get(id=sample_id)
+        sample = Sample.objects.select_related(*SAMPLE_RELATED).get(id=sample_id)
         if sample.author_id != user_id and not is_staff:
             raise PermissionError("You do not have permission to update this sample.")
         for key, value in data.items():
@@ -50,7 +115,8 @@ class SampleService:
     def increment_views(self, sample_id):
         """
         サンプルのビュー数を増加させます。
+
+        増分はバッファに貯めるだけで、DB への書き込みは
+        flush_view_counts タスク（Celery beat）でまとめて行います。
         """
-        sample = Sample.objects.get(id=sample_id)
-        sample.views += 1
-        sample.save()
\ No newline at end of file
+        get_view_counter().increment(sample_id)
\ No newline at end of file
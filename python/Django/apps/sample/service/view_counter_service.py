@@ -0,0 +1,253 @@
+import logging
+import threading
+from collections import Counter
+from typing import Dict, Iterable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from ..repositories.sample_repository import SampleRepository
+
+logger = logging.getLogger(__name__)
+
+
+def _sample_id(sample):
+    """モデルインスタンスと .values() の行（dict）のどちらからも ID を取り出します。"""
+    return sample['id'] if isinstance(sample, dict) else sample.id
+
+
+def _add_views(samples, deltas):
+    """views_count に増分を加算します。"""
+    for sample in samples:
+        if isinstance(sample, dict):
+            sample['views_count'] += deltas.get(sample['id'], 0)
+        else:
+            sample.views_count += deltas.get(sample.id, 0)
+
+
+class LocMemViewBuffer:
+    """
+    プロセス内メモリに閲覧数の増分を保持するバッファ。
+
+    プロセスごとに独立しているため、Celery beat からは flush できません。
+    そのため from_settings では使わず、flush を自分で呼ぶテストなどで使います。
+    """
+
+    shared = False
+
+    def __init__(self):
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+
+    def add(self, sample_id: int, count: int) -> None:
+        with self._lock:
+            self._pending[sample_id] += count
+
+    def get_many(self, sample_ids: Iterable[int]) -> Dict[int, int]:
+        with self._lock:
+            return {sample_id: self._pending[sample_id] for sample_id in sample_ids if sample_id in self._pending}
+
+    def drain(self) -> Dict[int, int]:
+        with self._lock:
+            pending, self._pending = self._pending, Counter()
+        return dict(pending)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self, deltas: Dict[int, int]) -> None:
+        with self._lock:
+            self._pending.update(deltas)
+
+
+class RedisViewBuffer:
+    """
+    Redis のハッシュに閲覧数の増分を保持するバッファ。
+
+    すべてのプロセスで共有されるため、Celery beat のタスクから flush できます。
+    flush 中の増分は PROCESSING_KEY に移し、DB 更新が成功してから削除します
+    （失敗した場合は次回の flush で再度書き込みます）。同時に flush できるのは
+    1 プロセスだけです。
+    """
+
+    shared = True
+    PENDING_KEY = 'sample:views:pending'
+    PROCESSING_KEY = 'sample:views:flushing'
+    LOCK_KEY = 'sample:views:flush-lock'
+
+    def __init__(self, url: str, lock_timeout: float = 60):
+        import redis
+
+        self._redis = redis.Redis.from_url(url)
+        self._lock = self._redis.lock(self.LOCK_KEY, timeout=lock_timeout, blocking=False)
+
+    def add(self, sample_id: int, count: int) -> None:
+        self._redis.hincrby(self.PENDING_KEY, sample_id, count)
+
+    def get_many(self, sample_ids: Iterable[int]) -> Dict[int, int]:
+        sample_ids = list(sample_ids)
+        if not sample_ids:
+            return {}
+        pipe = self._redis.pipeline(transaction=False)
+        pipe.hmget(self.PENDING_KEY, sample_ids)
+        pipe.hmget(self.PROCESSING_KEY, sample_ids)
+        pending, processing = pipe.execute()
+        deltas = {}
+        for sample_id, *values in zip(sample_ids, pending, processing):
+            delta = sum(int(value) for value in values if value is not None)
+            if delta:
+                deltas[sample_id] = delta
+        return deltas
+
+    def drain(self) -> Dict[int, int]:
+        if not self._lock.acquire():
+            return {}  # 他のプロセスが flush 中
+        # 前回の flush が失敗して残っている増分があれば、先にそれを書き込む
+        if not self._redis.exists(self.PROCESSING_KEY):
+            if not self._redis.exists(self.PENDING_KEY):
+                return {}
+            # RENAME は原子的なので、これ以降の HINCRBY は新しい PENDING_KEY に入る
+            self._redis.rename(self.PENDING_KEY, self.PROCESSING_KEY)
+        return {
+            int(sample_id): int(count)
+            for sample_id, count in self._redis.hgetall(self.PROCESSING_KEY).items()
+        }
+
+    def commit(self) -> None:
+        self._redis.delete(self.PROCESSING_KEY)
+        self._release()
+
+    def rollback(self, deltas: Dict[int, int]) -> None:
+        self._release()
+
+    def _release(self) -> None:
+        from redis.exceptions import LockError
+
+        try:
+            self._lock.release()
+        except LockError:
+            pass  # 期限切れ、または drain でロックを取れなかった
+
+
+class ViewCounterService:
+    """
+    サンプルの閲覧数を集計するサービスクラス。
+
+    閲覧のたびに行を更新するのではなく、増分をバッファに貯めておき、
+    flush でまとめて `views_count = views_count + n` の UPDATE を発行します。
+    読み取り時は apply_pending でまだ書き込まれていない増分を加算します。
+
+    リクエスト処理中は DB に書き込みません。flush は flush_view_counts タスク
+    （Celery beat）だけが行います。buffer が None のときはバッファリングせず、
+    閲覧ごとに record_views タスクを投入して Celery ワーカーで加算します。
+    """
+
+    def __init__(self, buffer=None):
+        self.buffer = buffer
+
+    @classmethod
+    def from_settings(cls) -> 'ViewCounterService':
+        """
+        VIEW_COUNTER_BACKEND（redis / none）に応じたバッファで作成します。
+
+        プロセス内のバッファは Celery beat から flush できないため、共有できる
+        バッファがない場合（none。以前の名前 locmem も同じ）はバッファリングしません。
+        """
+        backend = settings.VIEW_COUNTER_BACKEND
+        if backend == 'redis':
+            return cls(RedisViewBuffer(settings.VIEW_COUNTER_REDIS_URL))
+        if backend in ('none', 'locmem'):
+            return cls()
+        raise ValueError(f"Unknown VIEW_COUNTER_BACKEND: {backend!r}")
+
+    def increment(self, sample_id: int, count: int = 1) -> None:
+        """
+        閲覧数の増分をバッファに追加します（DB には書き込みません）。
+        """
+        if self.buffer is None:
+            self._enqueue(sample_id, count)
+        else:
+            self.buffer.add(sample_id, count)
+
+    async def aincrement(self, sample_id: int, count: int = 1) -> None:
+        """
+        increment の非同期版。Redis やブローカーへの書き込みはスレッドで実行します。
+        """
+        if self.buffer is not None and not self.buffer.shared:
+            self.buffer.add(sample_id, count)
+            return
+        await sync_to_async(self.increment, thread_sensitive=False)(sample_id, count)
+
+    def _enqueue(self, sample_id: int, count: int) -> None:
+        """
+        record_views タスクを投入します。ブローカーに届かなくてもリクエストは失敗させません。
+        """
+        from ..tasks import record_views
+
+        try:
+            record_views.apply_async((sample_id, count), retry=False)
+        except Exception:
+            logger.warning('Could not enqueue %d view(s) of sample %s', count, sample_id, exc_info=True)
+
+    def pending(self, sample_ids: Iterable[int]) -> Dict[int, int]:
+        """
+        まだ DB に書き込まれていない増分を取得します。
+        """
+        if self.buffer is None:
+            return {}
+        return self.buffer.get_many(sample_ids)
+
+    def apply_pending(self, samples):
+        """
+        サンプル（またはそのリスト）の views_count に未反映の増分を加算して返します。
+        .values() の行（dict）も受け付けます。
+        """
+        items = samples if isinstance(samples, list) else [samples]
+        _add_views(items, self.pending(_sample_id(sample) for sample in items))
+        return samples
+
+    async def aapply_pending(self, samples):
+        """
+        apply_pending の非同期版。Redis からの読み込みはスレッドで実行します。
+        """
+        items = samples if isinstance(samples, list) else [samples]
+        sample_ids = [_sample_id(sample) for sample in items]
+        if self.buffer is None:
+            return samples
+        if self.buffer.shared:
+            deltas = await sync_to_async(self.buffer.get_many, thread_sensitive=False)(sample_ids)
+        else:
+            deltas = self.buffer.get_many(sample_ids)
+        _add_views(items, deltas)
+        return samples
+
+    def flush(self) -> int:
+        """
+        バッファの増分を DB に書き込み、書き込んだ閲覧数の合計を返します。
+        """
+        if self.buffer is None:
+            return 0
+        deltas = self.buffer.drain()
+        if not deltas:
+            self.buffer.rollback(deltas)
+            return 0
+        try:
+            SampleRepository.add_views(deltas)
+        except Exception:
+            self.buffer.rollback(deltas)
+            raise
+        self.buffer.commit()
+        return sum(deltas.values())
+
+
+_view_counter = None
+
+
+def get_view_counter() -> ViewCounterService:
+    """
+    プロセス内で共有する ViewCounterService を取得します。
+    """
+    global _view_counter
+    if _view_counter is None:
+        _view_counter = ViewCounterService.from_settings()
+    return _view_counter
@@ -0,0 +1,42 @@
+from django.conf import settings
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.cache import invalidate_on_commit
+
+from .models import Category, Sample
+from .models.about_model import About
+
+
+@receiver([post_save, post_delete], sender=Sample)
+def invalidate_sample_cache(sender, using, **kwargs):
+    """
+    サンプルが変更されたら、サンプル一覧・検索のキャッシュを無効化します。
+    無効化はトランザクションのコミット後に行います（コミット前の行がキャッシュされないように）。
+    """
+    invalidate_on_commit('samples', using=using)
+
+
+@receiver([post_save, post_delete], sender=Category)
+def invalidate_category_cache(sender, using, **kwargs):
+    """
+    カテゴリが変更されたら、カテゴリのキャッシュを無効化します。
+    サンプルのレスポンスはカテゴリを含むため、'categories' に依存するキャッシュも無効になります。
+    """
+    invalidate_on_commit('categories', using=using)
+
+
+@receiver([post_save, post_delete], sender=settings.AUTH_USER_MODEL)
+def invalidate_author_cache(sender, using, update_fields=None, **kwargs):
+    """
+    ユーザーが変更されたら、サンプルのキャッシュを無効化します（レスポンスに作成者を含むため）。
+    ログイン時の last_login だけの更新はレスポンスに影響しないので無視します。
+    """
+    if update_fields is not None and set(update_fields) <= {'last_login'}:
+        return
+    invalidate_on_commit('samples', using=using)
+
+
+@receiver([post_save, post_delete], sender=About)
+def invalidate_about_cache(sender, using, **kwargs):
+    invalidate_on_commit('about', using=using)
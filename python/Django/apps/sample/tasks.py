@@ -0,0 +1,20 @@
+from celery import shared_task
+
+from .repositories.sample_repository import SampleRepository
+from .service.view_counter_service import get_view_counter
+
+
+@shared_task(ignore_result=True)
+def flush_view_counts():
+    """
+    バッファに貯まった閲覧数を DB に書き込みます（Celery beat から定期実行）。
+    """
+    return get_view_counter().flush()
+
+
+@shared_task(ignore_result=True)
+def record_views(sample_id, count=1):
+    """
+    閲覧数をそのまま加算します（VIEW_COUNTER_BACKEND=none のとき閲覧ごとに投入されます）。
+    """
+    return SampleRepository.add_views({sample_id: count})
@@ -1,6 +1,10 @@
-from rest_framework import viewsets, status
+from adrf import viewsets
+from rest_framework import status
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.permissions import IsAuthenticatedOrReadOnly
+
+from core.cache import cached_action
 from ..service.about_service import AboutService
 from ..models.about_model import About
 from ..serializers.about_serializer import AboutSerializer
@@ -17,16 +21,20 @@ class AboutViewSet(viewsets.ModelViewSet):
     service = AboutService()
 
     def get_serializer_class(self):
-        if self.action == 'create':
-            return AboutCreateSerializer
-        elif self.action in ['update', 'partial_update']:
-            return AboutUpdateSerializer
         return AboutSerializer
 
     # ----------------------------------------------------
     # ★ CRUDアクションを明示的に定義 (ModelViewSetの基本動作)
     # ----------------------------------------------------
 
+    @cached_action('about')
+    async def list(self, request, *args, **kwargs):
+        return await self.alist(request, *args, **kwargs)
+
+    @cached_action('about')
+    async def retrieve(self, request, *args, **kwargs):
+        return await self.aretrieve(request, *args, **kwargs)
+
     def get_list(self, request, *args, **kwargs):
         about = self.service.get_about(request)
         serializer = self.get_serializer(about, many=True)
@@ -1,9 +1,11 @@
 from django.shortcuts import render
-from rest_framework import viewsets
+from adrf import viewsets
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from core.cache import cached_action
+
 from ..models import Category
 from ..serializers.category_serializer import CategorySerializer
 from ..service.category_service import CategoryService
@@ -32,12 +34,14 @@ class CategoryViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticatedOrReadOnly]
     service = CategoryService()
 
-    def list(self, request, *args, **kwargs):
-        categories = self.service.get_all_categories()
+    @cached_action('categories')
+    async def list(self, request, *args, **kwargs):
+        categories = await self.service.aget_all_categories()
         serializer = self.get_serializer(categories, many=True)
         return Response(serializer.data)
 
-    def retrieve(self, request, pk=None, *args, **kwargs):
-        category = self.service.get_category(category_id=int(pk))
+    @cached_action('categories')
+    async def retrieve(self, request, pk=None, *args, **kwargs):
+        category = await self.service.aget_category(category_id=int(pk))
         serializer = self.get_serializer(category)
         return Response(serializer.data)
\ No newline at end of file
@@ -1,20 +1,49 @@
 from django.shortcuts import render
-from rest_framework import viewsets, status
+from adrf import viewsets
+from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticatedOrReadOnly
 from drf_spectacular.utils import extend_schema, extend_schema_view
 
+from core.cache import cached_action
+from core.pagination import CreatedAtCursorPagination
+
 from ..models import Sample
 from ..serializers.sample_serializer import (
     SampleSerializer,
     SampleCreateSerializer,
-    SampleUpdateSerializer
+    SampleUpdateSerializer,
+    SampleValuesSerializer,
 )
 from ..service.sample_service import SampleService
 
 # サンプル関連のビューを定義
 
+# 一覧・検索のキャッシュ。レスポンスにカテゴリを含むため 'categories' の変更でも無効化する。
+# views_count の更新（ViewCounterService.flush）では無効化しないので、短めに保持する。
+cached_samples = cached_action('samples', depends_on=('categories',), timeout=60)
+
+# 検索結果の 1 ページあたりの最大件数
+SEARCH_MAX_LIMIT = 100
+
+
+def _non_negative_int(request, name, default):
+    """
+    クエリパラメータを 0 以上の整数として取得します（不正な値は 400 を返す ValidationError）。
+    """
+    value = request.query_params.get(name)
+    if value is None:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = -1
+    if number < 0:
+        raise ValidationError({name: '0 以上の整数を指定してください。'})
+    return number
+
 # def sample_list(request):
 #     """
 #     サンプルの一覧を表示するビュー。
@@ -38,6 +67,8 @@ from ..service.sample_service import SampleService
 class SampleViewSet(viewsets.ModelViewSet):
     queryset = Sample.objects.all()
     permission_classes = [IsAuthenticatedOrReadOnly]
+    # list / by_author は COUNT(*) なしのカーソルページング（?cursor=...&limit=20、?count=estimate で概算件数）
+    pagination_class = CreatedAtCursorPagination
     service = SampleService()
 
     def get_serializer_class(self):
@@ -47,20 +78,23 @@ class SampleViewSet(viewsets.ModelViewSet):
             return SampleUpdateSerializer
         return SampleSerializer
 
-    def list(self, request, *args, **kwargs):
-        skip = int(request.query_params.get('skip', 0))
-        limit = int(request.query_params.get('limit', 100))
+    # 一覧系のアクションは SampleValuesSerializer で .values() の行から直接 JSON を組み立てる
+    # （モデルインスタンスと DRF のフィールド処理を経由しない。出力は SampleSerializer と同じ）
+    @cached_samples
+    async def list(self, request, *args, **kwargs):
         published_only = request.query_params.get('published', 'false').lower() == 'true'
 
-        samples = self.service.get_samples(skip=skip, limit=limit, published_only=published_only)
-        serializer = self.get_serializer(samples, many=True)
-        return Response(serializer.data)
+        queryset = self.service.get_samples_queryset(published_only=published_only)
+        rows = await self.apaginate_queryset(queryset.values(*SampleValuesSerializer.columns()))
+        rows = await self.service.aapply_pending(rows)
+        return await self.get_apaginated_response(SampleValuesSerializer.many(rows))
 
-    def retrieve(self, request, pk=None, *args, **kwargs):
-        sample = self.service.get_sample(sample_id=int(pk))
+    async def retrieve(self, request, pk=None, *args, **kwargs):
+        sample = await self.service.aget_sample(sample_id=int(pk))
 
+        # 閲覧数はバッファに加算するだけで、このリクエストでは DB に書き込まない
         if not request.user.is_authenticated or request.user.id != sample.author_id:
-            self.service.increment_views(sample_id=int(pk))
+            await self.service.aincrement_views(sample_id=int(pk))
 
         serializer = self.get_serializer(sample)
         return Response(serializer.data)
@@ -107,26 +141,28 @@ class SampleViewSet(viewsets.ModelViewSet):
         tags=["samples"],
     )
     @action(detail=False, methods=['get'])
-    def by_author(self, request):
+    @cached_samples
+    async def by_author(self, request):
         author_id = int(request.query_params.get('author_id'))
-        skip = int(request.query_params.get('skip', 0))
-        limit = int(request.query_params.get('limit', 100))
 
-        samples = self.service.get_samples_by_author(
-            author_id=author_id,
-            skip=skip,
-            limit=limit
-        )
-        serializer = SampleSerializer(samples, many=True)
-        return Response(serializer.data)
+        queryset = self.service.get_samples_by_author_queryset(author_id=author_id)
+        rows = await self.apaginate_queryset(queryset.values(*SampleValuesSerializer.columns()))
+        rows = await self.service.aapply_pending(rows)
+        return await self.get_apaginated_response(SampleValuesSerializer.many(rows))
 
     @extend_schema(
         summary="サンプルの検索",
+        description="タイトル・要約・本文を全文検索し、関連度の高い順に返します（limit は最大 100）。",
         tags=["samples"],
     )
     @action(detail=False, methods=['get'])
-    def search(self, request):
+    @cached_samples
+    async def search(self, request):
         query = request.query_params.get('q', '')
-        samples = self.service.search_samples(query=query)
-        serializer = SampleSerializer(samples, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        skip = _non_negative_int(request, 'skip', 0)
+        limit = min(_non_negative_int(request, 'limit', 20), SEARCH_MAX_LIMIT)
+
+        queryset = self.service.search_samples_queryset(query).values(*SampleValuesSerializer.columns())
+        rows = [row async for row in queryset[skip:skip + limit]]
+        rows = await self.service.aapply_pending(rows)
+        return Response(SampleValuesSerializer.many(rows))
\ No newline at end of file
@@ -0,0 +1,9 @@
+from graphene_django import DjangoObjectType
+from .models import CustomUser
+
+
+class UserType(DjangoObjectType):
+    """ユーザーモデルのGraphQLタイプ（UserSerializer と同じ公開フィールド）。"""
+    class Meta:
+        model = CustomUser
+        fields = ['id', 'email', 'first_name', 'last_name', 'is_active', 'is_staff', 'date_joined']
@@ -7,10 +7,9 @@ class UserSerializer(serializers.ModelSerializer):
     class Meta:
         model = CustomUser
         fields = [
-            'id', 'username', 'email', 'first_name', 'last_name',
-            'is_active', 'is_staff', 'created_at', 'updated_at'
+            'id', 'email', 'first_name', 'last_name',
+            'is_active', 'is_staff', 'date_joined'
         ]
         read_only_fields = [
-            'id', 'author', 'views_count', 'likes_count',
-            'created_at', 'updated_at'
+            'id', 'is_active', 'is_staff', 'date_joined'
         ]
@@ -19,6 +19,19 @@ app.config_from_object('django.conf:settings', namespace='CELERY')
 app.autodiscover_tasks()
 
 
+@app.on_after_configure.connect
+def setup_periodic_tasks(sender, **kwargs):
+    """Register periodic tasks (synced to django_celery_beat on beat startup)."""
+    from django.conf import settings
+
+    # Write buffered Sample view counts to the database in batches.
+    sender.add_periodic_task(
+        settings.VIEW_COUNTER_FLUSH_INTERVAL,
+        sender.signature('apps.sample.tasks.flush_view_counts'),
+        name='flush sample view counts',
+    )
+
+
 @app.task(bind=True, ignore_result=True)
 def debug_task(self):
     """Debug task for testing Celery."""
@@ -1,11 +1,13 @@
 """GraphQL schema configuration."""
 
 import graphene
+from apps.sample.schema.category_schema import CategoryQuery
+from apps.sample.schema.sample_schema import SampleQuery
 # from apps.users.schema import UserQuery, UserMutation
 # from apps.posts.schema import PostQuery, PostMutation
 
 
-class Query(graphene.ObjectType):
+class Query(SampleQuery, CategoryQuery, graphene.ObjectType):
     """Root Query for GraphQL API."""
     pass
 
@@ -15,4 +17,6 @@ class Mutation(graphene.ObjectType):
     pass
 
 
-schema = graphene.Schema(query=Query, mutation=Mutation)
+# Pass mutation=Mutation once it has fields (graphene rejects an empty Mutation type).
+# The sample mutations trust user_id / is_staff arguments, so they are not exposed yet.
+schema = graphene.Schema(query=Query)
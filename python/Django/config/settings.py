@@ -38,6 +38,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     
     # Third-party apps
     'rest_framework',
@@ -160,6 +161,13 @@ REST_FRAMEWORK = {
     'DEFAULT_SCHEMA_CLASS': 'drf_spectacular.openapi.AutoSchema',
 }
 
+# JSON レンダラーを orjson に切り替える（要 orjson。出力は JSONRenderer と同じ内容）
+if env.bool('API_ORJSON_RENDERER', default=False):
+    REST_FRAMEWORK['DEFAULT_RENDERER_CLASSES'] = [
+        'core.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ]
+
 # JWT Settings
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=60),
@@ -205,6 +213,32 @@ CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
 CELERY_BEAT_SCHEDULER = 'django_celery_beat.schedulers:DatabaseScheduler'
 
+# Sample view counter
+# 閲覧数の増分を貯めるバッファ（redis: 全プロセスで共有し Celery beat で flush /
+# none: バッファリングせず閲覧ごとに Celery タスクで加算）。どちらもリクエスト中は DB に書き込まない
+VIEW_COUNTER_BACKEND = env('VIEW_COUNTER_BACKEND', default='none')
+VIEW_COUNTER_REDIS_URL = env('VIEW_COUNTER_REDIS_URL', default=CELERY_BROKER_URL)
+# flush_view_counts（Celery beat）で増分を DB に書き込む間隔（秒）
+VIEW_COUNTER_FLUSH_INTERVAL = env.float('VIEW_COUNTER_FLUSH_INTERVAL', default=10.0)
+
+# Cache
+# CACHE_URL: locmemcache:// (プロセス内) / redis://host:6379/1 (全プロセスで共有)
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+CACHES['default'].setdefault('KEY_PREFIX', env('CACHE_KEY_PREFIX', default='django-template'))
+CACHES['default'].setdefault('TIMEOUT', env.int('CACHE_TIMEOUT', default=300))
+
+# API response cache (core/cache.py の @cached_action)
+API_CACHE_ENABLED = env.bool('API_CACHE_ENABLED', default=True)
+API_CACHE_ALIAS = 'default'
+# レスポンスを保持する秒数（データ変更時は signals でバージョンを上げて即時に無効化）
+API_CACHE_TIMEOUT = env.int('API_CACHE_TIMEOUT', default=300)
+
+# Sample search
+# 関連度で順位付けする最大件数（一致したサンプルのうち新しいもの。0 = 無制限）
+SEARCH_RANK_CANDIDATES = env.int('SEARCH_RANK_CANDIDATES', default=1000)
+
 # Logging
 LOGGING = {
     'version': 1,
@@ -0,0 +1,178 @@
+"""API response cache for ViewSet actions.
+
+Cache keys contain a version number per namespace (e.g. ``samples``,
+``categories``). Changing data bumps the version (see ``invalidate``), so
+every cached response of that namespace is skipped at once; the orphaned
+entries simply expire after their timeout.
+"""
+
+import hashlib
+import inspect
+import time
+from functools import wraps
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from rest_framework.response import Response
+
+KEY_PREFIX = 'api-cache'
+
+# Namespaces used by @cached_action (reported by the cache_stats command)
+registered_namespaces = set()
+
+
+def get_cache():
+    return caches[settings.API_CACHE_ALIAS]
+
+
+def _version_key(namespace):
+    return f'{KEY_PREFIX}:version:{namespace}'
+
+
+def stat_key(namespace, kind):
+    return f'{KEY_PREFIX}:{kind}:{namespace}'
+
+
+def _initial_version():
+    # Never restart from 1 after an eviction: that could revive stale entries.
+    return int(time.time() * 1000)
+
+
+def get_versions(namespaces):
+    """Return the current version of each namespace, creating missing ones."""
+    cache = get_cache()
+    keys = {namespace: _version_key(namespace) for namespace in namespaces}
+    found = cache.get_many(keys.values())
+    versions = {}
+    for namespace, key in keys.items():
+        if key not in found:
+            cache.add(key, _initial_version(), None)
+            found[key] = cache.get(key)
+        versions[namespace] = found[key]
+    return versions
+
+
+async def aget_versions(namespaces):
+    """Async counterpart of ``get_versions``."""
+    cache = get_cache()
+    keys = {namespace: _version_key(namespace) for namespace in namespaces}
+    found = await cache.aget_many(keys.values())
+    versions = {}
+    for namespace, key in keys.items():
+        if key not in found:
+            await cache.aadd(key, _initial_version(), None)
+            found[key] = await cache.aget(key)
+        versions[namespace] = found[key]
+    return versions
+
+
+def invalidate(*namespaces):
+    """Invalidate every cached response of the given namespaces."""
+    cache = get_cache()
+    for namespace in namespaces:
+        try:
+            cache.incr(_version_key(namespace))
+        except ValueError:
+            cache.set(_version_key(namespace), _initial_version(), None)
+
+
+def invalidate_on_commit(*namespaces, using=None):
+    """Invalidate ``namespaces`` once the current transaction commits.
+
+    Bumping the version earlier would let a concurrent request cache rows
+    read before the commit under the new version. Runs immediately when no
+    transaction is open.
+    """
+    transaction.on_commit(lambda: invalidate(*namespaces), using=using)
+
+
+def _count(namespace, kind):
+    cache = get_cache()
+    key = stat_key(namespace, kind)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, None)
+
+
+async def _acount(namespace, kind):
+    cache = get_cache()
+    key = stat_key(namespace, kind)
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, 1, None)
+
+
+def _cache_key(view, view_method, request, kwargs, namespace, namespaces, versions):
+    params = urlencode(sorted(request.query_params.lists()), doseq=True)
+    raw = f'{type(view).__name__}.{view_method.__name__}:{sorted(kwargs.items())}:{params}'
+    digest = hashlib.sha256(raw.encode()).hexdigest()[:32]
+    version = '.'.join(str(versions[name]) for name in namespaces)
+    return f'{KEY_PREFIX}:{namespace}:{version}:{digest}'
+
+
+def cached_action(namespace, depends_on=(), timeout=None):
+    """Cache the response data of a read-only ViewSet action.
+
+    The key is built from the view, the action, the sorted query parameters,
+    the URL kwargs and the versions of ``namespace`` and ``depends_on`` (the
+    namespaces of nested data). Only 200 responses are cached. Works on both
+    sync and ``async def`` actions (the latter use the cache's async API).
+
+    Usage::
+
+        @cached_action('samples', depends_on=('categories',), timeout=60)
+        def list(self, request, *args, **kwargs):
+            ...
+    """
+    namespaces = (namespace, *depends_on)
+    registered_namespaces.update(namespaces)
+
+    def decorator(view_method):
+        if inspect.iscoroutinefunction(view_method):
+            @wraps(view_method)
+            async def async_wrapper(self, request, *args, **kwargs):
+                if not settings.API_CACHE_ENABLED or request.method not in ('GET', 'HEAD'):
+                    return await view_method(self, request, *args, **kwargs)
+
+                versions = await aget_versions(namespaces)
+                key = _cache_key(self, view_method, request, kwargs, namespace, namespaces, versions)
+                cache = get_cache()
+                data = await cache.aget(key)
+                if data is not None:
+                    await _acount(namespace, 'hits')
+                    return Response(data)
+
+                await _acount(namespace, 'misses')
+                response = await view_method(self, request, *args, **kwargs)
+                if response.status_code == 200:
+                    await cache.aset(key, response.data, timeout if timeout is not None else settings.API_CACHE_TIMEOUT)
+                return response
+
+            return async_wrapper
+
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            if not settings.API_CACHE_ENABLED or request.method not in ('GET', 'HEAD'):
+                return view_method(self, request, *args, **kwargs)
+
+            versions = get_versions(namespaces)
+            key = _cache_key(self, view_method, request, kwargs, namespace, namespaces, versions)
+            cache = get_cache()
+            data = cache.get(key)
+            if data is not None:
+                _count(namespace, 'hits')
+                return Response(data)
+
+            _count(namespace, 'misses')
+            response = view_method(self, request, *args, **kwargs)
+            if response.status_code == 200:
+                cache.set(key, response.data, timeout if timeout is not None else settings.API_CACHE_TIMEOUT)
+            return response
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,26 @@
+"""JSON renderer backed by orjson.
+
+``ORJSONRenderer`` is a drop-in replacement for DRF's ``JSONRenderer``; it is
+enabled with ``API_ORJSON_RENDERER=True`` (see ``config/settings.py``).
+Types orjson cannot encode natively (``Decimal``, lazy translation strings,
+querysets, ...) fall back to DRF's ``JSONEncoder``. Datetimes also go through
+the fallback so they are formatted exactly as with ``JSONRenderer``.
+"""
+
+import orjson
+from rest_framework.renderers import JSONRenderer
+
+
+class ORJSONRenderer(JSONRenderer):
+    """Render JSON with orjson (UTF-8, compact; ``indent`` pretty-prints with 2 spaces)."""
+
+    options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+
+        options = self.options
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=self.encoder_class().default, option=options)
@@ -0,0 +1,150 @@
+"""Read-only serialization straight from ``QuerySet.values()`` rows.
+
+``ValuesSerializer`` produces the same output as a ``ModelSerializer`` (with
+one level of nested ``ModelSerializer`` fields for foreign keys) without
+instantiating models or walking DRF's field machinery for every object.
+The field map of ``serializer_class`` is read once into a list of
+``(key, column, convert)`` entries that build each dict from a row::
+
+    class SampleValuesSerializer(ValuesSerializer):
+        serializer_class = SampleSerializer
+
+    rows = queryset.values(*SampleValuesSerializer.columns())
+    data = SampleValuesSerializer.many(rows)
+"""
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.settings import api_settings
+
+# Field types whose to_representation is a no-op for values loaded by the ORM
+PASSTHROUGH_REPRESENTATIONS = {
+    serializers.CharField.to_representation,
+    serializers.IntegerField.to_representation,
+    serializers.BooleanField.to_representation,
+}
+
+# ``convert`` marker for DateTimeFields rendered by ``_isoformat``
+ISOFORMAT = object()
+
+
+class ValuesSerializer:
+    """Base class; subclasses set ``serializer_class``."""
+
+    serializer_class = None
+
+    _fields = None
+    _columns = None
+
+    @classmethod
+    def columns(cls):
+        """Column names to pass to ``QuerySet.values()``."""
+        cls._compile()
+        return cls._columns
+
+    @classmethod
+    def to_representation(cls, row):
+        cls._compile()
+        return _render(cls._fields, row, timezone.get_current_timezone())
+
+    @classmethod
+    def many(cls, rows):
+        cls._compile()
+        fields = cls._fields
+        # Looked up once per call instead of once per datetime value
+        tz = timezone.get_current_timezone()
+        return [_render(fields, row, tz) for row in rows]
+
+    @classmethod
+    def _compile(cls):
+        # Cached per subclass (not inherited from ValuesSerializer itself)
+        if '_fields' in cls.__dict__:
+            return
+        if cls.serializer_class is None:
+            raise ImproperlyConfigured(f'{cls.__name__} must define serializer_class')
+        columns = []
+        fields = _field_entries(cls.serializer_class(), '', columns)
+        cls._columns = tuple(columns)
+        cls._fields = fields
+
+
+def _render(fields, row, tz):
+    """Build one output dict from ``row`` using the entries of ``_field_entries``."""
+    data = {}
+    for key, column, convert in fields:
+        value = row[column]
+        if convert is None or value is None:
+            data[key] = value
+        elif convert is ISOFORMAT:
+            data[key] = _isoformat(value, tz)
+        elif type(convert) is tuple:
+            # Nested serializer: ``column`` is its primary key, None for a NULL foreign key
+            data[key] = _render(convert, row, tz)
+        else:
+            data[key] = convert(value)
+    return data
+
+
+def _field_entries(serializer, prefix, columns):
+    """Return ``(key, column, convert)`` entries that build ``serializer``'s output from a row.
+
+    ``convert`` is None for values passed through as is, ``ISOFORMAT``, a
+    tuple of nested entries, or a bound ``to_representation``.
+    """
+    entries = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if '.' in field.source or field.source == '*':
+            raise ImproperlyConfigured(
+                f'{type(serializer).__name__}.{name}: unsupported source {field.source!r}'
+            )
+
+        if isinstance(field, serializers.ModelSerializer):
+            nested_prefix = f'{prefix}{field.source}__'
+            pk_column = nested_prefix + field.Meta.model._meta.pk.attname
+            nested = _field_entries(field, nested_prefix, columns)
+            if pk_column not in columns:
+                columns.append(pk_column)
+            entries.append((name, pk_column, nested))
+            continue
+        if (
+            isinstance(field, serializers.BaseSerializer)
+            or not isinstance(field, serializers.Field)
+            or isinstance(field, serializers.SerializerMethodField)
+        ):
+            raise ImproperlyConfigured(
+                f'{type(serializer).__name__}.{name}: unsupported field {type(field).__name__}'
+            )
+
+        column = prefix + field.source
+        columns.append(column)
+        if type(field).to_representation in PASSTHROUGH_REPRESENTATIONS:
+            entries.append((name, column, None))
+        elif _is_iso_datetime(field):
+            entries.append((name, column, ISOFORMAT))
+        else:
+            # Reuse one bound field per column (e.g. DateTimeField formatting and time zone)
+            entries.append((name, column, field.to_representation))
+    return tuple(entries)
+
+
+def _is_iso_datetime(field):
+    """True for a ``DateTimeField`` that ``_isoformat`` renders exactly like DRF."""
+    return (
+        type(field).to_representation is serializers.DateTimeField.to_representation
+        and type(field).enforce_timezone is serializers.DateTimeField.enforce_timezone
+        and settings.USE_TZ
+        and not hasattr(field, 'timezone')
+        and str(getattr(field, 'format', api_settings.DATETIME_FORMAT)).lower() == ISO_8601
+    )
+
+
+def _isoformat(value, tz):
+    """``DateTimeField.to_representation`` for aware datetimes loaded by the ORM."""
+    value = value.astimezone(tz).isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
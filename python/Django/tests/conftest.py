@@ -5,9 +5,54 @@ from django.conf import settings
 
 
 @pytest.fixture(scope='session')
-def django_db_setup():
-    """Setup test database."""
-    settings.DATABASES['default'] = {
+def django_db_modify_db_settings():
+    """Use an in-memory SQLite test database."""
+    settings.DATABASES['default'].update({
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': ':memory:',
-    }
+    })
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Start every test with an empty cache (LocMemCache outlives the test transaction)."""
+    from django.core.cache import cache
+
+    cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def view_counter(monkeypatch):
+    """Buffer view counts in memory so that retrieve never queues a Celery task."""
+    from apps.sample.service import view_counter_service
+    from apps.sample.service.view_counter_service import LocMemViewBuffer, ViewCounterService
+
+    counter = ViewCounterService(LocMemViewBuffer())
+    monkeypatch.setattr(view_counter_service, '_view_counter', counter)
+    return counter
+
+
+@pytest.fixture
+def author(django_user_model):
+    return django_user_model.objects.create_user(email='author@example.com', password='testpass123')
+
+
+@pytest.fixture
+def category():
+    from apps.sample.models import Category
+
+    return Category.objects.create(name='Python', slug='python')
+
+
+@pytest.fixture
+def samples(author, category):
+    """Six samples by ``author`` in ``category``; the even ones are published."""
+    from apps.sample.models import Sample
+
+    return [
+        Sample.objects.create(
+            title=f'Sample {i}', slug=f'sample-{i}', content='Content', author=author, category=category,
+            is_published=i % 2 == 0,
+        )
+        for i in range(6)
+    ]
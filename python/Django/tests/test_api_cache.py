@@ -0,0 +1,151 @@
+"""Response caching for read-only ViewSet actions and its invalidation."""
+
+import pytest
+from django.core.management import call_command
+from django.test import override_settings
+from rest_framework.test import APIClient
+
+from apps.sample.models import Category, Sample
+from apps.sample.models.about_model import About
+
+
+@pytest.fixture
+def on_commit(django_capture_on_commit_callbacks):
+    """Signals invalidate on commit, which a test transaction never reaches."""
+    return django_capture_on_commit_callbacks
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.fixture
+def sample(author, category):
+    return Sample.objects.create(
+        title='Sample',
+        slug='sample',
+        content='Content',
+        author=author,
+        category=category,
+        is_published=True,
+    )
+
+
+@pytest.mark.django_db
+class TestCategoryCache:
+
+    def test_list_is_served_from_cache(self, client, category, django_assert_num_queries):
+        client.get('/api/sample/categories/')
+        with django_assert_num_queries(0):
+            response = client.get('/api/sample/categories/')
+        assert response.status_code == 200
+        assert [item['name'] for item in response.json()] == ['Python']
+
+    def test_save_invalidates(self, client, category, on_commit):
+        client.get('/api/sample/categories/')
+        category.name = 'Django'
+        with on_commit(execute=True):
+            category.save()
+        assert [item['name'] for item in client.get('/api/sample/categories/').json()] == ['Django']
+
+    def test_delete_invalidates(self, client, category, on_commit):
+        client.get('/api/sample/categories/')
+        with on_commit(execute=True):
+            category.delete()
+        assert client.get('/api/sample/categories/').json() == []
+
+    def test_retrieve_is_keyed_by_pk(self, client, category, django_assert_num_queries):
+        other = Category.objects.create(name='Go', slug='go')
+        client.get(f'/api/sample/categories/{category.id}/')
+        with django_assert_num_queries(1):
+            response = client.get(f'/api/sample/categories/{other.id}/')
+        assert response.json()['name'] == 'Go'
+
+    @override_settings(API_CACHE_ENABLED=False)
+    def test_disabled(self, client, category, django_assert_num_queries):
+        client.get('/api/sample/categories/')
+        with django_assert_num_queries(1):
+            client.get('/api/sample/categories/')
+
+
+@pytest.mark.django_db
+class TestSampleCache:
+
+    def test_query_params_are_part_of_the_key(self, client, sample, django_assert_num_queries):
+        client.get('/api/sample/samples/', {'published': 'true', 'limit': 10})
+        with django_assert_num_queries(0):
+            client.get('/api/sample/samples/', {'limit': 10, 'published': 'true'})
+        with django_assert_num_queries(1):
+            client.get('/api/sample/samples/', {'published': 'false', 'limit': 10})
+
+    def test_sample_save_invalidates(self, client, sample, on_commit):
+        client.get('/api/sample/samples/search/', {'q': 'Sample'})
+        sample.title = 'Renamed Sample'
+        with on_commit(execute=True):
+            sample.save()
+        response = client.get('/api/sample/samples/search/', {'q': 'Sample'})
+        assert response.json()[0]['title'] == 'Renamed Sample'
+
+    def test_category_save_invalidates_nested_data(self, client, sample, category, on_commit):
+        client.get('/api/sample/samples/')
+        category.name = 'Django'
+        with on_commit(execute=True):
+            category.save()
+        assert (
+            client.get('/api/sample/samples/').json()['results'][0]['category']['name'] == 'Django'
+        )
+
+    def test_author_save_invalidates_nested_data(self, client, sample, on_commit):
+        client.get('/api/sample/samples/')
+        sample.author.first_name = 'Ann'
+        with on_commit(execute=True):
+            sample.author.save()
+        assert (
+            client.get('/api/sample/samples/').json()['results'][0]['author']['first_name'] == 'Ann'
+        )
+
+    def test_last_login_does_not_invalidate(self, sample, on_commit):
+        with on_commit() as callbacks:
+            sample.author.save(update_fields=['last_login'])
+        assert callbacks == []
+
+    def test_invalidation_waits_for_commit(
+        self, client, sample, on_commit, django_assert_num_queries
+    ):
+        client.get('/api/sample/samples/')
+        with on_commit() as callbacks:
+            sample.title = 'Renamed Sample'
+            sample.save()
+            # Before the commit another request still gets the cached response
+            with django_assert_num_queries(0):
+                client.get('/api/sample/samples/')
+        assert len(callbacks) == 1
+        callbacks[0]()
+        assert client.get('/api/sample/samples/').json()['results'][0]['title'] == 'Renamed Sample'
+
+    def test_about_save_invalidates(self, client, on_commit):
+        About.objects.create(context='v1')
+        client.get('/api/sample/about/')
+        About.objects.update(context='v2')  # bulk update: no signal, still cached
+        assert client.get('/api/sample/about/').json()['results'][0]['context'] == 'v1'
+        with on_commit(execute=True):
+            About.objects.get().save()
+        assert client.get('/api/sample/about/').json()['results'][0]['context'] == 'v2'
+
+
+@pytest.mark.django_db
+def test_cache_stats_command(client, category, capsys):
+    client.get('/api/sample/categories/')
+    client.get('/api/sample/categories/')
+    call_command('cache_stats')
+    line = next(
+        line for line in capsys.readouterr().out.splitlines() if line.startswith('categories')
+    )
+    assert line.split()[2:] == ['1', '1', '50.0%']
+
+    call_command('cache_stats', '--reset')
+    line = next(
+        line for line in capsys.readouterr().out.splitlines() if line.startswith('categories')
+    )
+    assert line.split()[2:] == ['0', '0', '-']
@@ -0,0 +1,37 @@
+"""Async read paths: ViewSets dispatch asynchronously and the async service
+methods return the same rows as their sync counterparts."""
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIClient
+
+from apps.sample.service.category_service import CategoryService
+from apps.sample.service.sample_service import SampleService
+from apps.sample.views.about_views import AboutViewSet
+from apps.sample.views.category_views import CategoryViewSet
+from apps.sample.views.sample_views import SampleViewSet
+
+
+@pytest.mark.parametrize('viewset', [SampleViewSet, CategoryViewSet, AboutViewSet])
+def test_viewsets_dispatch_async(viewset):
+    assert viewset.view_is_async
+
+
+@pytest.mark.django_db
+class TestAsyncSampleService:
+
+    def test_aget_sample_applies_pending_views(self, samples, view_counter):
+        view_counter.increment(samples[0].id, 3)
+        sample = async_to_sync(SampleService().aget_sample)(sample_id=samples[0].id)
+        assert sample.views_count == 3
+
+    def test_category_service(self, samples):
+        categories = async_to_sync(CategoryService().aget_all_categories)()
+        assert [category.slug for category in categories] == ['python']
+
+
+@pytest.mark.django_db
+def test_retrieve_buffers_view_asynchronously(samples, view_counter):
+    response = APIClient().get(f'/api/sample/samples/{samples[0].id}/')
+    assert response.status_code == 200
+    assert view_counter.pending([samples[0].id]) == {samples[0].id: 1}
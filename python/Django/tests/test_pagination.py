@@ -0,0 +1,100 @@
+"""Cursor pagination for the sample list and by_author actions."""
+
+from datetime import timedelta
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from apps.sample.models import Sample
+from core.pagination import estimate_count
+
+User = get_user_model()
+
+
+@pytest.fixture
+def samples(author):
+    """45 samples; every third shares its created_at with the previous one."""
+    other = User.objects.create_user(email='other@example.com')
+    base = timezone.now()
+    rows = []
+    for i in range(45):
+        sample = Sample.objects.create(
+            title=f'Sample {i}',
+            slug=f'sample-{i}',
+            content='Content',
+            author=author if i % 3 else other,
+        )
+        rows.append(sample)
+    for i, sample in enumerate(rows):
+        Sample.objects.filter(pk=sample.pk).update(
+            created_at=base - timedelta(minutes=i - i % 3 // 2)
+        )
+    return rows
+
+
+def walk(client, url, params):
+    """Follow next links and return the ids of every page."""
+    pages = []
+    response = client.get(url, params).json()
+    while True:
+        pages.append([item['id'] for item in response['results']])
+        if not response['next']:
+            return pages
+        response = client.get(response['next']).json()
+
+
+@pytest.mark.django_db
+class TestSampleCursorPagination:
+
+    def test_walks_every_row_once_newest_first(self, samples):
+        pages = walk(APIClient(), '/api/sample/samples/', {'limit': 10})
+        assert [len(page) for page in pages] == [10, 10, 10, 10, 5]
+        ids = [sample_id for page in pages for sample_id in page]
+        expected = Sample.objects.order_by('-created_at', '-id').values_list('id', flat=True)
+        assert ids == list(expected)
+
+    def test_no_count_query(self, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = APIClient().get('/api/sample/samples/')
+        assert set(response.json()) == {'next', 'previous', 'results'}
+        assert len(response.json()['results']) == 20
+
+    def test_page_size_is_capped(self, samples):
+        Sample.objects.bulk_create(
+            Sample(title='Bulk', slug=f'bulk-{i}', content='Content', author=samples[0].author)
+            for i in range(80)
+        )
+        response = APIClient().get('/api/sample/samples/', {'limit': 1000})
+        assert len(response.json()['results']) == 100
+
+    def test_previous_link(self, samples):
+        client = APIClient()
+        first = client.get('/api/sample/samples/', {'limit': 10}).json()
+        second = client.get(first['next']).json()
+        assert client.get(second['previous']).json()['results'] == first['results']
+
+    def test_by_author(self, author, samples):
+        pages = walk(
+            APIClient(), '/api/sample/samples/by_author/', {'author_id': author.id, 'limit': 7}
+        )
+        ids = [sample_id for page in pages for sample_id in page]
+        expected = (
+            Sample.objects.filter(author=author)
+            .order_by('-created_at', '-id')
+            .values_list('id', flat=True)
+        )
+        assert ids == list(expected)
+
+    def test_estimated_count_is_opt_in(self, samples):
+        response = APIClient().get(
+            '/api/sample/samples/', {'count': 'estimate', 'published': 'false'}
+        )
+        assert response.json()['count'] == 45
+
+
+@pytest.mark.django_db
+def test_estimate_count_falls_back_to_exact_count(samples, author):
+    # SQLite has no pg_class statistics
+    assert estimate_count(Sample.objects.filter(author=author)) == 30
@@ -0,0 +1,128 @@
+"""Query budgets for the sample API.
+
+Every ViewSet action is pinned to a fixed number of queries that does not
+grow with the number of rows returned, so that N+1 regressions fail here.
+"""
+
+import pytest
+from django.contrib.auth import get_user_model
+from rest_framework.test import APIClient
+
+from apps.sample.models import Category, Sample
+from apps.sample.models.about_model import About
+
+User = get_user_model()
+
+PAGE = 5
+
+
+@pytest.fixture
+def samples(author):
+    """PAGE samples, each with its own author and category."""
+    result = []
+    for i in range(PAGE):
+        result.append(
+            Sample.objects.create(
+                title=f'Sample {i}',
+                slug=f'sample-{i}',
+                content='Content',
+                author=author if i == 0 else User.objects.create_user(email=f'user{i}@example.com'),
+                category=Category.objects.create(name=f'Category {i}', slug=f'category-{i}'),
+                is_published=i % 2 == 0,
+            )
+        )
+    return result
+
+
+@pytest.fixture
+def client(author):
+    client = APIClient()
+    client.force_authenticate(author)
+    return client
+
+
+@pytest.mark.django_db
+class TestSampleViewSetQueries:
+    """SampleViewSet: rows are loaded with author and category in one SELECT."""
+
+    def test_list(self, client, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = client.get('/api/sample/samples/')
+        assert response.status_code == 200
+        results = response.json()['results']
+        assert len(results) == PAGE
+        assert all(item['author']['email'] and item['category']['name'] for item in results)
+
+    def test_list_published(self, client, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = client.get('/api/sample/samples/', {'published': 'true'})
+        assert len(response.json()['results']) == 3
+
+    def test_retrieve(self, client, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = client.get(f'/api/sample/samples/{samples[1].id}/')
+        assert response.status_code == 200
+        assert response.json()['author']['id'] == samples[1].author_id
+
+    def test_by_author(self, client, author, samples, django_assert_num_queries):
+        for i in range(PAGE):
+            Sample.objects.create(
+                title=f'Extra {i}', slug=f'extra-{i}', content='Content', author=author
+            )
+        with django_assert_num_queries(1):
+            response = client.get('/api/sample/samples/by_author/', {'author_id': author.id})
+        assert len(response.json()['results']) == PAGE + 1
+
+    def test_search(self, client, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = client.get('/api/sample/samples/search/', {'q': 'Sample'})
+        assert len(response.json()) == PAGE
+
+    def test_create(self, client, samples, django_assert_num_queries):
+        payload = {
+            'title': 'New',
+            'slug': 'new',
+            'content': 'Content',
+            'category': samples[0].category_id,
+        }
+        # slug の一意性チェック + カテゴリの存在チェック + INSERT + 作成者
+        with django_assert_num_queries(4):
+            response = client.post('/api/sample/samples/', payload, format='json')
+        assert response.status_code == 201
+        assert response.json()['category']['slug'] == 'category-0'
+
+    def test_update(self, client, samples, django_assert_num_queries):
+        payload = {'title': 'Updated', 'slug': 'updated', 'content': 'Updated'}
+        # slug の一意性チェック + 取得 + UPDATE
+        with django_assert_num_queries(3):
+            response = client.put(f'/api/sample/samples/{samples[0].id}/', payload, format='json')
+        assert response.status_code == 200
+        assert response.json()['author']['email'] == 'author@example.com'
+
+    def test_destroy(self, client, samples, django_assert_num_queries):
+        with django_assert_num_queries(2):
+            response = client.delete(f'/api/sample/samples/{samples[0].id}/')
+        assert response.status_code == 204
+
+
+@pytest.mark.django_db
+class TestCategoryAndAboutViewSetQueries:
+    """CategoryViewSet / AboutViewSet read actions."""
+
+    def test_category_list(self, client, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = client.get('/api/sample/categories/')
+        assert len(response.json()) == PAGE
+
+    def test_category_retrieve(self, client, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = client.get(f'/api/sample/categories/{samples[0].category_id}/')
+        assert response.json()['slug'] == 'category-0'
+
+    def test_about_list(self, client, django_assert_num_queries):
+        for i in range(PAGE):
+            About.objects.create(context=f'About {i}')
+        # PageNumberPagination の COUNT + SELECT
+        with django_assert_num_queries(2):
+            response = client.get('/api/sample/about/')
+        assert response.json()['count'] == PAGE
@@ -0,0 +1,90 @@
+"""Sample search: ranking, pagination and the REST / GraphQL entry points.
+
+The suite runs on SQLite, so these tests exercise the substring fallback
+(SimpleSampleSearch); the PostgreSQL backend is covered by the search_bench
+management command.
+"""
+
+import pytest
+from graphene.test import Client as GraphQLClient
+from rest_framework.test import APIClient
+
+from apps.sample.models import Sample
+from apps.sample.repositories.sample_repository import SampleRepository
+from config.schema import schema
+
+
+@pytest.fixture
+def samples(author):
+    """Three unrelated samples plus a 30-part "Django part" series."""
+    rows = [
+        ('Django tips', 'Nothing to see here'),
+        ('Cooking', 'A recipe that mentions django once'),
+        ('Gardening', 'Plants and soil'),
+    ] + [(f'Django part {i}', 'Series') for i in range(30)]
+    return [
+        Sample.objects.create(title=title, slug=f'sample-{i}', content=content, author=author)
+        for i, (title, content) in enumerate(rows)
+    ]
+
+
+@pytest.mark.django_db
+class TestSampleRepositorySearch:
+
+    def test_title_matches_rank_first(self, samples):
+        results = list(SampleRepository.search('django'))
+        assert len(results) == 32
+        assert results[-1].title == 'Cooking'
+        assert all(sample.rank == 1.0 for sample in results[:-1])
+
+    def test_blank_query_returns_nothing(self, samples):
+        assert not SampleRepository.search('  ').exists()
+
+
+@pytest.mark.django_db
+class TestSearchAction:
+
+    def test_paginates_with_skip_and_limit(self, samples):
+        client = APIClient()
+        first = client.get('/api/sample/samples/search/', {'q': 'django', 'limit': 20}).json()
+        second = client.get(
+            '/api/sample/samples/search/', {'q': 'django', 'skip': 20, 'limit': 20}
+        ).json()
+        assert len(first) == 20
+        assert len(second) == 12
+        assert not {item['id'] for item in first} & {item['id'] for item in second}
+
+    def test_limit_is_capped(self, samples):
+        response = APIClient().get('/api/sample/samples/search/', {'q': 'part', 'limit': 1000})
+        assert len(response.json()) == 30
+
+    @pytest.mark.parametrize(
+        'params', [{'skip': -1}, {'limit': -5}, {'skip': 'x'}, {'limit': '1.5'}]
+    )
+    def test_invalid_skip_or_limit(self, params):
+        response = APIClient().get('/api/sample/samples/search/', {'q': 'django', **params})
+        assert response.status_code == 400
+        assert set(response.json()) == set(params)
+
+    def test_single_query(self, samples, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            response = APIClient().get('/api/sample/samples/search/', {'q': 'django'})
+        assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_graphql_search_samples(samples):
+    result = GraphQLClient(schema).execute(
+        '''
+        query {
+            searchSamples(query: "django", limit: 2) {
+                title
+                author { email }
+            }
+        }
+    '''
+    )
+    assert 'errors' not in result
+    assert [item['author']['email'] for item in result['data']['searchSamples']] == [
+        'author@example.com'
+    ] * 2
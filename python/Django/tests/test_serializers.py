@@ -0,0 +1,172 @@
+"""Values-based Sample serialization and the orjson renderer."""
+
+import json
+import time
+from datetime import timedelta
+
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+from apps.sample.models import Sample
+from apps.sample.repositories.sample_repository import SampleRepository
+from apps.sample.serializers.sample_serializer import SampleSerializer, SampleValuesSerializer
+from core.serializers import ValuesSerializer
+
+
+def create_samples(author, category, count):
+    now = timezone.now()
+    Sample.objects.bulk_create(
+        [
+            Sample(
+                title=f'Sample {i}',
+                slug=f'sample-{i}',
+                content='Content ' * 20,
+                excerpt='Excerpt',
+                author=author,
+                category=category if i % 2 else None,
+                is_published=bool(i % 3),
+                published_at=now - timedelta(days=i) if i % 3 else None,
+                views_count=i,
+                likes_count=i // 2,
+            )
+            for i in range(count)
+        ]
+    )
+
+
+def model_path():
+    return SampleSerializer(SampleRepository.with_relations().order_by('id'), many=True).data
+
+
+def values_path():
+    return SampleValuesSerializer.many(
+        Sample.objects.order_by('id').values(*SampleValuesSerializer.columns())
+    )
+
+
+@pytest.mark.django_db
+class TestSampleValuesSerializer:
+
+    def test_matches_model_serializer(self, author, category):
+        create_samples(author, category, 6)
+
+        assert values_path() == model_path()
+
+    def test_null_category_and_published_at(self, author, category):
+        create_samples(author, category, 1)
+
+        row = values_path()[0]
+
+        assert row['category'] is None
+        assert row['published_at'] is None
+        assert row['author']['email'] == 'author@example.com'
+
+    def test_datetimes_use_drf_format(self, author, category):
+        create_samples(author, category, 2)
+
+        fast = values_path()[1]
+        expected = SampleSerializer(Sample.objects.get(id=fast['id'])).data
+
+        assert fast['created_at'] == expected['created_at']
+        assert fast['category']['created_at'] == expected['category']['created_at']
+
+    def test_columns_join_author_and_category(self):
+        columns = SampleValuesSerializer.columns()
+
+        assert 'author__email' in columns
+        assert 'category__id' in columns
+        assert 'author__password' not in columns
+
+    def test_list_endpoint_output_unchanged(self, author, category, view_counter):
+        create_samples(author, category, 5)
+        view_counter.increment(Sample.objects.get(slug='sample-1').id, 3)
+
+        response = APIClient().get('/api/sample/samples/')
+
+        expected = SampleSerializer(
+            SampleRepository.with_relations().order_by('-created_at', '-id'), many=True
+        ).data
+        for item in expected:
+            if item['id'] == Sample.objects.get(slug='sample-1').id:
+                item['views_count'] += 3
+        assert response.json()['results'] == json.loads(JSONRenderer().render(expected))
+
+
+class TestValuesSerializerCompile:
+
+    def test_requires_serializer_class(self):
+        class Missing(ValuesSerializer):
+            pass
+
+        with pytest.raises(ImproperlyConfigured):
+            Missing.columns()
+
+    def test_rejects_method_fields(self):
+        class WithMethod(SampleSerializer):
+            summary = serializers.SerializerMethodField()
+
+            class Meta(SampleSerializer.Meta):
+                fields = SampleSerializer.Meta.fields + ['summary']
+
+            def get_summary(self, obj):
+                return obj.title
+
+        class Values(ValuesSerializer):
+            serializer_class = WithMethod
+
+        with pytest.raises(ImproperlyConfigured):
+            Values.columns()
+
+
+class TestORJSONRenderer:
+
+    @pytest.fixture(autouse=True)
+    def renderer(self):
+        pytest.importorskip('orjson')
+        from core.renderers import ORJSONRenderer
+
+        return ORJSONRenderer()
+
+    def test_same_json_as_json_renderer(self, renderer):
+        from decimal import Decimal
+
+        data = {
+            'title': 'サンプル',
+            'price': Decimal('1.50'),
+            'when': timezone.now(),
+            'items': [1, None, True],
+        }
+
+        assert json.loads(renderer.render(data)) == json.loads(JSONRenderer().render(data))
+
+    def test_none_renders_empty_body(self, renderer):
+        assert renderer.render(None) == b''
+
+    def test_indent(self, renderer):
+        assert renderer.render({'a': 1}, 'application/json; indent=4') == b'{\n  "a": 1\n}'
+
+
+@pytest.mark.slow
+@pytest.mark.django_db
+class TestSerializerBenchmark:
+    """ModelSerializer (instances + select_related) vs SampleValuesSerializer (.values() rows).
+
+    Deselected by default; run with ``pytest -m slow --junitxml=...`` to collect the timings.
+    """
+
+    @pytest.mark.parametrize('count', [100, 1_000, 10_000])
+    def test_serialization_timings(self, author, category, count, record_property):
+        create_samples(author, category, count)
+
+        for name, serialize in (('model', model_path), ('values', values_path)):
+            best = float('inf')
+            for _ in range(3):
+                started = time.perf_counter()
+                data = serialize()
+                best = min(best, time.perf_counter() - started)
+            assert len(data) == count
+            record_property(f'{name}_ms', round(best * 1000, 1))
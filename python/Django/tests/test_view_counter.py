@@ -0,0 +1,108 @@
+"""Tests for the buffered Sample view counter."""
+
+import pytest
+
+from apps.sample import tasks
+from apps.sample.models import Sample
+from apps.sample.repositories.sample_repository import SampleRepository
+from apps.sample.service.view_counter_service import LocMemViewBuffer, ViewCounterService
+
+
+@pytest.fixture
+def sample(author):
+    """Create a sample by the shared author."""
+    return Sample.objects.create(title='Title', slug='title', content='Content', author=author)
+
+
+@pytest.fixture
+def counter():
+    """A counter that only flushes when asked to."""
+    return ViewCounterService(LocMemViewBuffer())
+
+
+@pytest.mark.django_db
+class TestViewCounter:
+    """Test ViewCounterService with the in-process buffer."""
+
+    def test_increment_does_not_write(self, sample, counter, django_assert_num_queries):
+        """Increments are buffered without touching the database."""
+        with django_assert_num_queries(0):
+            for _ in range(3):
+                counter.increment(sample.id)
+        sample.refresh_from_db()
+        assert sample.views_count == 0
+        assert counter.pending([sample.id]) == {sample.id: 3}
+
+    def test_apply_pending(self, sample, counter):
+        """Reads include views that have not been flushed yet."""
+        counter.increment(sample.id, 2)
+        assert counter.apply_pending(sample).views_count == 2
+        assert [s.views_count for s in counter.apply_pending([Sample.objects.get(id=sample.id)])] == [2]
+
+    def test_flush_adds_to_stored_count(self, sample, counter):
+        """Flush adds the buffered delta atomically and leaves updated_at alone."""
+        updated_at = sample.updated_at
+        Sample.objects.filter(id=sample.id).update(views_count=10)
+        counter.increment(sample.id, 5)
+
+        assert counter.flush() == 5
+        sample.refresh_from_db()
+        assert sample.views_count == 15
+        assert sample.updated_at == updated_at
+        assert counter.pending([sample.id]) == {}
+        assert counter.flush() == 0
+
+    def test_flush_failure_keeps_deltas(self, sample, counter, monkeypatch):
+        """A failed flush puts the deltas back so that no views are lost."""
+        def fail(deltas):
+            raise RuntimeError('database unavailable')
+
+        counter.increment(sample.id, 4)
+        monkeypatch.setattr(SampleRepository, 'add_views', fail)
+        with pytest.raises(RuntimeError):
+            counter.flush()
+        assert counter.pending([sample.id]) == {sample.id: 4}
+
+
+@pytest.mark.django_db
+class TestUnbufferedViewCounter:
+    """Without a shared buffer, each view is queued as a Celery task."""
+
+    @pytest.fixture
+    def queued(self, monkeypatch):
+        calls = []
+        monkeypatch.setattr(tasks.record_views, 'apply_async', lambda args, **options: calls.append(args))
+        return calls
+
+    @pytest.mark.parametrize('backend', ['none', 'locmem'])
+    def test_from_settings(self, settings, backend):
+        settings.VIEW_COUNTER_BACKEND = backend
+        assert ViewCounterService.from_settings().buffer is None
+
+    def test_increment_queues_task(self, sample, queued, django_assert_num_queries):
+        counter = ViewCounterService()
+        with django_assert_num_queries(0):
+            counter.increment(sample.id, 2)
+        assert queued == [(sample.id, 2)]
+        assert counter.pending([sample.id]) == {}
+        assert counter.flush() == 0
+
+    def test_broker_failure_does_not_raise(self, sample, monkeypatch):
+        def fail(args, **options):
+            raise ConnectionError('broker unavailable')
+
+        monkeypatch.setattr(tasks.record_views, 'apply_async', fail)
+        ViewCounterService().increment(sample.id)
+
+    def test_record_views_task(self, sample):
+        tasks.record_views(sample.id, 3)
+        sample.refresh_from_db()
+        assert sample.views_count == 3
+
+
+@pytest.mark.django_db
+def test_repository_increment_views_is_atomic(sample):
+    """increment_views adds to the stored value instead of overwriting it."""
+    stale = Sample.objects.get(id=sample.id)
+    Sample.objects.filter(id=sample.id).update(views_count=7)
+    assert SampleRepository.increment_views(stale).views_count == 8
@@ -1,8 +1,16 @@
 """Health check endpoint."""
 
+from typing import Any
+
 from fastapi import APIRouter
 
 from app.core.config import settings
+from app.core.http_cache import response_cache
+from app.core.security import password_hasher, token_verifier
+from app.graphql.dataloaders import loader_stats
+from app.graphql.extensions import document_cache
+from app.graphql.persisted_queries import persisted_query_store
+from app.services.sample_service import post_cache, user_cache
 
 router = APIRouter()
 
@@ -21,3 +29,18 @@ async def health_check() -> dict[str, str]:
 async def ping() -> dict[str, str]:
     """Simple ping endpoint."""
     return {"message": "pong"}
+
+
+@router.get("/cache/stats", tags=["health"])
+async def cache_stats() -> dict[str, dict[str, Any]]:
+    """Cache, DataLoader and password-hashing queue counters."""
+    return {
+        "users": user_cache.stats.as_dict(),
+        "posts": post_cache.stats.as_dict(),
+        "responses": response_cache.stats(),
+        "tokens": token_verifier.stats(),
+        "graphql_documents": document_cache.stats(),
+        "persisted_queries": persisted_query_store.stats(),
+        "dataloaders": loader_stats(),
+        "password_hasher": password_hasher.stats(),
+    }
@@ -0,0 +1,28 @@
+"""Metrics endpoint.
+
+Mounted at ``/metrics`` (outside ``/api``) where Prometheus expects it.
+"""
+
+from typing import Literal
+
+from fastapi import APIRouter, Query, Response
+from fastapi.responses import PlainTextResponse
+
+from app.core import database
+from app.core.responses import FastJSONResponse
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, tags=["health"])
+async def metrics(
+    format: Literal["prometheus", "json"] = Query("prometheus", description="prometheus or json"),
+) -> Response:
+    """Database pool occupancy, pool wait time and query latency histograms."""
+    if format == "json":
+        pool_metrics = await database.get_pool_metrics(format="json")
+        return FastJSONResponse(pool_metrics)
+    text = await database.get_pool_metrics(format="prometheus")
+    return PlainTextResponse(text, media_type=PROMETHEUS_CONTENT_TYPE)
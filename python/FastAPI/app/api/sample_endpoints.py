@@ -4,23 +4,36 @@ This file contains sample API endpoints that can be copied
 and modified for your own use cases.
 """
 
-from typing import List
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
+from app.core.http_cache import CachePolicy, cached_response
 from app.schemas.sample_schema import (
+    CursorPage,
     MessageResponse,
+    PostBatchRequest,
+    PostBatchResponse,
     PostCreate,
     PostResponse,
     PostUpdate,
+    UserBatchRequest,
+    UserBatchResponse,
     UserCreate,
     UserResponse,
     UserUpdate,
 )
 from app.services.sample_service import PostService, UserService
+from app.utils.export import ExportFormat, export_response
 
 router = APIRouter()
 
+# Cache-Control per read route. Single rows may be reused briefly; lists are
+# always revalidated, which costs a 304 without a body when nothing changed.
+ENTITY_CACHE_POLICY = CachePolicy(max_age=5)
+LIST_CACHE_POLICY = CachePolicy(max_age=0)
+
 
 # ==================== User Endpoints ====================
 
@@ -39,6 +52,34 @@ async def create_user(
     return await user_service.create_user(user_data)
 
 
+@router.post(
+    "/users:batch",
+    response_model=UserBatchResponse,
+    tags=["users"],
+    summary="Create and delete users in bulk",
+)
+async def batch_users(
+    request: UserBatchRequest,
+    user_service: UserService = Depends(lambda: UserService()),
+) -> UserBatchResponse:
+    """Create and delete users in bulk; each item reports its own result."""
+    return await user_service.batch(request)
+
+
+@router.get(
+    "/users:export",
+    response_class=StreamingResponse,
+    tags=["users"],
+    summary="Export all users",
+)
+async def export_users(
+    export_format: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    user_service: UserService = Depends(lambda: UserService()),
+) -> StreamingResponse:
+    """Stream every user, newest first, as NDJSON or CSV."""
+    return export_response(user_service.export_users(export_format), export_format, "users")
+
+
 @router.get(
     "/users/{user_id}",
     response_model=UserResponse,
@@ -47,25 +88,44 @@ async def create_user(
 )
 async def get_user(
     user_id: str,
+    request: Request,
     user_service: UserService = Depends(lambda: UserService()),
-) -> UserResponse:
-    """Get a user by ID."""
-    return await user_service.get_user(user_id)
+) -> Response:
+    """Get a user by ID (supports If-None-Match)."""
+    return await cached_response(
+        request,
+        ENTITY_CACHE_POLICY,
+        lambda: user_service.get_user(user_id),
+        tags=(f"user:{user_id}",),
+    )
 
 
 @router.get(
     "/users",
-    response_model=List[UserResponse],
+    response_model=CursorPage[UserResponse],
     tags=["users"],
     summary="Get all users",
 )
 async def get_users(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    request: Request,
+    skip: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Number of records to skip (offset paging; prefer `after`/`before`)",
+    ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    after: Optional[str] = Query(None, description="Cursor: return the page after this one"),
+    before: Optional[str] = Query(None, description="Cursor: return the page before this one"),
     user_service: UserService = Depends(lambda: UserService()),
-) -> List[UserResponse]:
-    """Get all users with pagination."""
-    return await user_service.get_users(skip=skip, limit=limit)
+) -> Response:
+    """Get all users, newest first, with cursor pagination (supports If-None-Match)."""
+    return await cached_response(
+        request,
+        LIST_CACHE_POLICY,
+        lambda: user_service.get_users(skip=skip, limit=limit, after=after, before=before),
+        tags=("users",),
+    )
 
 
 @router.put(
@@ -120,6 +180,39 @@ async def create_post(
     return await post_service.create_post(post_data)
 
 
+@router.post(
+    "/posts:batch",
+    response_model=PostBatchResponse,
+    tags=["posts"],
+    summary="Create, update and delete posts in bulk",
+)
+async def batch_posts(
+    request: PostBatchRequest,
+    post_service: PostService = Depends(lambda: PostService()),
+) -> PostBatchResponse:
+    """Create, update and delete posts in bulk; each item reports its own result."""
+    return await post_service.batch(request)
+
+
+@router.get(
+    "/posts:export",
+    response_class=StreamingResponse,
+    tags=["posts"],
+    summary="Export posts",
+)
+async def export_posts(
+    export_format: ExportFormat = Query("ndjson", alias="format", description="ndjson or csv"),
+    author_id: Optional[str] = Query(None, description="Only export posts by this author"),
+    published: Optional[bool] = Query(None, description="Only export (un)published posts"),
+    post_service: PostService = Depends(lambda: PostService()),
+) -> StreamingResponse:
+    """Stream matching posts, newest first, as NDJSON or CSV."""
+    body = await post_service.export_posts(
+        export_format, author_id=author_id, published=published
+    )
+    return export_response(body, export_format, "posts")
+
+
 @router.get(
     "/posts/{post_id}",
     response_model=PostResponse,
@@ -128,41 +221,75 @@ async def create_post(
 )
 async def get_post(
     post_id: str,
+    request: Request,
     post_service: PostService = Depends(lambda: PostService()),
-) -> PostResponse:
-    """Get a post by ID."""
-    return await post_service.get_post(post_id)
+) -> Response:
+    """Get a post by ID (supports If-None-Match)."""
+    return await cached_response(
+        request,
+        ENTITY_CACHE_POLICY,
+        lambda: post_service.get_post(post_id),
+        tags=lambda post: (f"post:{post_id}", f"user:{post.author_id}"),
+    )
 
 
 @router.get(
     "/posts",
-    response_model=List[PostResponse],
+    response_model=CursorPage[PostResponse],
     tags=["posts"],
     summary="Get all posts",
 )
 async def get_posts(
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    request: Request,
+    skip: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Number of records to skip (offset paging; prefer `after`/`before`)",
+    ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    after: Optional[str] = Query(None, description="Cursor: return the page after this one"),
+    before: Optional[str] = Query(None, description="Cursor: return the page before this one"),
     post_service: PostService = Depends(lambda: PostService()),
-) -> List[PostResponse]:
-    """Get all posts with pagination."""
-    return await post_service.get_posts(skip=skip, limit=limit)
+) -> Response:
+    """Get all posts, newest first, with cursor pagination (supports If-None-Match)."""
+    return await cached_response(
+        request,
+        LIST_CACHE_POLICY,
+        lambda: post_service.get_posts(skip=skip, limit=limit, after=after, before=before),
+        tags=("posts",),
+    )
 
 
 @router.get(
     "/users/{author_id}/posts",
-    response_model=List[PostResponse],
+    response_model=CursorPage[PostResponse],
     tags=["posts"],
     summary="Get posts by author",
 )
 async def get_posts_by_author(
     author_id: str,
-    skip: int = Query(0, ge=0, description="Number of records to skip"),
+    request: Request,
+    skip: int = Query(
+        0,
+        ge=0,
+        deprecated=True,
+        description="Number of records to skip (offset paging; prefer `after`/`before`)",
+    ),
     limit: int = Query(100, ge=1, le=1000, description="Maximum number of records to return"),
+    after: Optional[str] = Query(None, description="Cursor: return the page after this one"),
+    before: Optional[str] = Query(None, description="Cursor: return the page before this one"),
     post_service: PostService = Depends(lambda: PostService()),
-) -> List[PostResponse]:
-    """Get all posts by a specific author with pagination."""
-    return await post_service.get_posts_by_author(author_id, skip=skip, limit=limit)
+) -> Response:
+    """Get all posts by a specific author, newest first (supports If-None-Match)."""
+    return await cached_response(
+        request,
+        LIST_CACHE_POLICY,
+        lambda: post_service.get_posts_by_author(
+            author_id, skip=skip, limit=limit, after=after, before=before
+        ),
+        tags=("posts", f"user:{author_id}"),
+    )
 
 
 @router.put(
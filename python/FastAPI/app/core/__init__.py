@@ -2,5 +2,6 @@
 
 from app.core.config import settings
 from app.core.database import get_db, prisma
+from app.core.security import get_token_claims
 
-__all__ = ["settings", "prisma", "get_db"]
+__all__ = ["settings", "prisma", "get_db", "get_token_claims"]
@@ -0,0 +1,278 @@
+"""Async read-through cache with single-flight loading.
+
+``ReadThroughCache.get_or_load`` returns a cached value when there is one
+and otherwise runs the loader. Concurrent misses for the same key share a
+single loader call (single flight), so a burst of requests for one hot row
+costs one database query instead of one per request.
+
+Two backends are available, selected with ``CACHE_BACKEND``:
+
+- ``memory``: per-process LRU bounded by ``CACHE_MAX_ENTRIES``
+- ``redis``: shared between workers, using ``REDIS_URL``
+- ``none``: caching disabled (single-flight coalescing still applies)
+
+Values are Pydantic models. Entries expire after a per-cache TTL and are
+invalidated explicitly by the service write methods.
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Generic, Optional, Protocol, TypeVar
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+class CacheBackend(Protocol):
+    """Storage used by ``ReadThroughCache``."""
+
+    #: Whether values must be serialized to JSON before being stored
+    serializes: bool
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Return the stored value, or None on a miss."""
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        """Store a value for ``ttl`` seconds."""
+
+    async def delete(self, key: str) -> None:
+        """Remove a value."""
+
+    async def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class NullCacheBackend:
+    """Backend that stores nothing (``CACHE_BACKEND=none``)."""
+
+    serializes = False
+
+    async def get(self, key: str) -> Optional[Any]:
+        return None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        pass
+
+    async def delete(self, key: str) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry expiry."""
+
+    serializes = False
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self.max_entries = max_entries
+        self.evictions = 0
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class RedisCacheBackend:
+    """Redis-backed cache shared by all workers.
+
+    Redis errors are logged and treated as misses so that an unavailable
+    cache degrades to direct database reads instead of failing requests.
+    """
+
+    serializes = True
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self._client: Any = None
+
+    def _get_client(self) -> Any:
+        if self._client is None:
+            from redis import asyncio as redis_asyncio
+
+            self._client = redis_asyncio.Redis.from_url(self.url)
+        return self._client
+
+    async def get(self, key: str) -> Optional[Any]:
+        from redis.exceptions import RedisError
+
+        try:
+            return await self._get_client().get(key)
+        except RedisError:
+            logger.warning("Cache read failed for %s", key, exc_info=True)
+            return None
+
+    async def set(self, key: str, value: Any, ttl: float) -> None:
+        from redis.exceptions import RedisError
+
+        try:
+            await self._get_client().set(key, value, px=int(ttl * 1000))
+        except RedisError:
+            logger.warning("Cache write failed for %s", key, exc_info=True)
+
+    async def delete(self, key: str) -> None:
+        from redis.exceptions import RedisError
+
+        try:
+            await self._get_client().delete(key)
+        except RedisError:
+            logger.warning("Cache delete failed for %s", key, exc_info=True)
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+@dataclass
+class CacheStats:
+    """Counters for a single ``ReadThroughCache``."""
+
+    hits: int = 0
+    misses: int = 0
+    coalesced: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a plain dict."""
+        return asdict(self)
+
+
+class ReadThroughCache(Generic[ModelT]):
+    """
+    Read-through cache for one entity type.
+
+    Args:
+        backend: Storage backend
+        namespace: Key prefix, e.g. ``"user"``
+        model: Pydantic model class of the cached values
+        ttl: Time to live of an entry in seconds
+    """
+
+    def __init__(
+        self, backend: CacheBackend, namespace: str, model: type[ModelT], ttl: float
+    ) -> None:
+        self.backend = backend
+        self.namespace = namespace
+        self.model = model
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._inflight: dict[str, asyncio.Future] = {}
+
+    def _key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Optional[ModelT]]]
+    ) -> Optional[ModelT]:
+        """
+        Return the cached value for ``key``, loading it on a miss.
+
+        Concurrent callers that miss on the same key wait for the first
+        caller's loader instead of running their own; cancelling any one of
+        them, including the first, does not cancel the load for the others.
+        ``None`` results are not cached.
+
+        Args:
+            key: Entity key (e.g. the row ID)
+            loader: Coroutine function that fetches the value from the source
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        cache_key = self._key(key)
+
+        cached = await self.backend.get(cache_key)
+        if cached is not None:
+            self.stats.hits += 1
+            return self.model.model_validate_json(cached) if self.backend.serializes else cached
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            self.stats.coalesced += 1
+            return await asyncio.shield(inflight)
+
+        self.stats.misses += 1
+        # The load runs in its own task so that cancelling the caller that
+        # started it does not cancel the load the other callers are waiting on.
+        task = asyncio.ensure_future(self._load(cache_key, loader))
+        task.add_done_callback(_retrieve_exception)
+        self._inflight[cache_key] = task
+        return await asyncio.shield(task)
+
+    async def _load(
+        self, cache_key: str, loader: Callable[[], Awaitable[Optional[ModelT]]]
+    ) -> Optional[ModelT]:
+        """Run ``loader`` for a miss and store the result."""
+        task = asyncio.current_task()
+        try:
+            value = await loader()
+        finally:
+            # An invalidation that raced with this load has already removed
+            # the entry; in that case the (possibly stale) value is not stored.
+            still_current = self._inflight.get(cache_key) is task
+            if still_current:
+                del self._inflight[cache_key]
+
+        if value is not None and still_current:
+            stored = value.model_dump_json() if self.backend.serializes else value
+            await self.backend.set(cache_key, stored, self.ttl)
+        return value
+
+    async def invalidate(self, key: str) -> None:
+        """Drop ``key`` from the cache and detach any in-flight load."""
+        cache_key = self._key(key)
+        self._inflight.pop(cache_key, None)
+        await self.backend.delete(cache_key)
+        self.stats.invalidations += 1
+
+
+def _retrieve_exception(task: asyncio.Future) -> None:
+    """Mark a failed load as retrieved when every caller has gone away."""
+    if not task.cancelled():
+        task.exception()
+
+
+def create_cache_backend() -> CacheBackend:
+    """Create the backend selected by ``CACHE_BACKEND``."""
+    if settings.CACHE_BACKEND == "memory":
+        return MemoryCacheBackend(max_entries=settings.CACHE_MAX_ENTRIES)
+    if settings.CACHE_BACKEND == "redis":
+        return RedisCacheBackend(settings.REDIS_URL)
+    if settings.CACHE_BACKEND == "none":
+        return NullCacheBackend()
+    raise ValueError(f"Unknown cache backend: {settings.CACHE_BACKEND!r}")
+
+
+# Global cache backend instance
+cache_backend = create_cache_backend()
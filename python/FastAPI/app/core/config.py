@@ -26,6 +26,31 @@ class Settings(BaseSettings):
         default="sqlite:///./app.db",
         description="Database connection URL",
     )
+    DB_POOL_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum connections in the query engine pool (Prisma connection_limit)",
+    )
+    DB_POOL_TIMEOUT_SECONDS: int = Field(
+        default=10,
+        ge=0,
+        description="How long a query waits for a free pooled connection (Prisma pool_timeout)",
+    )
+    DB_CONNECT_TIMEOUT_SECONDS: int = Field(
+        default=5,
+        ge=0,
+        description="Timeout for opening a new database connection (Prisma connect_timeout)",
+    )
+    DB_STATEMENT_TIMEOUT_MS: int = Field(
+        default=30000,
+        ge=0,
+        description="Server-side statement timeout in milliseconds (PostgreSQL); 0 disables it",
+    )
+    DB_POOL_WARMUP_CONNECTIONS: int = Field(
+        default=2,
+        ge=0,
+        description="Connections opened at startup so the first requests do not pay for them",
+    )
 
     # Security
     SECRET_KEY: str = Field(
@@ -37,6 +62,27 @@ class Settings(BaseSettings):
         default=30,
         description="Access token expiration time in minutes",
     )
+    TOKEN_CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        ge=0,
+        description="Verified access tokens kept in memory until their exp (0 disables)",
+    )
+
+    # Password hashing
+    PASSWORD_HASH_EXECUTOR: str = Field(
+        default="thread",
+        description="Where bcrypt runs off the event loop: 'thread' or 'process'",
+    )
+    PASSWORD_HASH_WORKERS: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum number of concurrent bcrypt hash/verify operations",
+    )
+    PASSWORD_HASH_MAX_QUEUE: int = Field(
+        default=0,
+        ge=0,
+        description="Shed login attempts once this many are waiting for a worker (0 = never)",
+    )
 
     # CORS
     # Use Any here so pydantic_settings won't attempt to json-decode complex
@@ -60,6 +106,112 @@ class Settings(BaseSettings):
         description="Redis connection URL",
     )
 
+    # Responses
+    FAST_JSON_RESPONSES: bool = Field(
+        default=True,
+        description="Serialize typed list responses directly instead of re-validating them",
+    )
+
+    # HTTP response cache (ETag bodies shared between clients, invalidated on writes)
+    RESPONSE_CACHE_ENABLED: bool = Field(
+        default=False,
+        description="Keep serialized GET responses in a shared in-memory cache",
+    )
+    RESPONSE_CACHE_MAX_ENTRIES: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of responses kept by the shared response cache",
+    )
+    RESPONSE_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        gt=0,
+        description="Time to live of a shared response cache entry",
+    )
+
+    # GraphQL query limits
+    GRAPHQL_MAX_DEPTH: int = Field(
+        default=10,
+        ge=1,
+        description="Maximum selection depth of a GraphQL operation",
+    )
+    GRAPHQL_MAX_COST: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum estimated cost of a GraphQL operation",
+    )
+    GRAPHQL_DEFAULT_LIST_SIZE: int = Field(
+        default=10,
+        ge=1,
+        description="Assumed size of list fields without a declared multiplier",
+    )
+    GRAPHQL_COST_BUDGET: int = Field(
+        default=5000,
+        ge=1,
+        description="Total estimated cost of GraphQL operations allowed to execute at once",
+    )
+    GRAPHQL_COST_WAIT_SECONDS: float = Field(
+        default=2.0,
+        gt=0,
+        description="How long an operation may wait for cost budget before it is rejected",
+    )
+    GRAPHQL_DOCUMENT_CACHE_SIZE: int = Field(
+        default=1000,
+        ge=1,
+        description="Number of parsed and validated GraphQL documents kept in memory",
+    )
+
+    # GraphQL persisted queries
+    GRAPHQL_PERSISTED_QUERIES_FILE: str = Field(
+        default="",
+        description="JSON manifest of registered operations ({sha256: query}), loaded at startup",
+    )
+    GRAPHQL_PERSISTED_QUERIES_ONLY: bool = Field(
+        default=False,
+        description="Allow-list mode: only execute operations registered in the manifest",
+    )
+    GRAPHQL_APQ_MAX_ENTRIES: int = Field(
+        default=10000,
+        ge=1,
+        description="Number of automatically persisted queries kept in memory",
+    )
+
+    # Batch endpoints
+    BATCH_MAX_ITEMS: int = Field(
+        default=1000,
+        ge=1,
+        description="Maximum number of items accepted by one batch request",
+    )
+    BATCH_CHUNK_SIZE: int = Field(
+        default=200,
+        ge=1,
+        description="Number of rows written per statement/transaction in batch requests",
+    )
+    BATCH_HASH_CONCURRENCY: int = Field(
+        default=2,
+        ge=1,
+        description="Passwords one batch request hashes at a time (keeps the login queue free)",
+    )
+
+    # Export endpoints
+    EXPORT_BATCH_SIZE: int = Field(
+        default=500,
+        ge=1,
+        description="Number of rows fetched per keyset query by the streaming export endpoints",
+    )
+
+    # Cache
+    CACHE_BACKEND: str = Field(
+        default="memory",
+        description="Read-through cache backend: 'memory', 'redis' or 'none'",
+    )
+    CACHE_MAX_ENTRIES: int = Field(
+        default=10000,
+        ge=1,
+        description="Maximum number of entries kept by the in-memory cache backend",
+    )
+    CACHE_USER_TTL_SECONDS: float = Field(default=60.0, gt=0, description="User cache TTL")
+    CACHE_POST_TTL_SECONDS: float = Field(default=30.0, gt=0, description="Post cache TTL")
+
     # Celery (Optional)
     CELERY_BROKER_URL: str = Field(
         default="redis://localhost:6379/0",
@@ -72,6 +224,16 @@ class Settings(BaseSettings):
 
     # Logging
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
+    ACCESS_LOG_SAMPLE_RATE: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=1.0,
+        description="Fraction of requests written to the access log",
+    )
+    ACCESS_LOG_ROUTE_SAMPLE_RATES: dict[str, float] = Field(
+        default_factory=dict,
+        description='Per path-prefix access log sample rates, e.g. {"/health": 0.01}',
+    )
 
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -1,15 +1,84 @@
-"""Database configuration and Prisma client setup."""
+"""Database configuration and Prisma client setup.
+
+Connection pooling happens inside the Prisma query engine and is configured
+through DATABASE_URL parameters. The ``DB_*`` settings are merged into
+PostgreSQL URLs here, so the pool can be tuned without hand-editing the
+URL. Parameters that are already in the URL take precedence.
+
+With the ``metrics`` preview feature enabled (see ``prisma/schema.prisma``),
+the engine reports pool occupancy, pool wait time and query latency
+histograms, which ``/metrics`` publishes.
+
+Repositories hand records to the rest of the app as ``to_row`` dicts, keyed
+by the snake_case names the schemas use (``createdAt`` -> ``created_at``),
+so pagination, response models and GraphQL types all read the same shape.
+"""
+
+import asyncio
+import re
+from datetime import timedelta
+from typing import Any
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
 
 from prisma import Prisma
 
+from app.core.config import settings
+
+_POSTGRES_SCHEMES = ("postgres", "postgresql")
+_CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def build_datasource_url(url: str) -> str:
+    """
+    Add the pool and timeout settings to a PostgreSQL connection URL.
+
+    Args:
+        url: Database URL (other schemes are returned unchanged)
+
+    Returns:
+        URL with ``connection_limit``, ``pool_timeout``, ``connect_timeout``
+        and (if enabled) a ``statement_timeout`` option
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in _POSTGRES_SCHEMES:
+        return url
+
+    params = dict(parse_qsl(parts.query, keep_blank_values=True))
+    params.setdefault("connection_limit", str(settings.DB_POOL_SIZE))
+    params.setdefault("pool_timeout", str(settings.DB_POOL_TIMEOUT_SECONDS))
+    params.setdefault("connect_timeout", str(settings.DB_CONNECT_TIMEOUT_SECONDS))
+    if settings.DB_STATEMENT_TIMEOUT_MS:
+        params.setdefault("options", f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}")
+    return urlunsplit(parts._replace(query=urlencode(params, quote_via=quote)))
+
+
 # Global Prisma client instance
-prisma = Prisma()
+prisma = Prisma(
+    datasource={"url": build_datasource_url(settings.DATABASE_URL)},
+    connect_timeout=timedelta(seconds=settings.DB_CONNECT_TIMEOUT_SECONDS),
+)
+
+
+def to_row(record: Any) -> dict[str, Any]:
+    """
+    Convert a Prisma record to a row keyed by snake_case field names.
+
+    Args:
+        record: Prisma model instance (``firstName``, ``createdAt``, ...)
+
+    Returns:
+        ``record.model_dump()`` with ``first_name``, ``created_at``, ... keys
+    """
+    return {
+        _CAMEL_BOUNDARY.sub("_", key).lower(): value
+        for key, value in record.model_dump().items()
+    }
 
 
 async def get_db() -> Prisma:
     """
     Dependency for getting database connection.
-    
+
     Usage:
         @app.get("/items")
         async def get_items(db: Prisma = Depends(get_db)):
@@ -19,3 +88,41 @@ async def get_db() -> Prisma:
     if not prisma.is_connected():
         await prisma.connect()
     return prisma
+
+
+async def warm_pool(connections: int) -> int:
+    """
+    Open pooled connections ahead of the first requests.
+
+    The engine opens connections lazily, so a burst right after startup
+    would otherwise queue behind connection setup. Overlapping queries make
+    the engine open one connection per query.
+
+    Args:
+        connections: Number of connections to open (capped at DB_POOL_SIZE)
+
+    Returns:
+        The number of warm-up queries that were run
+    """
+    connections = min(connections, settings.DB_POOL_SIZE)
+    if connections <= 0 or urlsplit(settings.DATABASE_URL).scheme not in _POSTGRES_SCHEMES:
+        return 0
+    await asyncio.gather(*(prisma.query_raw("SELECT pg_sleep(0.05)") for _ in range(connections)))
+    return connections
+
+
+async def get_pool_metrics(format: str = "json") -> Any:
+    """
+    Return the query engine metrics.
+
+    Includes ``prisma_pool_connections_{open,busy,idle}``,
+    ``prisma_client_queries_wait`` and the
+    ``prisma_client_queries_{wait,duration}_histogram_ms`` histograms.
+
+    Args:
+        format: ``"json"`` for a ``Metrics`` model, ``"prometheus"`` for text exposition
+
+    Returns:
+        The metrics in the requested format
+    """
+    return await prisma.get_metrics(format=format)
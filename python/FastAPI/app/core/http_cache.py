@@ -0,0 +1,236 @@
+"""HTTP caching for read endpoints: ETags, conditional GET and Cache-Control.
+
+``cached_response`` serves a GET endpoint's model as JSON with:
+
+- a strong ``ETag`` derived from the ``id`` and ``updated_at`` of every row
+  in the response (plus the page cursors for lists). Prisma bumps
+  ``updatedAt`` on every write, so the tag changes whenever the body would.
+- a ``304 Not Modified`` answer when ``If-None-Match`` matches, without
+  serializing the body.
+- the ``Cache-Control`` header of the route's ``CachePolicy``.
+
+With ``RESPONSE_CACHE_ENABLED`` the serialized body and its ETag are also
+kept in a shared in-memory ``ResponseCache``, keyed by path and query
+string, so repeated polls skip the service layer entirely. Entries carry
+tags (``"users"``, ``"user:<id>"``, ...) that the service write methods
+invalidate.
+"""
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Iterable, Optional, TypeVar, Union
+
+from fastapi import Request, Response
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.core.responses import render_json
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+TagsT = Union[Iterable[str], Callable[[BaseModel], Iterable[str]]]
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Cache-Control policy of a route.
+
+    Args:
+        max_age: Seconds a client may reuse a response without revalidating
+            (0 = always revalidate with ``If-None-Match``)
+        private: Forbid shared caches (CDNs, proxies) from storing the response
+        stale_while_revalidate: Seconds a stale response may be served while
+            the client revalidates in the background
+    """
+
+    max_age: int = 0
+    private: bool = True
+    stale_while_revalidate: int = 0
+
+    def header_value(self) -> str:
+        """Render the ``Cache-Control`` header."""
+        directives = ["private" if self.private else "public"]
+        if self.max_age:
+            directives.append(f"max-age={self.max_age}")
+        else:
+            directives.append("no-cache")
+        if self.stale_while_revalidate:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+
+def compute_etag(content: BaseModel) -> str:
+    """
+    Compute a strong ETag from the ``id``/``updated_at`` of the response rows.
+
+    Args:
+        content: A single entity model, or a page with an ``items`` list
+
+    Returns:
+        Quoted ETag value
+    """
+    items = getattr(content, "items", None)
+    rows = items if isinstance(items, list) else [content]
+
+    digest = hashlib.sha256()
+    for row in rows:
+        digest.update(f"{row.id}\x1f{row.updated_at.isoformat()}\x1e".encode("utf-8"))
+    if isinstance(items, list):
+        cursors = (getattr(content, "next_cursor", None), getattr(content, "prev_cursor", None))
+        digest.update(f"{cursors[0]}\x1f{cursors[1]}".encode("utf-8"))
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's ``If-None-Match`` header matches ``etag`` (weak comparison)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized response body and its ETag."""
+
+    etag: str
+    body: bytes
+
+
+# (expires_at, response, tags)
+_CacheEntry = tuple[float, CachedResponse, frozenset[str]]
+
+
+class ResponseCache:
+    """
+    Shared in-memory cache of serialized GET responses.
+
+    Entries are evicted least recently used first, expire after ``ttl``
+    seconds and are dropped by ``invalidate`` when any of their tags is
+    invalidated.
+    """
+
+    def __init__(self, max_entries: int = 1000, ttl: float = 30.0) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._keys_by_tag: dict[str, set[str]] = {}
+        # Bumped by every invalidation; loads that overlap one are not stored
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for ``key``, if any."""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: str, response: CachedResponse, tags: Iterable[str]) -> None:
+        """Store a response under ``key`` with the given invalidation tags."""
+        self._remove(key)
+        tag_set = frozenset(tags)
+        self._entries[key] = (time.monotonic() + self.ttl, response, tag_set)
+        for tag in tag_set:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    def invalidate(self, *tags: str) -> None:
+        """Drop every entry carrying any of ``tags``."""
+        self.generation += 1
+        for tag in tags:
+            for key in self._keys_by_tag.pop(tag, ()):
+                self._remove(key)
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self.generation += 1
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry[2]:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    def stats(self) -> dict[str, int]:
+        """Return cache size and hit/miss/invalidation counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+        }
+
+
+# Global shared response cache (used only when RESPONSE_CACHE_ENABLED)
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl=settings.RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def _headers(etag: str, policy: CachePolicy) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": policy.header_value()}
+
+
+async def cached_response(
+    request: Request,
+    policy: CachePolicy,
+    load: Callable[[], Awaitable[ModelT]],
+    tags: TagsT = (),
+) -> Response:
+    """
+    Serve a GET endpoint's model with ETag, conditional GET and Cache-Control.
+
+    Args:
+        request: The incoming request (for ``If-None-Match`` and the cache key)
+        policy: Cache-Control policy of the route
+        load: Coroutine function returning the response model
+        tags: Invalidation tags for the shared cache, or a function
+            computing them from the loaded model
+
+    Returns:
+        A 304 response when the client's copy is current, otherwise the JSON body
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    cached = response_cache.get(key) if settings.RESPONSE_CACHE_ENABLED else None
+
+    if cached is None:
+        generation = response_cache.generation
+        content = await load()
+        etag = compute_etag(content)
+        if etag_matches(request, etag):
+            return Response(status_code=304, headers=_headers(etag, policy))
+
+        cached = CachedResponse(etag=etag, body=render_json(content))
+        if settings.RESPONSE_CACHE_ENABLED and response_cache.generation == generation:
+            response_cache.set(key, cached, tags(content) if callable(tags) else tags)
+    elif etag_matches(request, cached.etag):
+        return Response(status_code=304, headers=_headers(cached.etag, policy))
+
+    return Response(
+        cached.body, media_type="application/json", headers=_headers(cached.etag, policy)
+    )
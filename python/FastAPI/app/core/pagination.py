@@ -0,0 +1,249 @@
+"""Keyset (cursor) pagination helpers.
+
+Offset paging (``skip``/``take``) makes the database scan and discard every
+skipped row, so deep pages get slower and slower. Keyset paging instead
+remembers the sort key of the last row that was returned and asks for rows
+"after" it, which an index on the sort key answers in constant time.
+
+Cursors are opaque to clients: the sort key values are JSON-encoded,
+base64url-encoded and signed with ``SECRET_KEY`` so they cannot be forged or
+edited to probe arbitrary positions.
+"""
+
+import base64
+import binascii
+import hashlib
+import hmac
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Optional
+
+from app.core.config import settings
+from app.core.database import to_row
+
+_SIGNATURE_BYTES = 16
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a cursor is malformed or its signature does not match."""
+
+
+def _b64encode(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+def _sign(payload: bytes) -> bytes:
+    key = settings.SECRET_KEY.encode("utf-8")
+    return hmac.new(key, payload, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode sort key values into an opaque, signed cursor.
+
+    Args:
+        values: JSON-serializable sort key values (datetimes are ISO-formatted)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps(
+        [v.isoformat() if isinstance(v, datetime) else v for v in values],
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return f"{_b64encode(payload)}.{_b64encode(_sign(payload))}"
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Verify and decode a cursor produced by ``encode_cursor``.
+
+    Args:
+        cursor: Cursor string received from a client
+
+    Returns:
+        The list of sort key values
+
+    Raises:
+        InvalidCursorError: If the cursor is malformed or has been tampered with
+    """
+    try:
+        encoded_payload, encoded_signature = cursor.split(".", 1)
+        payload = _b64decode(encoded_payload)
+        signature = _b64decode(encoded_signature)
+    except (ValueError, binascii.Error) as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+
+    if not hmac.compare_digest(signature, _sign(payload)):
+        raise InvalidCursorError("Invalid cursor signature")
+
+    try:
+        values = json.loads(payload)
+    except ValueError as exc:
+        raise InvalidCursorError("Malformed cursor") from exc
+    if not isinstance(values, list):
+        raise InvalidCursorError("Malformed cursor")
+    return values
+
+
+# ==================== (created_at, id) keyset ====================
+
+@dataclass(frozen=True)
+class Keyset:
+    """Position of a row in ``(created_at DESC, id DESC)`` order."""
+
+    created_at: datetime
+    id: str
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Keyset":
+        """Build the keyset of a repository row (see ``app.core.database.to_row``)."""
+        return cls(created_at=row["created_at"], id=row["id"])
+
+    @classmethod
+    def from_cursor(cls, cursor: str) -> "Keyset":
+        """Decode a cursor produced by ``Keyset.to_cursor``."""
+        values = decode_cursor(cursor)
+        try:
+            created_at, row_id = values
+            return cls(created_at=datetime.fromisoformat(created_at), id=str(row_id))
+        except (TypeError, ValueError) as exc:
+            raise InvalidCursorError("Malformed cursor") from exc
+
+    def to_cursor(self) -> str:
+        """Encode this position as an opaque cursor."""
+        return encode_cursor(self.created_at, self.id)
+
+
+@dataclass
+class KeysetPage:
+    """One page of rows plus the cursors of its neighbouring pages."""
+
+    rows: List[dict]
+    next_cursor: Optional[str] = None
+    prev_cursor: Optional[str] = None
+
+
+def keyset_query(
+    limit: int,
+    after: Optional[Keyset] = None,
+    before: Optional[Keyset] = None,
+    where: Optional[dict] = None,
+) -> dict[str, Any]:
+    """
+    Build ``find_many`` arguments for one keyset page.
+
+    One extra row is requested so the caller can tell whether another page
+    exists. When paging backwards (``before``) the rows come back in
+    ascending order; ``build_keyset_page`` restores the normal order.
+
+    Args:
+        limit: Page size
+        after: Return rows older than this position
+        before: Return rows newer than this position
+        where: Additional Prisma filter to combine with the keyset bound
+
+    Returns:
+        Keyword arguments for ``prisma.<model>.find_many``
+    """
+    conditions = [where] if where else []
+    direction = "desc"
+
+    bound = after or before
+    if bound is not None:
+        op = "lt" if before is None else "gt"
+        conditions.append(
+            {
+                "OR": [
+                    {"createdAt": {op: bound.created_at}},
+                    {"createdAt": bound.created_at, "id": {op: bound.id}},
+                ]
+            }
+        )
+        if before is not None:
+            direction = "asc"
+
+    query: dict[str, Any] = {
+        "take": limit + 1,
+        "order": [{"createdAt": direction}, {"id": direction}],
+    }
+    if len(conditions) == 1:
+        query["where"] = conditions[0]
+    elif conditions:
+        query["where"] = {"AND": conditions}
+    return query
+
+
+def build_keyset_page(
+    rows: List[dict],
+    limit: int,
+    after: Optional[Keyset] = None,
+    before: Optional[Keyset] = None,
+    offset: int = 0,
+) -> KeysetPage:
+    """
+    Turn the rows fetched with ``keyset_query`` into a ``KeysetPage``.
+
+    Args:
+        rows: Rows returned by ``find_many`` (up to ``limit + 1``)
+        limit: Page size
+        after: The ``after`` position the rows were fetched with
+        before: The ``before`` position the rows were fetched with
+        offset: Legacy ``skip`` value the rows were fetched with, if any
+
+    Returns:
+        The page in ``(created_at DESC, id DESC)`` order with its cursors
+    """
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if before is not None:
+        rows.reverse()
+        has_next, has_prev = True, has_more
+    else:
+        has_next, has_prev = has_more, after is not None or offset > 0
+
+    if not rows:
+        return KeysetPage(rows=[])
+    return KeysetPage(
+        rows=rows,
+        next_cursor=Keyset.from_row(rows[-1]).to_cursor() if has_next else None,
+        prev_cursor=Keyset.from_row(rows[0]).to_cursor() if has_prev else None,
+    )
+
+
+async def iter_keyset(
+    find_many: Callable[..., Awaitable[List[Any]]],
+    batch_size: int,
+    where: Optional[dict] = None,
+) -> AsyncIterator[List[dict]]:
+    """
+    Walk every matching row in ``(created_at DESC, id DESC)`` order.
+
+    Each batch is fetched with its own keyset query starting after the last
+    row of the previous batch, so only one batch is held in memory and the
+    cost per batch stays constant however deep the walk goes.
+
+    Args:
+        find_many: ``prisma.<model>.find_many``
+        batch_size: Number of rows fetched per query
+        where: Additional Prisma filter
+
+    Yields:
+        Non-empty lists of ``to_row`` rows
+    """
+    after: Optional[Keyset] = None
+    while True:
+        query = keyset_query(batch_size, after=after, where=where)
+        query["take"] = batch_size  # no look-ahead row needed
+        rows = [to_row(record) for record in await find_many(**query)]
+        if rows:
+            yield rows
+        if len(rows) < batch_size:
+            return
+        after = Keyset.from_row(rows[-1])
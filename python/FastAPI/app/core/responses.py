@@ -0,0 +1,89 @@
+"""Fast JSON response path.
+
+By default a list endpoint handles every row three times: the service
+validates it into a ``UserResponse`` (including e-mail parsing), FastAPI
+runs the page through ``response_model`` and ``jsonable_encoder``
+(producing plain dicts), and ``JSONResponse`` finally walks those dicts
+with ``json.dumps``.
+
+On the fast path:
+
+- ``from_rows`` wraps repository rows (snake_case, see ``to_row``) with
+  ``model_construct``. The rows were validated when they were written, so
+  they are not validated again.
+- ``FastJSONResponse`` serializes Pydantic models straight to bytes with
+  the model's compiled pydantic-core serializer, and everything else with
+  orjson.
+
+Set ``FAST_JSON_RESPONSES=false`` to fall back to the standard FastAPI path.
+"""
+
+from typing import Any, Iterable, List, TypeVar
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from app.core.config import settings
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for values it does not serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def from_rows(model: type[ModelT], rows: Iterable[dict]) -> List[ModelT]:
+    """
+    Build response models from database rows.
+
+    Args:
+        model: Response model class
+        rows: ``to_row`` rows as returned by the repositories (extra keys are dropped)
+
+    Returns:
+        One model per row; validated only when ``FAST_JSON_RESPONSES`` is off
+
+    Raises:
+        ValueError: If the rows lack a required field of ``model``
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return [model(**row) for row in rows]
+    rows = list(rows)
+    if rows:
+        # model_construct fills nothing in, so a row shape mismatch would
+        # otherwise surface as silently missing fields.
+        missing = [
+            name
+            for name, field in model.model_fields.items()
+            if field.is_required() and name not in rows[0]
+        ]
+        if missing:
+            raise ValueError(f"{model.__name__} rows are missing {', '.join(missing)}")
+    return [model.model_construct(**row) for row in rows]
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with pydantic-core (models) or orjson (everything else)."""
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.__pydantic_serializer__.to_json(content)
+        return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+def render_json(content: BaseModel) -> bytes:
+    """
+    Serialize a response model to JSON bytes.
+
+    Uses the compiled pydantic-core serializer when ``FAST_JSON_RESPONSES``
+    is enabled, otherwise FastAPI's standard ``jsonable_encoder`` +
+    ``JSONResponse`` encoding.
+    """
+    if not settings.FAST_JSON_RESPONSES:
+        return JSONResponse(jsonable_encoder(content)).body
+    return content.__pydantic_serializer__.to_json(content)
@@ -1,9 +1,16 @@
 """Security utilities for authentication and authorization."""
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Callable, Optional, TypeVar
 
-from jose import JWTError, jwt
+from fastapi import Depends, HTTPException, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from jose import JWTError, jwk, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
@@ -22,6 +29,161 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+# ==================== Async password hashing ====================
+
+T = TypeVar("T")
+
+
+class PasswordHashBusyError(Exception):
+    """Raised when admission control sheds a request because the hashing queue is full."""
+
+
+class PasswordHasher:
+    """
+    Run bcrypt hashing/verification in a bounded worker pool.
+
+    bcrypt is deliberately slow (roughly 100-300 ms per call). Calling it from
+    an async handler blocks the event loop, and with it every other in-flight
+    request on the worker. This class moves the work to a thread or process
+    pool, caps how many operations run at once and keeps queue-depth metrics.
+
+    When ``max_queue`` is set, calls made with ``sheddable=True`` are rejected
+    with ``PasswordHashBusyError`` once that many callers are already waiting
+    for a worker, instead of queueing behind them.
+    """
+
+    def __init__(self, workers: int = 4, executor: str = "thread", max_queue: int = 0) -> None:
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unknown password hash executor: {executor!r}")
+
+        self.workers = workers
+        self.executor_kind = executor
+        self.max_queue = max_queue
+
+        self._executor: Optional[Executor] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.completed = 0
+        self.rejected = 0
+        self.wait_seconds_total = 0.0
+
+    def _get_executor(self) -> Executor:
+        """Create the worker pool on first use."""
+        if self._executor is None:
+            if self.executor_kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.workers, thread_name_prefix="password-hash"
+                )
+        return self._executor
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Return the concurrency limiter for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.workers)
+            self._loop = loop
+        return self._semaphore
+
+    async def _run(self, func: Callable[..., T], *args: Any, sheddable: bool = False) -> T:
+        """Run ``func(*args)`` in the pool once a concurrency slot is free."""
+        semaphore = self._get_semaphore()
+
+        if sheddable and self.max_queue and self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise PasswordHashBusyError("Password hashing queue is full")
+
+        self.waiting += 1
+        self.peak_waiting = max(self.peak_waiting, self.waiting)
+        start = time.perf_counter()
+        try:
+            await semaphore.acquire()
+        finally:
+            self.waiting -= 1
+        self.wait_seconds_total += time.perf_counter() - start
+
+        self.in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+            semaphore.release()
+
+    async def hash(self, password: str, sheddable: bool = False) -> str:
+        """Hash a password without blocking the event loop."""
+        return await self._run(get_password_hash, password, sheddable=sheddable)
+
+    async def verify(
+        self, plain_password: str, hashed_password: str, sheddable: bool = False
+    ) -> bool:
+        """Verify a password without blocking the event loop."""
+        return await self._run(
+            verify_password, plain_password, hashed_password, sheddable=sheddable
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Return pool configuration and queue-depth counters."""
+        return {
+            "executor": self.executor_kind,
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "in_flight": self.in_flight,
+            "queue_depth": self.waiting,
+            "peak_queue_depth": self.peak_waiting,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "avg_wait_ms": (
+                self.wait_seconds_total / self.completed * 1000 if self.completed else 0.0
+            ),
+        }
+
+    def shutdown(self) -> None:
+        """Shut down the worker pool (it is recreated on next use)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+
+# Global password hasher instance
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    executor=settings.PASSWORD_HASH_EXECUTOR,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Hash a password in the worker pool."""
+    return await password_hasher.hash(password)
+
+
+async def verify_password_async(
+    plain_password: str, hashed_password: str, sheddable: bool = False
+) -> bool:
+    """
+    Verify a password in the worker pool.
+    
+    Args:
+        plain_password: Password supplied by the client
+        hashed_password: Stored bcrypt hash
+        sheddable: Allow admission control to reject the call when the queue is full
+        
+    Returns:
+        True if the password matches
+        
+    Raises:
+        PasswordHashBusyError: If ``sheddable`` and the hashing queue is full
+    """
+    return await password_hasher.verify(plain_password, hashed_password, sheddable=sheddable)
+
+
 def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -46,6 +208,94 @@ def create_access_token(data: dict[str, Any], expires_delta: Optional[timedelta]
     return encoded_jwt
 
 
+# ==================== Access token verification ====================
+
+class TokenVerifier:
+    """
+    Verify JWT access tokens, remembering tokens that already verified.
+
+    Decoding a token means base64/JSON parsing plus an HMAC check on every
+    authenticated request. Clients reuse the same token for many requests,
+    so verified claims are kept in a bounded LRU keyed by the token's
+    SHA-256 digest (raw tokens are never stored). An entry expires at the
+    token's own ``exp``, so a cached token is never accepted past its
+    expiry. Tokens without ``exp`` and invalid tokens are not cached.
+
+    The signing key is built once with ``jwk.construct`` instead of on
+    every ``jwt.decode`` call.
+    """
+
+    def __init__(self, secret_key: str, algorithm: str, max_entries: int = 10000) -> None:
+        self.algorithm = algorithm
+        self.max_entries = max_entries
+        self._key = jwk.construct(secret_key, algorithm)
+        self._algorithms = [algorithm]
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def verify(self, token: str) -> Optional[dict[str, Any]]:
+        """
+        Return the claims of a valid token.
+
+        Args:
+            token: Encoded JWT
+
+        Returns:
+            A copy of the token claims, or None if the token is invalid or expired
+        """
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+        entry = self._entries.get(digest)
+        if entry is not None:
+            expires_at, claims = entry
+            if expires_at > time.time():
+                self._entries.move_to_end(digest)
+                self.hits += 1
+                return dict(claims)
+            del self._entries[digest]
+
+        self.misses += 1
+        try:
+            claims = jwt.decode(token, self._key, algorithms=self._algorithms)
+        except JWTError:
+            return None
+
+        expires_at = claims.get("exp")
+        if (
+            self.max_entries
+            and isinstance(expires_at, (int, float))
+            and expires_at > time.time()
+        ):
+            self._entries[digest] = (float(expires_at), claims)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return dict(claims)
+
+    def clear(self) -> None:
+        """Forget every cached token."""
+        self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return cache size and hit/miss counters."""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+# Global access token verifier instance
+token_verifier = TokenVerifier(
+    settings.SECRET_KEY,
+    settings.ALGORITHM,
+    max_entries=settings.TOKEN_CACHE_MAX_ENTRIES,
+)
+
+
 def decode_access_token(token: str) -> Optional[dict[str, Any]]:
     """
     Decode a JWT access token.
@@ -56,8 +306,31 @@ def decode_access_token(token: str) -> Optional[dict[str, Any]]:
     Returns:
         Decoded token data or None if invalid
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
-    except JWTError:
-        return None
+    return token_verifier.verify(token)
+
+
+_bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_token_claims(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer_scheme),
+) -> dict[str, Any]:
+    """
+    Dependency returning the claims of the request's bearer token.
+    
+    Usage:
+        @app.get("/me")
+        async def me(claims: dict = Depends(get_token_claims)):
+            return {"user_id": claims["sub"]}
+    
+    Raises:
+        HTTPException: 401 if the token is missing, invalid or expired
+    """
+    claims = decode_access_token(credentials.credentials) if credentials else None
+    if claims is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return claims
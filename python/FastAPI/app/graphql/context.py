@@ -0,0 +1,23 @@
+"""GraphQL request context.
+
+``get_context`` is passed to ``GraphQLRouter(context_getter=...)`` so that
+every request gets a fresh context object; resolvers reach it through
+``info.context``.
+"""
+
+from strawberry.fastapi import BaseContext
+
+from app.graphql.dataloaders import DataLoaderRegistry
+
+
+class GraphQLContext(BaseContext):
+    """Context shared by all resolvers of a single GraphQL request."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.loaders = DataLoaderRegistry()
+
+
+async def get_context() -> GraphQLContext:
+    """Build the per-request GraphQL context."""
+    return GraphQLContext()
@@ -0,0 +1,99 @@
+"""Per-request DataLoader registry for GraphQL resolvers.
+
+Resolvers that need a User or Post by ID should go through
+``info.context.loaders`` instead of calling the repositories directly.
+Every ``load()`` issued while resolving one operation is collected into a
+single ``find_many(where={"id": {"in": [...]}})`` and the result is cached
+for the rest of the request, which removes the N+1 pattern on nested fields.
+
+A new registry is created for every request (see ``app.graphql.context``),
+so cached rows never leak between requests or users. Its counters are
+returned in the ``dataloaders`` response extension and added to the
+process-wide ``loader_totals`` reported by ``/cache/stats`` (see
+``app.graphql.extensions.DataLoaderStatsExtension``).
+"""
+
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from strawberry.dataloader import DataLoader
+
+from app.repositories.sample_repository import PostRepository, UserRepository
+
+FetchMany = Callable[[List[str]], Awaitable[List[dict]]]
+
+
+@dataclass
+class LoaderStats:
+    """Counters for a single DataLoader."""
+
+    loads: int = 0
+    batches: int = 0
+    keys: int = 0
+
+    @property
+    def coalesced(self) -> int:
+        """Number of loads that did not need a database round trip of their own."""
+        return self.loads - self.batches
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters (including ``coalesced``) as a plain dict."""
+        return {**asdict(self), "coalesced": self.coalesced}
+
+    def add(self, other: "LoaderStats") -> None:
+        """Add the counters of ``other`` to these."""
+        self.loads += other.loads
+        self.batches += other.batches
+        self.keys += other.keys
+
+
+class RowLoader(DataLoader[str, Optional[dict]]):
+    """DataLoader that batches lookups by ``id`` into one repository call."""
+
+    def __init__(self, fetch_many: FetchMany) -> None:
+        super().__init__(load_fn=self._batch_load)
+        self._fetch_many = fetch_many
+        self.stats = LoaderStats()
+
+    def load(self, key: str) -> Awaitable[Optional[dict]]:
+        """Queue a key for the next batch (or return the cached future)."""
+        self.stats.loads += 1
+        return super().load(key)
+
+    async def _batch_load(self, keys: List[str]) -> List[Optional[dict]]:
+        """Fetch all queued keys at once and return rows in key order."""
+        self.stats.batches += 1
+        self.stats.keys += len(keys)
+
+        rows = await self._fetch_many(list(keys))
+        rows_by_id = {row["id"]: row for row in rows}
+        return [rows_by_id.get(key) for key in keys]
+
+
+class DataLoaderRegistry:
+    """Holds the DataLoaders used while resolving a single request."""
+
+    def __init__(self) -> None:
+        self.users = RowLoader(UserRepository.get_many_by_ids)
+        self.posts = RowLoader(PostRepository.get_many_by_ids)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return load/batch/coalesce counters for every loader."""
+        return {
+            "users": self.users.stats.as_dict(),
+            "posts": self.posts.stats.as_dict(),
+        }
+
+    def record(self) -> None:
+        """Add this request's counters to the process-wide ``loader_totals``."""
+        loader_totals["users"].add(self.users.stats)
+        loader_totals["posts"].add(self.posts.stats)
+
+
+# Counters of every request served by this process
+loader_totals = {"users": LoaderStats(), "posts": LoaderStats()}
+
+
+def loader_stats() -> dict[str, dict[str, int]]:
+    """Return the process-wide load/batch/coalesce counters for every loader."""
+    return {name: stats.as_dict() for name, stats in loader_totals.items()}
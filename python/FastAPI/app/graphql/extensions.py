@@ -0,0 +1,477 @@
+"""Schema extensions: parsed-document cache, query cost analysis and scheduling.
+
+``DocumentCacheExtension`` keeps parsed and validated ``DocumentNode``s in
+an LRU keyed by query text, so repeated operations (in particular persisted
+queries, see ``app.graphql.persisted_queries``) skip parsing and validation.
+Only documents that passed validation are cached; the validation rules are
+fixed per process, so a cached result stays valid.
+
+Before an operation executes, ``QueryCostExtension`` estimates its cost
+from the parsed document:
+
+- every field returning an object costs its declared ``weight`` (default 1)
+  per returned object; scalar and enum fields cost 0 unless declared.
+- list fields multiply the cost of their selection by the expected list
+  size: the value of the argument named by ``multiplier`` (its length when
+  it is a list, e.g. ``ids``), else ``list_size``, else
+  ``GRAPHQL_DEFAULT_LIST_SIZE`` per list level (``[[Sample]]`` counts twice).
+- fragments and every branch of abstract types are summed, so the estimate
+  is an upper bound.
+
+Weights are declared on fields through their metadata::
+
+    @strawberry.field(metadata=cost(multiplier="limit"))
+    def paginated_samples(self, offset: int = 0, limit: int = 10) -> List[Sample]:
+        ...
+
+Operations above ``GRAPHQL_MAX_COST`` are rejected without executing. The
+rest are admitted by ``cost_scheduler``, which lets operations run
+concurrently only while their summed cost fits ``GRAPHQL_COST_BUDGET``;
+expensive operations queue (first in, first out) until capacity frees up
+and are rejected after ``GRAPHQL_COST_WAIT_SECONDS``. The estimate is
+returned in the ``cost`` response extension for capacity planning.
+
+``DataLoaderStatsExtension`` returns the request's DataLoader counters in
+the ``dataloaders`` response extension and adds them to the process-wide
+totals (see ``app.graphql.dataloaders``).
+
+Query depth is limited separately by Strawberry's ``QueryDepthLimiter``
+(see ``app.graphql.schemas.schema``).
+"""
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Iterator, Optional
+
+from graphql import (
+    DocumentNode,
+    FieldNode,
+    FragmentDefinitionNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLList,
+    GraphQLNamedType,
+    GraphQLNonNull,
+    GraphQLObjectType,
+    GraphQLInterfaceType,
+    GraphQLSchema,
+    InlineFragmentNode,
+    SelectionSetNode,
+    Undefined,
+)
+from graphql.utilities import get_operation_ast, value_from_ast_untyped
+from strawberry.extensions import SchemaExtension
+from strawberry.schema.schema_converter import GraphQLCoreConverter
+
+from app.core.config import settings
+from app.graphql.dataloaders import DataLoaderRegistry
+
+COST_METADATA_KEY = "cost"
+
+
+class DocumentCache:
+    """LRU of parsed documents that passed validation, keyed by query text."""
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self.max_entries = max_entries
+        self._documents: OrderedDict[str, DocumentNode] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, query: str) -> Optional[DocumentNode]:
+        """Return the validated document for ``query``, if cached."""
+        document = self._documents.get(query)
+        if document is None:
+            self.misses += 1
+            return None
+        self._documents.move_to_end(query)
+        self.hits += 1
+        return document
+
+    def set(self, query: str, document: DocumentNode) -> None:
+        """Store a validated document."""
+        self._documents[query] = document
+        self._documents.move_to_end(query)
+        while len(self._documents) > self.max_entries:
+            self._documents.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every document."""
+        self._documents.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return cache size and hit/miss counters."""
+        return {"entries": len(self._documents), "hits": self.hits, "misses": self.misses}
+
+
+# Global parsed-document cache shared by all GraphQL operations of the process
+document_cache = DocumentCache(max_entries=settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+
+
+class DocumentCacheExtension(SchemaExtension):
+    """
+    Reuse parsed and validated documents from ``document_cache``.
+
+    Registered as a class so Strawberry creates one instance per operation.
+    """
+
+    def __init__(self, *, execution_context: Any = None) -> None:
+        super().__init__(execution_context=execution_context)
+        self.cached = False
+
+    def on_parse(self) -> Iterator[None]:
+        """Hand a cached document to Strawberry, which then skips parsing."""
+        context = self.execution_context
+        if context.query is not None and context.graphql_document is None:
+            document = document_cache.get(context.query)
+            if document is not None:
+                context.graphql_document = document
+                self.cached = True
+        yield
+
+    def on_validate(self) -> Iterator[None]:
+        """Skip validation of cached documents; cache newly validated ones."""
+        context = self.execution_context
+        if self.cached:
+            # Strawberry only validates while ``errors`` is None
+            context.errors = []
+        yield
+        if not self.cached and not context.errors and context.query is not None:
+            document_cache.set(context.query, context.graphql_document)
+
+
+@dataclass(frozen=True)
+class FieldCost:
+    """
+    Declared cost of a field.
+
+    Args:
+        weight: Cost of each object (or scalar) the field returns
+        multiplier: Name of the argument giving the list size
+            (an int, or a list whose length is used)
+        list_size: Static list size, used when there is no multiplier argument
+    """
+
+    weight: Optional[int] = None
+    multiplier: Optional[str] = None
+    list_size: Optional[int] = None
+
+
+def cost(
+    weight: Optional[int] = None,
+    multiplier: Optional[str] = None,
+    list_size: Optional[int] = None,
+) -> dict[str, FieldCost]:
+    """Build field metadata declaring its cost (see ``FieldCost``)."""
+    return {COST_METADATA_KEY: FieldCost(weight=weight, multiplier=multiplier, list_size=list_size)}
+
+
+class QueryTooExpensiveError(GraphQLError):
+    """Raised when an operation's estimated cost exceeds ``GRAPHQL_MAX_COST``."""
+
+    def __init__(self, requested: int, maximum: int) -> None:
+        super().__init__(
+            f"Query cost {requested} exceeds the maximum allowed cost of {maximum}",
+            extensions={"code": "QUERY_TOO_EXPENSIVE", "cost": requested, "maximumCost": maximum},
+        )
+
+
+class ServerBusyError(GraphQLError):
+    """Raised when an operation could not be scheduled within the wait limit."""
+
+    def __init__(self, requested: int) -> None:
+        super().__init__(
+            "Server is busy, retry the query later",
+            extensions={"code": "SERVER_BUSY", "cost": requested},
+        )
+
+
+def _field_cost(field: GraphQLField) -> FieldCost:
+    definition = field.extensions.get(GraphQLCoreConverter.DEFINITION_BACKREF)
+    metadata = getattr(definition, "metadata", None) or {}
+    return metadata.get(COST_METADATA_KEY) or FieldCost()
+
+
+def _unwrap(type_: Any) -> tuple[GraphQLNamedType, int]:
+    """Return the named type and the number of list levels around it."""
+    lists = 0
+    while isinstance(type_, (GraphQLNonNull, GraphQLList)):
+        if isinstance(type_, GraphQLList):
+            lists += 1
+        type_ = type_.of_type
+    return type_, lists
+
+
+class CostEstimator:
+    """Estimate the cost of one operation of a document."""
+
+    def __init__(
+        self,
+        schema: GraphQLSchema,
+        document: DocumentNode,
+        variables: Optional[dict[str, Any]] = None,
+        default_list_size: int = 10,
+    ) -> None:
+        self.schema = schema
+        self.variables = variables or {}
+        self.default_list_size = default_list_size
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if isinstance(definition, FragmentDefinitionNode)
+        }
+
+    def operation_cost(self, document: DocumentNode, operation_name: Optional[str] = None) -> int:
+        """Return the estimated cost of the selected operation (0 if there is none)."""
+        operation = get_operation_ast(document, operation_name)
+        if operation is None:
+            return 0
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return 0
+        return self.selection_cost(root_type, operation.selection_set, frozenset())
+
+    def selection_cost(
+        self,
+        parent_type: GraphQLNamedType,
+        selection_set: Optional[SelectionSetNode],
+        visited_fragments: frozenset[str],
+    ) -> int:
+        """Sum the cost of every field in a selection set of ``parent_type``."""
+        if selection_set is None:
+            return 0
+
+        total = 0
+        for selection in selection_set.selections:
+            if isinstance(selection, FieldNode):
+                total += self.field_cost(parent_type, selection, visited_fragments)
+            elif isinstance(selection, InlineFragmentNode):
+                fragment_type = parent_type
+                if selection.type_condition is not None:
+                    fragment_type = self.schema.get_type(selection.type_condition.name.value)
+                total += self.selection_cost(fragment_type, selection.selection_set, visited_fragments)
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in visited_fragments:
+                    continue
+                fragment_type = self.schema.get_type(fragment.type_condition.name.value)
+                total += self.selection_cost(
+                    fragment_type, fragment.selection_set, visited_fragments | {name}
+                )
+        return total
+
+    def field_cost(
+        self,
+        parent_type: GraphQLNamedType,
+        node: FieldNode,
+        visited_fragments: frozenset[str],
+    ) -> int:
+        """Cost of one field: weight plus selection, times the expected list size."""
+        name = node.name.value
+        if name.startswith("__") or not isinstance(
+            parent_type, (GraphQLObjectType, GraphQLInterfaceType)
+        ):
+            return 0
+        field = parent_type.fields.get(name)
+        if field is None:
+            return 0
+
+        declared = _field_cost(field)
+        named_type, lists = _unwrap(field.type)
+        is_leaf = node.selection_set is None
+        weight = declared.weight if declared.weight is not None else (0 if is_leaf else 1)
+
+        child_cost = self.selection_cost(named_type, node.selection_set, visited_fragments)
+        return (weight + child_cost) * self.list_size(field, node, declared, lists)
+
+    def list_size(self, field: GraphQLField, node: FieldNode, declared: FieldCost, lists: int) -> int:
+        """Expected number of items returned by a field (1 for non-list fields)."""
+        if declared.multiplier is not None:
+            value = self.argument_value(field, node, declared.multiplier)
+            if isinstance(value, list):
+                return len(value)
+            if isinstance(value, int):
+                return max(value, 0)
+        if not lists:
+            return 1
+        if declared.list_size is not None:
+            return declared.list_size
+        return self.default_list_size**lists
+
+    def argument_value(self, field: GraphQLField, node: FieldNode, name: str) -> Any:
+        """Value of an argument as passed (resolving variables) or its default."""
+        for argument in node.arguments:
+            if argument.name.value == name:
+                return value_from_ast_untyped(argument.value, self.variables)
+        definition = field.args.get(name)
+        if definition is None or definition.default_value is Undefined:
+            return None
+        return definition.default_value
+
+
+class CostScheduler:
+    """
+    Admit operations while their summed cost fits a budget.
+
+    Operations that do not fit wait in arrival order, so a stream of cheap
+    queries cannot starve an expensive one. A single operation never
+    reserves more than the whole budget.
+    """
+
+    def __init__(self, capacity: int, timeout: float) -> None:
+        self.capacity = capacity
+        self.timeout = timeout
+        self.in_flight = 0
+        self._waiters: deque[tuple[int, asyncio.Future[None]]] = deque()
+
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+
+    def _reservation(self, requested: int) -> int:
+        return min(max(requested, 0), self.capacity)
+
+    async def acquire(self, requested: int) -> float:
+        """
+        Reserve ``requested`` cost units, waiting for capacity if needed.
+
+        Returns:
+            Seconds spent waiting
+
+        Raises:
+            ServerBusyError: If capacity did not free up within ``timeout``
+        """
+        units = self._reservation(requested)
+        if not self._waiters and self.in_flight + units <= self.capacity:
+            self.in_flight += units
+            self.admitted += 1
+            return 0.0
+
+        waiter = (units, asyncio.get_running_loop().create_future())
+        self._waiters.append(waiter)
+        self.queued += 1
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(waiter[1], self.timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if waiter[1].done() and not waiter[1].cancelled():
+                # Granted just before the wait was abandoned
+                self.in_flight -= units
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+            self._wake()
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            self.rejected += 1
+            raise ServerBusyError(requested) from None
+        self.admitted += 1
+        return time.perf_counter() - started
+
+    def release(self, requested: int) -> None:
+        """Return the units reserved by ``acquire``."""
+        self.in_flight -= self._reservation(requested)
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            units, future = self._waiters[0]
+            if future.done():
+                self._waiters.popleft()
+                continue
+            if self.in_flight + units > self.capacity:
+                break
+            self._waiters.popleft()
+            self.in_flight += units
+            future.set_result(None)
+
+    def stats(self) -> dict[str, int]:
+        """Return the reserved cost and admission counters."""
+        return {
+            "capacity": self.capacity,
+            "in_flight": self.in_flight,
+            "waiting": len(self._waiters),
+            "admitted": self.admitted,
+            "queued": self.queued,
+            "rejected": self.rejected,
+        }
+
+
+# Global scheduler shared by all GraphQL operations of the process
+cost_scheduler = CostScheduler(
+    capacity=settings.GRAPHQL_COST_BUDGET,
+    timeout=settings.GRAPHQL_COST_WAIT_SECONDS,
+)
+
+
+class QueryCostExtension(SchemaExtension):
+    """
+    Reject or schedule operations by estimated cost.
+
+    Registered as a class so Strawberry creates one instance per operation.
+    """
+
+    def __init__(self, *, execution_context: Any = None) -> None:
+        super().__init__(execution_context=execution_context)
+        self.requested: Optional[int] = None
+        self.queued_seconds = 0.0
+
+    async def on_execute(self) -> AsyncIterator[None]:
+        """Estimate the cost, then hold a scheduler reservation while executing."""
+        context = self.execution_context
+        estimator = CostEstimator(
+            context.schema._schema,
+            context.graphql_document,
+            context.variables,
+            default_list_size=settings.GRAPHQL_DEFAULT_LIST_SIZE,
+        )
+        self.requested = estimator.operation_cost(context.graphql_document, context.operation_name)
+        if self.requested > settings.GRAPHQL_MAX_COST:
+            raise QueryTooExpensiveError(self.requested, settings.GRAPHQL_MAX_COST)
+
+        self.queued_seconds = await cost_scheduler.acquire(self.requested)
+        try:
+            yield
+        finally:
+            cost_scheduler.release(self.requested)
+
+    def get_results(self) -> dict[str, Any]:
+        """Report the estimated cost in the response ``extensions``."""
+        if self.requested is None:
+            return {}
+        return {
+            "cost": {
+                "requested": self.requested,
+                "maximum": settings.GRAPHQL_MAX_COST,
+                "queuedMs": round(self.queued_seconds * 1000, 3),
+            }
+        }
+
+
+class DataLoaderStatsExtension(SchemaExtension):
+    """
+    Report how many loads the request's DataLoaders coalesced.
+
+    Registered as a class so Strawberry creates one instance per operation.
+    """
+
+    def _loaders(self) -> Optional[DataLoaderRegistry]:
+        return getattr(self.execution_context.context, "loaders", None)
+
+    def on_operation(self) -> Iterator[None]:
+        """Add the request's counters to the process-wide totals once it is done."""
+        yield
+        loaders = self._loaders()
+        if loaders is not None:
+            loaders.record()
+
+    def get_results(self) -> dict[str, Any]:
+        """Report the counters in the response ``extensions``."""
+        loaders = self._loaders()
+        if loaders is None:
+            return {}
+        return {"dataloaders": loaders.stats()}
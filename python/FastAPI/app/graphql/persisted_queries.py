@@ -0,0 +1,327 @@
+"""Persisted GraphQL queries.
+
+Clients send ``extensions.persistedQuery.sha256Hash`` instead of the query
+text (Apollo automatic persisted queries protocol, version 1):
+
+1. The client sends only the hash. If the server knows it, the stored text
+   is executed; otherwise the response is a ``PersistedQueryNotFound``
+   error.
+2. On that error the client retries with both the hash and the text; the
+   server checks the hash and stores the text for later requests.
+
+Stored texts are the same ``str`` objects on every request, so the
+parsed-document cache (``app.graphql.extensions.DocumentCacheExtension``)
+finds them without re-hashing the text, and parsing and validation are
+skipped entirely on the hot path.
+
+Operations can also be registered ahead of time in a JSON manifest
+(``{sha256: query}``, see ``GRAPHQL_PERSISTED_QUERIES_FILE``) written by::
+
+    python -m app.graphql.persisted_queries register ../../nest-next/next/src
+
+With ``GRAPHQL_PERSISTED_QUERIES_ONLY`` the server runs only manifest
+operations (allow-list mode) and does not persist new ones.
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Optional, Union
+
+from graphql import GraphQLError, GraphQLSyntaxError, parse, print_ast, validate
+from strawberry.fastapi import GraphQLRouter
+from strawberry.types import ExecutionResult
+
+from app.core.config import settings
+
+APQ_VERSION = 1
+
+
+def query_hash(query: str) -> str:
+    """Return the hex SHA-256 of a query text (the APQ ``sha256Hash``)."""
+    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+
+
+class PersistedQueryError(GraphQLError):
+    """Base class of persisted query errors (answered as GraphQL errors)."""
+
+    code = "PERSISTED_QUERY_ERROR"
+
+    def __init__(self, message: str) -> None:
+        super().__init__(message, extensions={"code": self.code})
+
+
+class PersistedQueryNotFoundError(PersistedQueryError):
+    """The hash is unknown; the client should resend it with the query text."""
+
+    code = "PERSISTED_QUERY_NOT_FOUND"
+
+    def __init__(self) -> None:
+        # Apollo clients match on this exact message
+        super().__init__("PersistedQueryNotFound")
+
+
+class PersistedQueryMismatchError(PersistedQueryError):
+    """The query text does not hash to the ``sha256Hash`` that was sent."""
+
+    code = "PERSISTED_QUERY_HASH_MISMATCH"
+
+    def __init__(self) -> None:
+        super().__init__("provided sha does not match query")
+
+
+class OperationNotAllowedError(PersistedQueryError):
+    """Allow-list mode rejected an operation missing from the manifest."""
+
+    code = "OPERATION_NOT_ALLOWED"
+
+    def __init__(self) -> None:
+        super().__init__("Only registered operations may be executed")
+
+
+class PersistedQueryStore:
+    """
+    Query texts by SHA-256 hash.
+
+    Manifest entries are kept for the lifetime of the process; queries
+    persisted by clients are evicted least recently used first.
+    """
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self.max_entries = max_entries
+        self._registered: dict[str, str] = {}
+        self._persisted: OrderedDict[str, str] = OrderedDict()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, sha256_hash: str, registered_only: bool = False) -> Optional[str]:
+        """Return the stored text for ``sha256_hash``, if any."""
+        query = self._registered.get(sha256_hash)
+        if query is None and not registered_only:
+            query = self._persisted.get(sha256_hash)
+            if query is not None:
+                self._persisted.move_to_end(sha256_hash)
+        if query is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return query
+
+    def persist(self, query: str, sha256_hash: Optional[str] = None) -> str:
+        """
+        Store a client-sent query and return the stored text.
+
+        Raises:
+            PersistedQueryMismatchError: If ``query`` does not hash to ``sha256_hash``
+        """
+        computed = query_hash(query)
+        if sha256_hash is not None and computed != sha256_hash.lower():
+            raise PersistedQueryMismatchError()
+        stored = self._registered.get(computed) or self._persisted.get(computed)
+        if stored is not None:
+            return stored
+        self._persisted[computed] = query
+        while len(self._persisted) > self.max_entries:
+            self._persisted.popitem(last=False)
+        return query
+
+    def register(self, queries: Dict[str, str]) -> int:
+        """
+        Add manifest entries (``{sha256: query}``).
+
+        Raises:
+            PersistedQueryMismatchError: If an entry's text does not match its hash
+        """
+        for sha256_hash, query in queries.items():
+            if query_hash(query) != sha256_hash.lower():
+                raise PersistedQueryMismatchError()
+            self._registered[sha256_hash.lower()] = query
+            self._persisted.pop(sha256_hash.lower(), None)
+        return len(queries)
+
+    def load_manifest(self, path: Union[str, Path]) -> int:
+        """Register every entry of a JSON manifest file and return their count."""
+        with open(path, encoding="utf-8") as manifest:
+            return self.register(json.load(manifest))
+
+    def clear(self) -> None:
+        """Drop every stored query, registered or not."""
+        self._registered.clear()
+        self._persisted.clear()
+
+    def stats(self) -> dict[str, int]:
+        """Return stored query counts and hit/miss counters."""
+        return {
+            "registered": len(self._registered),
+            "persisted": len(self._persisted),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global persisted query store (the manifest is loaded in the app lifespan)
+persisted_query_store = PersistedQueryStore(max_entries=settings.GRAPHQL_APQ_MAX_ENTRIES)
+
+
+def resolve_persisted_query(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Replace the request's query with the stored text of its persisted query.
+
+    Args:
+        data: Decoded GraphQL request (``query``, ``variables``, ``extensions``, ...)
+
+    Returns:
+        The request with ``query`` set to the text to execute
+
+    Raises:
+        PersistedQueryError: If the operation cannot be resolved or is not allowed
+    """
+    if not isinstance(data, dict):
+        return data
+
+    extensions = data.get("extensions")
+    if isinstance(extensions, str):
+        extensions = json.loads(extensions)
+    persisted = extensions.get("persistedQuery") if isinstance(extensions, dict) else None
+    query = data.get("query")
+    allow_list = settings.GRAPHQL_PERSISTED_QUERIES_ONLY
+
+    if not isinstance(persisted, dict) or persisted.get("version") != APQ_VERSION:
+        if allow_list and query is not None:
+            if persisted_query_store.get(query_hash(query), registered_only=True) is None:
+                raise OperationNotAllowedError()
+        return data
+
+    sha256_hash = str(persisted.get("sha256Hash", "")).lower()
+    stored = persisted_query_store.get(sha256_hash, registered_only=allow_list)
+    if stored is not None:
+        if query is not None and query != stored:
+            raise PersistedQueryMismatchError()
+        return {**data, "query": stored}
+    if allow_list:
+        raise OperationNotAllowedError()
+    if query is None:
+        raise PersistedQueryNotFoundError()
+    return {**data, "query": persisted_query_store.persist(query, sha256_hash)}
+
+
+class PersistedQueryRouter(GraphQLRouter):
+    """``GraphQLRouter`` that resolves persisted queries before execution."""
+
+    def should_render_graphql_ide(self, request: Any) -> bool:
+        # Hash-only GET requests carry no ``query`` but are not IDE page loads
+        return super().should_render_graphql_ide(request) and (
+            "extensions" not in request.query_params
+        )
+
+    def parse_json(self, data: Union[str, bytes]) -> Any:
+        return resolve_persisted_query(super().parse_json(data))
+
+    def parse_query_params(self, params: Dict[str, str]) -> Dict[str, Any]:
+        return resolve_persisted_query(super().parse_query_params(params))
+
+    async def execute_operation(self, request: Any, context: Any, root_value: Any) -> Any:
+        try:
+            return await super().execute_operation(request, context, root_value)
+        except PersistedQueryError as exc:
+            return ExecutionResult(data=None, errors=[exc])
+
+
+# --- Registration CLI -------------------------------------------------------
+
+# gql`...` / graphql(`...`) template literals in JS/TS sources
+_TEMPLATE_PATTERN = re.compile(r"(?:\bgql|\bgraphql\()\s*`([^`]*)`")
+_SOURCE_SUFFIXES = {".js", ".jsx", ".ts", ".tsx", ".mjs"}
+_DOCUMENT_SUFFIXES = {".graphql", ".gql"}
+_SKIPPED_DIRECTORIES = {"node_modules", ".next", "dist", "build"}
+
+
+def extract_operations(paths: Iterable[Union[str, Path]]) -> Iterator[tuple[Path, str]]:
+    """
+    Yield ``(file, document text)`` for every GraphQL document under ``paths``.
+
+    Reads ``.graphql``/``.gql`` files and ``gql`` template literals in
+    JS/TS sources. Templates with ``${...}`` interpolations cannot be
+    registered statically and are skipped.
+    """
+    for root in map(Path, paths):
+        files = [root] if root.is_file() else sorted(root.rglob("*"))
+        for file in files:
+            if not file.is_file() or _SKIPPED_DIRECTORIES.intersection(file.parts):
+                continue
+            if file.suffix in _DOCUMENT_SUFFIXES:
+                yield file, file.read_text(encoding="utf-8")
+            elif file.suffix in _SOURCE_SUFFIXES:
+                for match in _TEMPLATE_PATTERN.finditer(file.read_text(encoding="utf-8")):
+                    if "${" not in match.group(1):
+                        yield file, match.group(1)
+
+
+def build_manifest(paths: Iterable[Union[str, Path]]) -> tuple[Dict[str, str], list[str]]:
+    """
+    Parse, validate and hash the operations found under ``paths``.
+
+    Texts are stored as printed by ``print_ast``, which is what Apollo's
+    persisted query link hashes.
+
+    Returns:
+        The manifest and a list of problems (invalid or unparsable documents)
+    """
+    from app.graphql.schemas.schema import graphql_schema
+
+    manifest: Dict[str, str] = {}
+    problems: list[str] = []
+    for file, text in extract_operations(paths):
+        try:
+            document = parse(text)
+        except GraphQLSyntaxError as exc:
+            problems.append(f"{file}: {exc.message}")
+            continue
+        errors = validate(graphql_schema._schema, document)
+        if errors:
+            problems.extend(f"{file}: {error.message}" for error in errors)
+            continue
+        query = print_ast(document)
+        manifest[query_hash(query)] = query
+    return manifest, problems
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m app.graphql.persisted_queries",
+        description="Register GraphQL operations extracted from client sources.",
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+    register = subcommands.add_parser("register", help="Add operations to the manifest")
+    register.add_argument("paths", nargs="+", help="Files or directories to scan")
+    register.add_argument(
+        "--manifest",
+        default=settings.GRAPHQL_PERSISTED_QUERIES_FILE or "persisted-queries.json",
+        help="Manifest file to update (default: GRAPHQL_PERSISTED_QUERIES_FILE)",
+    )
+    register.add_argument(
+        "--strict", action="store_true", help="Fail if any document does not validate"
+    )
+    args = parser.parse_args(argv)
+
+    manifest, problems = build_manifest(args.paths)
+    for problem in problems:
+        print(f"skipped {problem}", file=sys.stderr)
+    if problems and args.strict:
+        return 1
+
+    path = Path(args.manifest)
+    existing = json.loads(path.read_text(encoding="utf-8")) if path.exists() else {}
+    added = len(manifest.keys() - existing.keys())
+    path.write_text(json.dumps({**existing, **manifest}, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"{added} new, {len(existing) + added} total operations in {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,15 +1,16 @@
 # This file contains post-related queries extracted from 'queries.py'.
 # Add the relevant code here.
 
+from typing import Optional
+
 import strawberry
+from strawberry.types import Info
+
+from app.graphql.types import Post
 
-@strawberry.type
-class Post:
-    id: int
-    title: str
-    content: str
 
 @strawberry.field
-def get_post(post_id: int) -> Post:
-    # 実際のロジックをここに記述
-    return Post(id=post_id, title="Sample Title", content="Sample Content")
\ No newline at end of file
+async def get_post(info: Info, post_id: str) -> Optional[Post]:
+    # リクエスト単位の DataLoader 経由で取得（同一リクエスト内の複数取得は1クエリにまとめる）
+    row = await info.context.loaders.posts.load(post_id)
+    return Post.from_row(row) if row else None
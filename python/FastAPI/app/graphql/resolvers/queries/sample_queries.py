@@ -26,6 +26,33 @@
 import strawberry
 from typing import List, Optional
 
+from app.core.pagination import InvalidCursorError, decode_cursor, encode_cursor
+from app.graphql.extensions import cost
+
+# Interface型の定義例
+@strawberry.interface
+class Node:
+    id: int
+
+# サンプルデータ型の定義
+# （スキーマ本体の User 型と名前が衝突しないよう GraphQL 上は SampleUser とする）
+@strawberry.type(name="SampleUser")
+class User:
+    id: int
+    name: str
+
+@strawberry.type
+class Sample(Node):
+    id: int
+    name: str
+    value: int
+    user: Optional[User] = None
+
+@strawberry.type
+class SampleStats:
+    total: int
+    average: float
+
 # --- 追加サンプル: Enum, Union, Interface, Relay風ページネーション、複雑なフィルタ ---
 import enum
 
@@ -35,11 +62,6 @@ class SampleStatus(enum.Enum):
     ACTIVE = "active"
     INACTIVE = "inactive"
 
-# Interface型の定義例
-@strawberry.interface
-class Node:
-    id: int
-
 # Union型の定義例
 @strawberry.type
 class ErrorResult:
@@ -65,24 +87,6 @@ class SampleConnection:
     edges: List[SampleEdge]
     page_info: PageInfo
 
-# サンプルデータ型の定義
-@strawberry.type
-class User:
-    id: int
-    name: str
-
-@strawberry.type
-class Sample:
-    id: int
-    name: str
-    value: int
-    user: Optional[User] = None
-
-@strawberry.type
-class SampleStats:
-    total: int
-    average: float
-
 # サンプル用のクエリ凡例
 @strawberry.type
 class SampleQueries:
@@ -109,18 +113,27 @@ class SampleQueries:
     # Interface型の返却例
     @strawberry.field
     def get_node(self, id: int) -> Node:
-        """Nodeインターフェース型の返却例（SampleはNodeを継承していると仮定）"""
+        """Nodeインターフェース型の返却例（SampleはNodeを実装している）"""
         return Sample(id=id, name="sample", value=100)
 
     # Relay風ページネーション
     @strawberry.field
     def relay_samples(self, first: int = 2, after: Optional[str] = None) -> SampleConnection:
-        """Relay仕様風のページネーション例"""
+        """Relay仕様風のページネーション例（REST API と同じ署名付きカーソルでキーセットページング）"""
         samples = [Sample(id=i, name=f"sample{i}", value=i*10) for i in range(1, 6)]
-        edges = [SampleEdge(node=s, cursor=str(s.id)) for s in samples[:first]]
+        if after is not None:
+            position = decode_cursor(after)
+            # 署名が正しくても位置が int 1 つでなければ改ざん・別種のカーソルとして扱う
+            if len(position) != 1 or type(position[0]) is not int:
+                raise InvalidCursorError("Malformed cursor")
+            last_id = position[0]
+            remaining = [s for s in samples if s.id > last_id]
+        else:
+            remaining = samples
+        edges = [SampleEdge(node=s, cursor=encode_cursor(s.id)) for s in remaining[:first]]
         page_info = PageInfo(
-            has_next_page=len(samples) > first,
-            has_previous_page=False,
+            has_next_page=len(remaining) > first,
+            has_previous_page=len(remaining) < len(samples),
             start_cursor=edges[0].cursor if edges else None,
             end_cursor=edges[-1].cursor if edges else None,
         )
@@ -147,7 +160,8 @@ class SampleQueries:
             [Sample(id=3, name="c", value=30)]
         ]
 
-    @strawberry.field
+    # コスト: ids の件数分のSample
+    @strawberry.field(metadata=cost(multiplier="ids"))
     def get_samples_by_ids(self, ids: List[int]) -> List[Sample]:
         """複数IDでサンプルデータを一括取得"""
         return [Sample(id=i, name=f"sample{i}", value=i*10) for i in ids]
@@ -158,12 +172,14 @@ class SampleQueries:
         """全サンプルデータをリスト取得"""
         return [Sample(id=1, name="a", value=10), Sample(id=2, name="b", value=20)]
 
-    @strawberry.field
+    # コスト: 検索は1件あたり重め（weight=5）
+    @strawberry.field(metadata=cost(weight=5))
     def search_samples(self, keyword: str) -> List[Sample]:
         """キーワードでサンプルデータを検索"""
         return [Sample(id=1, name=keyword, value=999)]
 
-    @strawberry.field
+    # コスト: limit 件分のSample
+    @strawberry.field(metadata=cost(multiplier="limit"))
     def paginated_samples(self, offset: int = 0, limit: int = 10) -> List[Sample]:
         """ページネーション付きでサンプルデータを取得"""
         return [Sample(id=i, name=f"sample{i}", value=i*10) for i in range(offset+1, offset+limit+1)]
@@ -1,15 +1,16 @@
 # This file contains user-related queries extracted from 'queries.py'.
 # Add the relevant code here.
 
+from typing import Optional
+
 import strawberry
+from strawberry.types import Info
+
+from app.graphql.types import User
 
-@strawberry.type
-class User:
-    id: int
-    name: str
-    email: str
 
 @strawberry.field
-def get_user(user_id: int) -> User:
-    # 実際のロジックをここに記述
-    return User(id=user_id, name="Sample User", email="user@example.com")
\ No newline at end of file
+async def get_user(info: Info, user_id: str) -> Optional[User]:
+    # リクエスト単位の DataLoader 経由で取得（同一リクエスト内の複数取得は1クエリにまとめる）
+    row = await info.context.loaders.users.load(user_id)
+    return User.from_row(row) if row else None
@@ -2,9 +2,18 @@
 
 import strawberry
 from graphene import ObjectType, String, Schema
+from strawberry.extensions import QueryDepthLimiter
+
+from app.core.config import settings
+from app.graphql.extensions import (
+    DataLoaderStatsExtension,
+    DocumentCacheExtension,
+    QueryCostExtension,
+)
 from app.graphql.resolvers.mutations.post_mutations import create_post
 from app.graphql.resolvers.mutations.user_mutations import create_user
 from app.graphql.resolvers.queries.post_queries import get_post
+from app.graphql.resolvers.queries.sample_queries import SampleQueries
 from app.graphql.resolvers.queries.user_queries import get_user
 
 # Graphene-based schema
@@ -18,7 +27,7 @@ graphene_schema = Schema(query=GrapheneQuery)
 
 # Strawberry-based schema
 @strawberry.type
-class Query:
+class Query(SampleQueries):
     get_post = get_post
     get_user = get_user
 
@@ -27,4 +36,16 @@ class Mutation:
     create_post = create_post
     create_user = create_user
 
-graphql_schema = strawberry.Schema(query=Query, mutation=Mutation)
+# Depth is checked during validation (skipped for cached documents, which
+# already passed it); cost is estimated (and the operation rejected or
+# queued) right before execution
+graphql_schema = strawberry.Schema(
+    query=Query,
+    mutation=Mutation,
+    extensions=[
+        QueryDepthLimiter(max_depth=settings.GRAPHQL_MAX_DEPTH),
+        DocumentCacheExtension,
+        QueryCostExtension,
+        DataLoaderStatsExtension,
+    ],
+)
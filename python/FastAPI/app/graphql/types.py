@@ -8,6 +8,7 @@ from datetime import datetime
 from typing import Optional
 
 import strawberry
+from strawberry.types import Info
 
 
 # ==================== GraphQL Types ====================
@@ -28,6 +29,20 @@ class User:
     created_at: datetime
     updated_at: datetime
 
+    @classmethod
+    def from_row(cls, row: dict) -> "User":
+        """Build a User from a repository row."""
+        return cls(
+            id=row["id"],
+            email=row["email"],
+            username=row["username"],
+            first_name=row.get("first_name"),
+            last_name=row.get("last_name"),
+            is_active=row["is_active"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
 
 @strawberry.type
 class Post:
@@ -44,6 +59,25 @@ class Post:
     created_at: datetime
     updated_at: datetime
 
+    @strawberry.field
+    async def author(self, info: Info) -> Optional[User]:
+        """投稿者（リクエスト内の DataLoader でまとめて取得）"""
+        row = await info.context.loaders.users.load(self.author_id)
+        return User.from_row(row) if row else None
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Post":
+        """Build a Post from a repository row."""
+        return cls(
+            id=row["id"],
+            title=row["title"],
+            content=row.get("content"),
+            published=row["published"],
+            author_id=row["author_id"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+        )
+
 
 # ==================== Input Types ====================
 
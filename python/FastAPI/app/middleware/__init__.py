@@ -1,6 +1,7 @@
 """Middleware package initialization."""
 
+from app.middleware.access_log_middleware import AccessLogMiddleware
 from app.middleware.logging_middleware import LoggingMiddleware
 from app.middleware.timing_middleware import TimingMiddleware
 
-__all__ = ["LoggingMiddleware", "TimingMiddleware"]
+__all__ = ["AccessLogMiddleware", "LoggingMiddleware", "TimingMiddleware"]
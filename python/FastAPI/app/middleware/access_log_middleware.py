@@ -0,0 +1,106 @@
+"""Pure ASGI middleware for request timing and access logging.
+
+Replaces the ``TimingMiddleware`` + ``LoggingMiddleware`` pair. Both of those
+subclass ``BaseHTTPMiddleware``, which runs the downstream app in a separate
+task and pipes the response through a memory stream; stacking two of them
+pays that cost twice per request and breaks back-pressure for streaming
+responses. This middleware only wraps ``send``, so the response body flows
+straight through.
+"""
+
+import logging
+import random
+import time
+from typing import Mapping, Optional
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger("app.access")
+
+
+class AccessLogMiddleware:
+    """
+    Time every HTTP request and emit a structured access log record.
+
+    Adds ``X-Process-Time`` (seconds) and ``Server-Timing`` (milliseconds)
+    headers measured up to the start of the response. The access log record
+    is written once the last body chunk has been sent.
+
+    Args:
+        app: The ASGI application to wrap
+        sample_rate: Fraction of requests to log (0.0 - 1.0)
+        route_sample_rates: Per path-prefix sample rates; the longest
+            matching prefix wins. Use this to thin out high-RPS routes
+            such as health probes.
+
+    Responses with status >= 500 are always logged regardless of sampling.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        sample_rate: float = 1.0,
+        route_sample_rates: Optional[Mapping[str, float]] = None,
+    ) -> None:
+        self.app = app
+        self.sample_rate = sample_rate
+        self.route_sample_rates = sorted(
+            (route_sample_rates or {}).items(), key=lambda item: len(item[0]), reverse=True
+        )
+
+    def _sample_rate_for(self, path: str) -> float:
+        """Return the sample rate of the longest matching route prefix."""
+        for prefix, rate in self.route_sample_rates:
+            if path.startswith(prefix):
+                return rate
+        return self.sample_rate
+
+    def _should_log(self, path: str, status_code: int) -> bool:
+        """Decide whether this request gets an access log record."""
+        if status_code >= 500:
+            return True
+        rate = self._sample_rate_for(path)
+        return rate >= 1.0 or (rate > 0.0 and random.random() < rate)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Process an ASGI request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_ns = time.perf_counter_ns()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                elapsed_ns = time.perf_counter_ns() - start_ns
+                headers = list(message.get("headers", ()))
+                headers.append((b"x-process-time", f"{elapsed_ns / 1e9:.6f}".encode("latin-1")))
+                headers.append((b"server-timing", f"app;dur={elapsed_ns / 1e6:.3f}".encode("latin-1")))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            path = scope["path"]
+            if self._should_log(path, status_code):
+                method = scope["method"]
+                client = scope.get("client")
+                logger.info(
+                    "%s %s %d %.2fms",
+                    method,
+                    path,
+                    status_code,
+                    duration_ms,
+                    extra={
+                        "http_method": method,
+                        "http_path": path,
+                        "http_status": status_code,
+                        "duration_ms": round(duration_ms, 3),
+                        "client_ip": client[0] if client else None,
+                    },
+                )
@@ -11,7 +11,10 @@ logger = logging.getLogger(__name__)
 
 
 class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for logging HTTP requests and responses."""
+    """Middleware for logging HTTP requests and responses.
+
+    Superseded by ``AccessLogMiddleware``; kept for comparison benchmarks.
+    """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process the request and log details."""
@@ -8,7 +8,10 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 
 class TimingMiddleware(BaseHTTPMiddleware):
-    """Middleware to add X-Process-Time header to responses."""
+    """Middleware to add X-Process-Time header to responses.
+
+    Superseded by ``AccessLogMiddleware``; kept for comparison benchmarks.
+    """
 
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process the request and add timing header."""
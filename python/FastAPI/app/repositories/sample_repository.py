@@ -4,56 +4,122 @@ This file contains sample repository patterns that can be copied
 and modified for your own use cases.
 """
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional, Tuple
+from uuid import uuid4
 
-from app.core.database import prisma
+from app.core.database import prisma, to_row
+from app.core.pagination import (
+    Keyset,
+    KeysetPage,
+    build_keyset_page,
+    iter_keyset,
+    keyset_query,
+)
 from app.schemas.sample_schema import PostCreate, PostUpdate, UserCreate, UserUpdate
 
 
 class UserRepository:
     """Repository for User model."""
     
+    @staticmethod
+    def _create_data(user_data: UserCreate, hashed_password: str) -> dict:
+        """Build the Prisma create payload for a user."""
+        return {
+            "email": user_data.email,
+            "username": user_data.username,
+            "password": hashed_password,
+            "firstName": user_data.first_name,
+            "lastName": user_data.last_name,
+        }
+    
     @staticmethod
     async def create(user_data: UserCreate, hashed_password: str) -> dict:
         """Create a new user."""
         user = await prisma.user.create(
-            data={
-                "email": user_data.email,
-                "username": user_data.username,
-                "password": hashed_password,
-                "firstname": user_data.first_name,
-                "lastname": user_data.last_name,
-            }
+            data=UserRepository._create_data(user_data, hashed_password)
         )
-        return user.model_dump()
+        return to_row(user)
+    
+    @staticmethod
+    async def create_many(users: List[Tuple[UserCreate, str]]) -> List[Optional[dict]]:
+        """Create users in one statement.
+        
+        Takes ``(user_data, hashed_password)`` pairs and returns the inserted
+        rows in input order. Rows that collide with an existing email or
+        username are skipped and come back as None.
+        """
+        data = [
+            {"id": str(uuid4()), **UserRepository._create_data(user_data, hashed_password)}
+            for user_data, hashed_password in users
+        ]
+        await prisma.user.create_many(data=data, skip_duplicates=True)
+        created = await UserRepository.get_many_by_ids([row["id"] for row in data])
+        created_by_id = {row["id"]: row for row in created}
+        return [created_by_id.get(row["id"]) for row in data]
     
     @staticmethod
     async def get_by_id(user_id: str) -> Optional[dict]:
         """Get user by ID."""
         user = await prisma.user.find_unique(where={"id": user_id})
-        return user.model_dump() if user else None
+        return to_row(user) if user else None
+    
+    @staticmethod
+    async def get_many_by_ids(user_ids: List[str]) -> List[dict]:
+        """Get users whose ID is in the given list (single round trip)."""
+        users = await prisma.user.find_many(where={"id": {"in": user_ids}})
+        return [to_row(user) for user in users]
     
     @staticmethod
     async def get_by_email(email: str) -> Optional[dict]:
         """Get user by email."""
         user = await prisma.user.find_unique(where={"email": email})
-        return user.model_dump() if user else None
+        return to_row(user) if user else None
     
     @staticmethod
     async def get_by_username(username: str) -> Optional[dict]:
         """Get user by username."""
         user = await prisma.user.find_unique(where={"username": username})
-        return user.model_dump() if user else None
+        return to_row(user) if user else None
+    
+    @staticmethod
+    async def get_by_emails_or_usernames(emails: List[str], usernames: List[str]) -> List[dict]:
+        """Get users that already use any of the given emails or usernames."""
+        users = await prisma.user.find_many(
+            where={"OR": [{"email": {"in": emails}}, {"username": {"in": usernames}}]}
+        )
+        return [to_row(user) for user in users]
     
     @staticmethod
     async def get_all(skip: int = 0, limit: int = 100) -> List[dict]:
         """Get all users with pagination."""
         users = await prisma.user.find_many(skip=skip, take=limit)
-        return [user.model_dump() for user in users]
+        return [to_row(user) for user in users]
+    
+    @staticmethod
+    async def get_page(
+        limit: int = 100,
+        after: Optional[Keyset] = None,
+        before: Optional[Keyset] = None,
+        skip: int = 0,
+    ) -> KeysetPage:
+        """Get users in (created_at, id) keyset order."""
+        query = keyset_query(limit, after=after, before=before)
+        users = await prisma.user.find_many(skip=skip or None, **query)
+        rows = [to_row(user) for user in users]
+        return build_keyset_page(rows, limit, after=after, before=before, offset=skip)
+    
+    @staticmethod
+    def iter_batches(batch_size: int) -> AsyncIterator[List[dict]]:
+        """Iterate over all users in (created_at, id) keyset order, batch by batch."""
+        return iter_keyset(prisma.user.find_many, batch_size)
     
     @staticmethod
     async def update(user_id: str, user_data: UserUpdate) -> Optional[dict]:
-        """Update a user."""
+        """Update a user.
+        
+        Returns None if the user does not exist. Raises ValueError if
+        ``user_data`` contains no updatable fields.
+        """
         update_data = {}
         
         if user_data.email is not None:
@@ -61,90 +127,182 @@ class UserRepository:
         if user_data.username is not None:
             update_data["username"] = user_data.username
         if user_data.first_name is not None:
-            update_data["firstname"] = user_data.first_name
+            update_data["firstName"] = user_data.first_name
         if user_data.last_name is not None:
-            update_data["lastname"] = user_data.last_name
+            update_data["lastName"] = user_data.last_name
         if user_data.is_active is not None:
-            update_data["isactive"] = user_data.is_active
+            update_data["isActive"] = user_data.is_active
         
         if not update_data:
-            return None
+            raise ValueError("No fields to update")
         
         user = await prisma.user.update(where={"id": user_id}, data=update_data)
-        return user.model_dump() if user else None
+        return to_row(user) if user else None
     
     @staticmethod
     async def delete(user_id: str) -> bool:
-        """Delete a user."""
-        try:
-            await prisma.user.delete(where={"id": user_id})
-            return True
-        except Exception:
-            return False
+        """Delete a user. Returns False if the user does not exist."""
+        user = await prisma.user.delete(where={"id": user_id})
+        return user is not None
+    
+    @staticmethod
+    async def delete_many(user_ids: List[str]) -> int:
+        """Delete users by ID in one statement. Returns the number deleted."""
+        return await prisma.user.delete_many(where={"id": {"in": user_ids}})
 
 
 class PostRepository:
     """Repository for Post model."""
     
+    @staticmethod
+    def _create_data(post_data: PostCreate) -> dict:
+        """Build the Prisma create payload for a post."""
+        return {
+            "title": post_data.title,
+            "content": post_data.content,
+            "published": post_data.published,
+            "authorId": post_data.author_id,
+        }
+    
+    @staticmethod
+    def _update_data(post_data: PostUpdate) -> dict:
+        """Build the Prisma update payload for a post.
+        
+        Raises ValueError if ``post_data`` contains no updatable fields.
+        """
+        update_data = {}
+        
+        if post_data.title is not None:
+            update_data["title"] = post_data.title
+        if post_data.content is not None:
+            update_data["content"] = post_data.content
+        if post_data.published is not None:
+            update_data["published"] = post_data.published
+        
+        if not update_data:
+            raise ValueError("No fields to update")
+        return update_data
+    
     @staticmethod
     async def create(post_data: PostCreate) -> dict:
         """Create a new post."""
-        post = await prisma.post.create(
-            data={
-                "title": post_data.title,
-                "content": post_data.content,
-                "published": post_data.published,
-                "authorid": post_data.author_id,
-            }
-        )
-        return post.model_dump()
+        post = await prisma.post.create(data=PostRepository._create_data(post_data))
+        return to_row(post)
+    
+    @staticmethod
+    async def create_many(posts: List[PostCreate]) -> List[dict]:
+        """Create posts in one statement and return the inserted rows in input order.
+        
+        Authors must already exist (check with ``UserRepository.get_many_by_ids``).
+        """
+        data = [
+            {"id": str(uuid4()), **PostRepository._create_data(post_data)} for post_data in posts
+        ]
+        await prisma.post.create_many(data=data)
+        created = await PostRepository.get_many_by_ids([row["id"] for row in data])
+        created_by_id = {row["id"]: row for row in created}
+        return [created_by_id[row["id"]] for row in data]
     
     @staticmethod
     async def get_by_id(post_id: str) -> Optional[dict]:
         """Get post by ID."""
         post = await prisma.post.find_unique(where={"id": post_id})
-        return post.model_dump() if post else None
+        return to_row(post) if post else None
+    
+    @staticmethod
+    async def get_many_by_ids(post_ids: List[str]) -> List[dict]:
+        """Get posts whose ID is in the given list (single round trip)."""
+        posts = await prisma.post.find_many(where={"id": {"in": post_ids}})
+        return [to_row(post) for post in posts]
+    
+    @staticmethod
+    async def get_ids_by_authors(author_ids: List[str]) -> List[str]:
+        """Get the IDs of every post written by the given authors (single round trip)."""
+        posts = await prisma.post.find_many(where={"authorId": {"in": author_ids}})
+        return [post.id for post in posts]
     
     @staticmethod
     async def get_all(skip: int = 0, limit: int = 100) -> List[dict]:
         """Get all posts with pagination."""
         posts = await prisma.post.find_many(skip=skip, take=limit)
-        return [post.model_dump() for post in posts]
+        return [to_row(post) for post in posts]
     
     @staticmethod
     async def get_by_author(author_id: str, skip: int = 0, limit: int = 100) -> List[dict]:
         """Get posts by author with pagination."""
         posts = await prisma.post.find_many(
-            where={"authorid": author_id}, skip=skip, take=limit
+            where={"authorId": author_id}, skip=skip, take=limit
         )
-        return [post.model_dump() for post in posts]
+        return [to_row(post) for post in posts]
+    
+    @staticmethod
+    async def get_page(
+        limit: int = 100,
+        after: Optional[Keyset] = None,
+        before: Optional[Keyset] = None,
+        skip: int = 0,
+        author_id: Optional[str] = None,
+    ) -> KeysetPage:
+        """Get posts (optionally for one author) in (created_at, id) keyset order."""
+        where = {"authorId": author_id} if author_id is not None else None
+        query = keyset_query(limit, after=after, before=before, where=where)
+        posts = await prisma.post.find_many(skip=skip or None, **query)
+        rows = [to_row(post) for post in posts]
+        return build_keyset_page(rows, limit, after=after, before=before, offset=skip)
+    
+    @staticmethod
+    def iter_batches(
+        batch_size: int,
+        author_id: Optional[str] = None,
+        published: Optional[bool] = None,
+    ) -> AsyncIterator[List[dict]]:
+        """Iterate over matching posts in (created_at, id) keyset order, batch by batch."""
+        where: dict = {}
+        if author_id is not None:
+            where["authorId"] = author_id
+        if published is not None:
+            where["published"] = published
+        return iter_keyset(prisma.post.find_many, batch_size, where=where or None)
     
     @staticmethod
     async def update(post_id: str, post_data: PostUpdate) -> Optional[dict]:
-        """Update a post."""
-        update_data = {}
-        
-        if post_data.title is not None:
-            update_data["title"] = post_data.title
-        if post_data.content is not None:
-            update_data["content"] = post_data.content
-        if post_data.published is not None:
-            update_data["published"] = post_data.published
-        
-        if not update_data:
-            return None
+        """Update a post.
         
+        Returns None if the post does not exist. Raises ValueError if
+        ``post_data`` contains no updatable fields.
+        """
+        update_data = PostRepository._update_data(post_data)
         post = await prisma.post.update(where={"id": post_id}, data=update_data)
-        return post.model_dump() if post else None
+        return to_row(post) if post else None
+    
+    @staticmethod
+    async def update_many(updates: List[Tuple[str, PostUpdate]]) -> List[Optional[dict]]:
+        """Apply per-post updates in one transaction.
+        
+        Takes ``(post_id, post_data)`` pairs and returns the updated rows in
+        input order (None for a post deleted right after the update). Every
+        update must contain at least one field. If any post does not exist
+        the transaction is rolled back and ``RecordNotFoundError`` is raised.
+        """
+        async with prisma.batch_() as batcher:
+            for post_id, post_data in updates:
+                batcher.post.update(
+                    where={"id": post_id}, data=PostRepository._update_data(post_data)
+                )
+        updated = await PostRepository.get_many_by_ids([post_id for post_id, _ in updates])
+        updated_by_id = {row["id"]: row for row in updated}
+        return [updated_by_id.get(post_id) for post_id, _ in updates]
     
     @staticmethod
     async def delete(post_id: str) -> bool:
-        """Delete a post."""
-        try:
-            await prisma.post.delete(where={"id": post_id})
-            return True
-        except Exception:
-            return False
+        """Delete a post. Returns False if the post does not exist."""
+        post = await prisma.post.delete(where={"id": post_id})
+        return post is not None
+    
+    @staticmethod
+    async def delete_many(post_ids: List[str]) -> int:
+        """Delete posts by ID in one statement. Returns the number deleted."""
+        return await prisma.post.delete_many(where={"id": {"in": post_ids}})
 
 
 class SampleRepository:
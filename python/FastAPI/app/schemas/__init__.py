@@ -1,9 +1,16 @@
 """Pydantic models/schemas package initialization."""
 
 from app.schemas.sample_schema import (
+    BatchItemResult,
+    CursorPage,
+    PostBatchRequest,
+    PostBatchResponse,
+    PostBatchUpdate,
     PostCreate,
     PostResponse,
     PostUpdate,
+    UserBatchRequest,
+    UserBatchResponse,
     UserCreate,
     UserResponse,
     UserUpdate,
@@ -16,4 +23,11 @@ __all__ = [
     "PostCreate",
     "PostUpdate",
     "PostResponse",
+    "CursorPage",
+    "BatchItemResult",
+    "UserBatchRequest",
+    "UserBatchResponse",
+    "PostBatchUpdate",
+    "PostBatchRequest",
+    "PostBatchResponse",
 ]
@@ -5,7 +5,7 @@ for your own use cases.
 """
 
 from datetime import datetime
-from typing import Optional
+from typing import Generic, List, Optional, TypeVar
 
 from pydantic import BaseModel, EmailStr, Field
 
@@ -86,6 +86,21 @@ class PostResponse(PostBase):
 
 # ==================== Generic Response Schemas ====================
 
+ItemT = TypeVar("ItemT")
+
+
+class CursorPage(BaseModel, Generic[ItemT]):
+    """One page of a keyset-paginated list."""
+    
+    items: List[ItemT] = Field(..., description="Items on this page")
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as `after` to fetch the next page (null on the last page)"
+    )
+    prev_cursor: Optional[str] = Field(
+        None, description="Pass as `before` to fetch the previous page (null on the first page)"
+    )
+
+
 class MessageResponse(BaseModel):
     """Generic message response schema."""
     
@@ -97,3 +112,51 @@ class ErrorResponse(BaseModel):
     
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Error details")
+
+
+# ==================== Batch Schemas ====================
+
+class PostBatchUpdate(PostUpdate):
+    """A single update inside a post batch."""
+    
+    id: str = Field(..., description="Post ID")
+
+
+class UserBatchRequest(BaseModel):
+    """Bulk user operations, applied in order: create, delete."""
+    
+    create: List[UserCreate] = Field(default_factory=list, description="Users to create")
+    delete: List[str] = Field(default_factory=list, description="IDs of users to delete")
+
+
+class PostBatchRequest(BaseModel):
+    """Bulk post operations, applied in order: create, update, delete."""
+    
+    create: List[PostCreate] = Field(default_factory=list, description="Posts to create")
+    update: List[PostBatchUpdate] = Field(default_factory=list, description="Posts to update")
+    delete: List[str] = Field(default_factory=list, description="IDs of posts to delete")
+
+
+class BatchItemResult(BaseModel, Generic[ItemT]):
+    """Outcome of one item of a batch request."""
+    
+    index: int = Field(..., description="Position of the item in its request list")
+    id: Optional[str] = Field(None, description="ID of the affected row")
+    ok: bool = Field(..., description="Whether the item was applied")
+    item: Optional[ItemT] = Field(None, description="Resulting row (create/update only)")
+    error: Optional[str] = Field(None, description="Why the item was not applied")
+
+
+class UserBatchResponse(BaseModel):
+    """Per-item results of a user batch."""
+    
+    created: List[BatchItemResult[UserResponse]] = Field(default_factory=list)
+    deleted: List[BatchItemResult[UserResponse]] = Field(default_factory=list)
+
+
+class PostBatchResponse(BaseModel):
+    """Per-item results of a post batch."""
+    
+    created: List[BatchItemResult[PostResponse]] = Field(default_factory=list)
+    updated: List[BatchItemResult[PostResponse]] = Field(default_factory=list)
+    deleted: List[BatchItemResult[PostResponse]] = Field(default_factory=list)
@@ -4,20 +4,117 @@ This file contains sample service patterns that can be copied
 and modified for your own use cases.
 """
 
-from typing import List, Optional
+import asyncio
+from typing import AsyncIterator, Iterator, List, Optional, Sequence, Tuple, TypeVar
 
 from fastapi import HTTPException, status
+from prisma.errors import ForeignKeyViolationError, RecordNotFoundError, UniqueViolationError
 
-from app.core.security import get_password_hash, verify_password
+from app.core.cache import ReadThroughCache, cache_backend
+from app.core.config import settings
+from app.core.http_cache import response_cache
+from app.core.pagination import InvalidCursorError, Keyset
+from app.core.responses import from_rows
+from app.core.security import (
+    PasswordHashBusyError,
+    get_password_hash_async,
+    verify_password_async,
+)
 from app.repositories.sample_repository import PostRepository, UserRepository
 from app.schemas.sample_schema import (
+    BatchItemResult,
+    CursorPage,
+    PostBatchRequest,
+    PostBatchResponse,
+    PostBatchUpdate,
     PostCreate,
     PostResponse,
     PostUpdate,
+    UserBatchRequest,
+    UserBatchResponse,
     UserCreate,
     UserResponse,
     UserUpdate,
 )
+from app.utils.export import ExportFormat, encode_export
+
+# Read-through caches for single-entity reads (invalidated by the write methods)
+user_cache: ReadThroughCache[UserResponse] = ReadThroughCache(
+    cache_backend, "user", UserResponse, ttl=settings.CACHE_USER_TTL_SECONDS
+)
+post_cache: ReadThroughCache[PostResponse] = ReadThroughCache(
+    cache_backend, "post", PostResponse, ttl=settings.CACHE_POST_TTL_SECONDS
+)
+
+
+def _parse_cursors(
+    after: Optional[str], before: Optional[str], skip: int
+) -> Tuple[Optional[Keyset], Optional[Keyset]]:
+    """Decode the `after`/`before` cursors of a list request."""
+    if after is not None and before is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Only one of 'after' and 'before' may be given",
+        )
+    if skip and (after is not None or before is not None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'skip' cannot be combined with 'after' or 'before'",
+        )
+    try:
+        return (
+            Keyset.from_cursor(after) if after is not None else None,
+            Keyset.from_cursor(before) if before is not None else None,
+        )
+    except InvalidCursorError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
+# Messages for unique constraint violations, keyed by column name
+_UNIQUE_FIELD_DETAILS = {
+    "email": "Email already registered",
+    "username": "Username already taken",
+}
+
+
+def _unique_violation(exc: UniqueViolationError) -> HTTPException:
+    """Map a unique constraint violation to the matching 400 response."""
+    target = (exc.meta or {}).get("target") or ""
+    fields = target if isinstance(target, (list, tuple)) else [target]
+    for field, detail in _UNIQUE_FIELD_DETAILS.items():
+        if any(field in str(name) for name in fields):
+            return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Already exists")
+
+
+T = TypeVar("T")
+
+
+def _check_batch_size(count: int) -> None:
+    """Reject batch requests larger than BATCH_MAX_ITEMS."""
+    if count > settings.BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Batch requests are limited to {settings.BATCH_MAX_ITEMS} items",
+        )
+
+
+def _chunks(items: Sequence[T]) -> Iterator[Tuple[int, Sequence[T]]]:
+    """Split batch items into (offset, chunk) pairs of BATCH_CHUNK_SIZE."""
+    size = settings.BATCH_CHUNK_SIZE
+    for offset in range(0, len(items), size):
+        yield offset, items[offset:offset + size]
+
+
+async def _evict_posts(post_ids: Sequence[str]) -> None:
+    """Drop deleted posts from the post cache and the response cache."""
+    for post_id in post_ids:
+        await post_cache.invalidate(post_id)
+    if post_ids:
+        response_cache.invalidate(*(f"post:{post_id}" for post_id in post_ids))
 
 
 class UserService:
@@ -25,95 +122,100 @@ class UserService:
     
     def __init__(self) -> None:
         self.repository = UserRepository()
+        self.post_repository = PostRepository()
     
     async def create_user(self, user_data: UserCreate) -> UserResponse:
         """Create a new user."""
-        # Check if user already exists
-        existing_user = await self.repository.get_by_email(user_data.email)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
-        
-        existing_user = await self.repository.get_by_username(user_data.username)
-        if existing_user:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Username already taken",
-            )
-        
         # Hash password
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await get_password_hash_async(user_data.password)
         
-        # Create user
-        user = await self.repository.create(user_data, hashed_password)
+        # Create user (email/username uniqueness is enforced by the database)
+        try:
+            user = await self.repository.create(user_data, hashed_password)
+        except UniqueViolationError as exc:
+            raise _unique_violation(exc)
+        response_cache.invalidate("users")
         return UserResponse(**user)
     
     async def get_user(self, user_id: str) -> UserResponse:
-        """Get user by ID."""
-        user = await self.repository.get_by_id(user_id)
-        if not user:
+        """Get user by ID (served from the read-through cache)."""
+        user = await user_cache.get_or_load(user_id, lambda: self._load_user(user_id))
+        if user is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
-        return UserResponse(**user)
+        return user
+    
+    async def _load_user(self, user_id: str) -> Optional[UserResponse]:
+        """Load a user from the database for the cache."""
+        user = await self.repository.get_by_id(user_id)
+        return UserResponse(**user) if user else None
+    
+    async def get_users(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> CursorPage[UserResponse]:
+        """Get one page of users (newest first) with keyset pagination."""
+        after_key, before_key = _parse_cursors(after, before, skip)
+        page = await self.repository.get_page(
+            limit=limit, after=after_key, before=before_key, skip=skip
+        )
+        return CursorPage[UserResponse](
+            items=from_rows(UserResponse, page.rows),
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
     
-    async def get_users(self, skip: int = 0, limit: int = 100) -> List[UserResponse]:
-        """Get all users with pagination."""
-        users = await self.repository.get_all(skip=skip, limit=limit)
-        return [UserResponse(**user) for user in users]
+    def export_users(self, export_format: ExportFormat) -> AsyncIterator[bytes]:
+        """Stream all users (newest first) encoded as NDJSON or CSV."""
+        batches = (
+            [UserResponse(**user) for user in rows]
+            async for rows in self.repository.iter_batches(settings.EXPORT_BATCH_SIZE)
+        )
+        return encode_export(batches, UserResponse, export_format)
     
     async def update_user(self, user_id: str, user_data: UserUpdate) -> UserResponse:
         """Update a user."""
-        # Check if user exists
-        existing_user = await self.repository.get_by_id(user_id)
-        if not existing_user:
+        # Update user (existence and email/username uniqueness are checked by the database)
+        try:
+            user = await self.repository.update(user_id, user_data)
+        except ValueError:
             raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="User not found",
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="No fields to update",
             )
-        
-        # Check email uniqueness if updating email
-        if user_data.email:
-            email_user = await self.repository.get_by_email(user_data.email)
-            if email_user and email_user["id"] != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Email already registered",
-                )
-        
-        # Check username uniqueness if updating username
-        if user_data.username:
-            username_user = await self.repository.get_by_username(user_data.username)
-            if username_user and username_user["id"] != user_id:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Username already taken",
-                )
-        
-        # Update user
-        user = await self.repository.update(user_id, user_data)
+        except UniqueViolationError as exc:
+            raise _unique_violation(exc)
         if not user:
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No fields to update",
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="User not found",
             )
         
+        await user_cache.invalidate(user_id)
+        response_cache.invalidate("users", f"user:{user_id}")
         return UserResponse(**user)
     
     async def delete_user(self, user_id: str) -> bool:
         """Delete a user."""
-        # Check if user exists
-        existing_user = await self.repository.get_by_id(user_id)
-        if not existing_user:
+        # Posts are deleted with their author (ON DELETE CASCADE); remember
+        # them so their cache entries can be evicted once the delete succeeds
+        post_ids = await self.post_repository.get_ids_by_authors([user_id])
+        deleted = await self.repository.delete(user_id)
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="User not found",
             )
         
-        return await self.repository.delete(user_id)
+        await user_cache.invalidate(user_id)
+        await _evict_posts(post_ids)
+        response_cache.invalidate("users", "posts", f"user:{user_id}")
+        return True
     
     async def authenticate_user(self, email: str, password: str) -> Optional[UserResponse]:
         """Authenticate a user."""
@@ -121,10 +223,112 @@ class UserService:
         if not user:
             return None
         
-        if not verify_password(password, user["password"]):
+        try:
+            verified = await verify_password_async(password, user["password"], sheddable=True)
+        except PasswordHashBusyError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many login attempts in progress, try again shortly",
+                headers={"Retry-After": "1"},
+            )
+        if not verified:
             return None
         
         return UserResponse(**user)
+    
+    async def batch(self, request: UserBatchRequest) -> UserBatchResponse:
+        """Create and delete users in bulk, reporting the outcome per item."""
+        _check_batch_size(len(request.create) + len(request.delete))
+        response = UserBatchResponse()
+        for offset, chunk in _chunks(request.create):
+            response.created += await self._create_chunk(chunk, offset)
+        for offset, chunk in _chunks(request.delete):
+            response.deleted += await self._delete_chunk(chunk, offset)
+        return response
+    
+    async def _create_chunk(
+        self, chunk: Sequence[UserCreate], offset: int
+    ) -> List[BatchItemResult[UserResponse]]:
+        """Create one chunk of users with a single insert."""
+        existing = await self.repository.get_by_emails_or_usernames(
+            [user_data.email for user_data in chunk],
+            [user_data.username for user_data in chunk],
+        )
+        taken_emails = {user["email"] for user in existing}
+        taken_usernames = {user["username"] for user in existing}
+        
+        results: dict[int, BatchItemResult[UserResponse]] = {}
+        to_create: List[Tuple[int, UserCreate]] = []
+        for index, user_data in enumerate(chunk, start=offset):
+            if user_data.email in taken_emails:
+                results[index] = BatchItemResult(
+                    index=index, ok=False, error="Email already registered"
+                )
+            elif user_data.username in taken_usernames:
+                results[index] = BatchItemResult(
+                    index=index, ok=False, error="Username already taken"
+                )
+            else:
+                taken_emails.add(user_data.email)
+                taken_usernames.add(user_data.username)
+                to_create.append((index, user_data))
+        
+        if to_create:
+            # Hash in the worker pool, but only BATCH_HASH_CONCURRENCY at a time so
+            # one batch cannot fill the queue that logins are shed against
+            limit = asyncio.Semaphore(settings.BATCH_HASH_CONCURRENCY)
+            
+            async def hash_password(password: str) -> str:
+                async with limit:
+                    return await get_password_hash_async(password)
+            
+            hashed_passwords = await asyncio.gather(
+                *(hash_password(user_data.password) for _, user_data in to_create)
+            )
+            rows = await self.repository.create_many(
+                [(user_data, hashed) for (_, user_data), hashed in zip(to_create, hashed_passwords)]
+            )
+            response_cache.invalidate("users")
+            for (index, _), row in zip(to_create, rows):
+                if row is None:
+                    # Lost a race with a concurrent insert of the same email/username
+                    results[index] = BatchItemResult(
+                        index=index, ok=False, error="Email or username already taken"
+                    )
+                else:
+                    results[index] = BatchItemResult(
+                        index=index, id=row["id"], ok=True, item=UserResponse(**row)
+                    )
+        
+        return [results[index] for index in sorted(results)]
+    
+    async def _delete_chunk(
+        self, user_ids: Sequence[str], offset: int
+    ) -> List[BatchItemResult[UserResponse]]:
+        """Delete one chunk of users with a single delete."""
+        existing = {user["id"] for user in await self.repository.get_many_by_ids(list(user_ids))}
+        if existing:
+            # Cascade-deleted posts (see delete_user)
+            post_ids = await self.post_repository.get_ids_by_authors(list(existing))
+            await self.repository.delete_many(list(existing))
+            for user_id in existing:
+                await user_cache.invalidate(user_id)
+            await _evict_posts(post_ids)
+            response_cache.invalidate(
+                "users", "posts", *(f"user:{user_id}" for user_id in existing)
+            )
+        
+        results: List[BatchItemResult[UserResponse]] = []
+        for index, user_id in enumerate(user_ids, start=offset):
+            if user_id in existing:
+                results.append(BatchItemResult(index=index, id=user_id, ok=True))
+                # A repeated ID is deleted once; later occurrences find nothing
+                existing.discard(user_id)
+            else:
+                results.append(
+                    BatchItemResult(index=index, id=user_id, ok=False, error="User not found")
+                )
+        return results
 
 
 class PostService:
@@ -136,76 +340,252 @@ class PostService:
     
     async def create_post(self, post_data: PostCreate) -> PostResponse:
         """Create a new post."""
-        # Check if author exists
-        author = await self.user_repository.get_by_id(post_data.author_id)
-        if not author:
+        # Create post (the author foreign key is checked by the database)
+        try:
+            post = await self.repository.create(post_data)
+        except ForeignKeyViolationError:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Author not found",
             )
-        
-        # Create post
-        post = await self.repository.create(post_data)
+        response_cache.invalidate("posts")
         return PostResponse(**post)
     
     async def get_post(self, post_id: str) -> PostResponse:
-        """Get post by ID."""
-        post = await self.repository.get_by_id(post_id)
-        if not post:
+        """Get post by ID (served from the read-through cache)."""
+        post = await post_cache.get_or_load(post_id, lambda: self._load_post(post_id))
+        if post is None:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post not found",
             )
-        return PostResponse(**post)
+        return post
+    
+    async def _load_post(self, post_id: str) -> Optional[PostResponse]:
+        """Load a post from the database for the cache."""
+        post = await self.repository.get_by_id(post_id)
+        return PostResponse(**post) if post else None
     
-    async def get_posts(self, skip: int = 0, limit: int = 100) -> List[PostResponse]:
-        """Get all posts with pagination."""
-        posts = await self.repository.get_all(skip=skip, limit=limit)
-        return [PostResponse(**post) for post in posts]
+    async def get_posts(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> CursorPage[PostResponse]:
+        """Get one page of posts (newest first) with keyset pagination."""
+        after_key, before_key = _parse_cursors(after, before, skip)
+        page = await self.repository.get_page(
+            limit=limit, after=after_key, before=before_key, skip=skip
+        )
+        return CursorPage[PostResponse](
+            items=from_rows(PostResponse, page.rows),
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
     
     async def get_posts_by_author(
-        self, author_id: str, skip: int = 0, limit: int = 100
-    ) -> List[PostResponse]:
-        """Get posts by author with pagination."""
-        # Check if author exists
-        author = await self.user_repository.get_by_id(author_id)
+        self,
+        author_id: str,
+        skip: int = 0,
+        limit: int = 100,
+        after: Optional[str] = None,
+        before: Optional[str] = None,
+    ) -> CursorPage[PostResponse]:
+        """Get one page of an author's posts (newest first) with keyset pagination."""
+        after_key, before_key = _parse_cursors(after, before, skip)
+        # The author check and the page query are independent, so run them together
+        author, page = await asyncio.gather(
+            self.user_repository.get_by_id(author_id),
+            self.repository.get_page(
+                limit=limit, after=after_key, before=before_key, skip=skip, author_id=author_id
+            ),
+        )
         if not author:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Author not found",
             )
         
-        posts = await self.repository.get_by_author(author_id, skip=skip, limit=limit)
-        return [PostResponse(**post) for post in posts]
+        return CursorPage[PostResponse](
+            items=from_rows(PostResponse, page.rows),
+            next_cursor=page.next_cursor,
+            prev_cursor=page.prev_cursor,
+        )
     
-    async def update_post(self, post_id: str, post_data: PostUpdate) -> PostResponse:
-        """Update a post."""
-        # Check if post exists
-        existing_post = await self.repository.get_by_id(post_id)
-        if not existing_post:
+    async def export_posts(
+        self,
+        export_format: ExportFormat,
+        author_id: Optional[str] = None,
+        published: Optional[bool] = None,
+    ) -> AsyncIterator[bytes]:
+        """Stream matching posts (newest first) encoded as NDJSON or CSV.
+        
+        The author is checked up front so that an unknown author is a 404
+        rather than an empty download.
+        """
+        if author_id is not None and not await self.user_repository.get_by_id(author_id):
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
-                detail="Post not found",
+                detail="Author not found",
             )
         
-        # Update post
-        post = await self.repository.update(post_id, post_data)
-        if not post:
+        batches = (
+            [PostResponse(**post) for post in rows]
+            async for rows in self.repository.iter_batches(
+                settings.EXPORT_BATCH_SIZE, author_id=author_id, published=published
+            )
+        )
+        return encode_export(batches, PostResponse, export_format)
+    
+    async def update_post(self, post_id: str, post_data: PostUpdate) -> PostResponse:
+        """Update a post."""
+        # Update post (a missing post comes back as None, no pre-check needed)
+        try:
+            post = await self.repository.update(post_id, post_data)
+        except ValueError:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="No fields to update",
             )
+        if not post:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Post not found",
+            )
         
+        await post_cache.invalidate(post_id)
+        response_cache.invalidate("posts", f"post:{post_id}")
         return PostResponse(**post)
     
     async def delete_post(self, post_id: str) -> bool:
         """Delete a post."""
-        # Check if post exists
-        existing_post = await self.repository.get_by_id(post_id)
-        if not existing_post:
+        deleted = await self.repository.delete(post_id)
+        if not deleted:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Post not found",
             )
         
-        return await self.repository.delete(post_id)
+        await post_cache.invalidate(post_id)
+        response_cache.invalidate("posts", f"post:{post_id}")
+        return True
+    
+    async def batch(self, request: PostBatchRequest) -> PostBatchResponse:
+        """Create, update and delete posts in bulk, reporting the outcome per item."""
+        _check_batch_size(len(request.create) + len(request.update) + len(request.delete))
+        response = PostBatchResponse()
+        for offset, chunk in _chunks(request.create):
+            response.created += await self._create_chunk(chunk, offset)
+        for offset, chunk in _chunks(request.update):
+            response.updated += await self._update_chunk(chunk, offset)
+        for offset, chunk in _chunks(request.delete):
+            response.deleted += await self._delete_chunk(chunk, offset)
+        return response
+    
+    async def _create_chunk(
+        self, chunk: Sequence[PostCreate], offset: int
+    ) -> List[BatchItemResult[PostResponse]]:
+        """Create one chunk of posts with a single insert."""
+        author_ids = list({post_data.author_id for post_data in chunk})
+        authors = {user["id"] for user in await self.user_repository.get_many_by_ids(author_ids)}
+        
+        results: dict[int, BatchItemResult[PostResponse]] = {}
+        to_create: List[Tuple[int, PostCreate]] = []
+        for index, post_data in enumerate(chunk, start=offset):
+            if post_data.author_id in authors:
+                to_create.append((index, post_data))
+            else:
+                results[index] = BatchItemResult(index=index, ok=False, error="Author not found")
+        
+        if to_create:
+            try:
+                rows = await self.repository.create_many([post_data for _, post_data in to_create])
+            except ForeignKeyViolationError:
+                # An author was deleted between the check and the insert
+                rows = None
+            else:
+                response_cache.invalidate("posts")
+            for position, (index, _) in enumerate(to_create):
+                if rows is None:
+                    results[index] = BatchItemResult(
+                        index=index, ok=False, error="Author not found"
+                    )
+                else:
+                    row = rows[position]
+                    results[index] = BatchItemResult(
+                        index=index, id=row["id"], ok=True, item=PostResponse(**row)
+                    )
+        
+        return [results[index] for index in sorted(results)]
+    
+    async def _update_chunk(
+        self, chunk: Sequence[PostBatchUpdate], offset: int
+    ) -> List[BatchItemResult[PostResponse]]:
+        """Apply one chunk of post updates in a single transaction."""
+        existing = {
+            post["id"]
+            for post in await self.repository.get_many_by_ids([update.id for update in chunk])
+        }
+        
+        results: dict[int, BatchItemResult[PostResponse]] = {}
+        to_update: List[Tuple[int, PostBatchUpdate]] = []
+        for index, update in enumerate(chunk, start=offset):
+            if update.id not in existing:
+                results[index] = BatchItemResult(
+                    index=index, id=update.id, ok=False, error="Post not found"
+                )
+            elif not update.model_dump(exclude={"id"}, exclude_none=True):
+                results[index] = BatchItemResult(
+                    index=index, id=update.id, ok=False, error="No fields to update"
+                )
+            else:
+                to_update.append((index, update))
+        
+        if to_update:
+            updates = [
+                (update.id, PostUpdate(**update.model_dump(exclude={"id"})))
+                for _, update in to_update
+            ]
+            try:
+                rows = await self.repository.update_many(updates)
+            except RecordNotFoundError:
+                # A post was deleted between the check and the update, which rolled
+                # back the transaction; apply the updates one by one instead
+                rows = [await self.repository.update(post_id, data) for post_id, data in updates]
+            response_cache.invalidate("posts", *(f"post:{update.id}" for _, update in to_update))
+            for (index, update), row in zip(to_update, rows):
+                await post_cache.invalidate(update.id)
+                if row is None:
+                    results[index] = BatchItemResult(
+                        index=index, id=update.id, ok=False, error="Post not found"
+                    )
+                else:
+                    results[index] = BatchItemResult(
+                        index=index, id=update.id, ok=True, item=PostResponse(**row)
+                    )
+        
+        return [results[index] for index in sorted(results)]
+    
+    async def _delete_chunk(
+        self, post_ids: Sequence[str], offset: int
+    ) -> List[BatchItemResult[PostResponse]]:
+        """Delete one chunk of posts with a single delete."""
+        existing = {post["id"] for post in await self.repository.get_many_by_ids(list(post_ids))}
+        if existing:
+            await self.repository.delete_many(list(existing))
+            for post_id in existing:
+                await post_cache.invalidate(post_id)
+            response_cache.invalidate("posts", *(f"post:{post_id}" for post_id in existing))
+        
+        results: List[BatchItemResult[PostResponse]] = []
+        for index, post_id in enumerate(post_ids, start=offset):
+            if post_id in existing:
+                results.append(BatchItemResult(index=index, id=post_id, ok=True))
+                # A repeated ID is deleted once; later occurrences find nothing
+                existing.discard(post_id)
+            else:
+                results.append(
+                    BatchItemResult(index=index, id=post_id, ok=False, error="Post not found")
+                )
+        return results
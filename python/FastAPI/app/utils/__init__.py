@@ -1,5 +1,14 @@
 """Utils package initialization."""
 
-from app.utils.helpers import get_utc_now, sanitize_dict, setup_logging
+from app.utils.export import ExportFormat, encode_export, export_response
+from app.utils.helpers import get_utc_now, sanitize_dict, setup_logging, setup_queue_logging
 
-__all__ = ["get_utc_now", "setup_logging", "sanitize_dict"]
+__all__ = [
+    "ExportFormat",
+    "encode_export",
+    "export_response",
+    "get_utc_now",
+    "setup_logging",
+    "setup_queue_logging",
+    "sanitize_dict",
+]
@@ -0,0 +1,75 @@
+"""Streaming export encoders.
+
+The export endpoints walk a table batch by batch and encode each batch as
+soon as it arrives, so memory use is bounded by the batch size rather than
+the table size. ``StreamingResponse`` awaits every chunk being sent before
+asking for the next one, which stops the database walk while a slow client
+catches up.
+"""
+
+import csv
+import io
+from typing import AsyncIterable, AsyncIterator, Iterable, Literal
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+ExportFormat = Literal["ndjson", "csv"]
+
+EXPORT_MEDIA_TYPES: dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+
+async def encode_ndjson(batches: AsyncIterable[Iterable[BaseModel]]) -> AsyncIterator[bytes]:
+    """Encode batches of models as newline-delimited JSON, one chunk per batch."""
+    async for batch in batches:
+        yield b"".join(item.model_dump_json().encode("utf-8") + b"\n" for item in batch)
+
+
+async def encode_csv(
+    batches: AsyncIterable[Iterable[BaseModel]], model: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """Encode batches of models as CSV with a header row, one chunk per batch."""
+    columns = list(model.model_fields)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore")
+    writer.writeheader()
+    yield buffer.getvalue().encode("utf-8")
+
+    async for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(item.model_dump(mode="json") for item in batch)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def encode_export(
+    batches: AsyncIterable[Iterable[BaseModel]], model: type[BaseModel], export_format: ExportFormat
+) -> AsyncIterator[bytes]:
+    """Encode batches of ``model`` instances in the requested format."""
+    if export_format == "csv":
+        return encode_csv(batches, model)
+    return encode_ndjson(batches)
+
+
+def export_response(
+    body: AsyncIterator[bytes], export_format: ExportFormat, filename: str
+) -> StreamingResponse:
+    """
+    Wrap an encoded export in a download response.
+
+    Args:
+        body: Chunks produced by ``encode_export``
+        export_format: Format the chunks are encoded in
+        filename: Download file name without extension
+
+    Returns:
+        Streaming response with the matching media type
+    """
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'},
+    )
@@ -1,7 +1,9 @@
 """Utility functions for the application."""
 
 import logging
+import queue
 from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 
 
@@ -24,6 +26,42 @@ def setup_logging(log_level: str = "INFO") -> None:
     )
 
 
+def setup_queue_logging(logger_name: str, log_level: str = "INFO") -> QueueListener:
+    """
+    Route a logger through an in-memory queue so callers never block on I/O.
+    
+    The logger's handlers (or the root handlers if it has none) are moved to
+    a background ``QueueListener`` thread; the logger itself only enqueues
+    records.
+    
+    Args:
+        logger_name: Name of the logger to make non-blocking
+        log_level: Logging level for that logger
+        
+    Returns:
+        The started listener; call ``stop()`` on shutdown to flush it
+    """
+    target = logging.getLogger(logger_name)
+    handlers = target.handlers or logging.getLogger().handlers
+    if not handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S",
+            )
+        )
+        handlers = [handler]
+    
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    target.handlers = [QueueHandler(log_queue)]
+    target.setLevel(getattr(logging, log_level.upper()))
+    target.propagate = False
+    listener.start()
+    return listener
+
+
 def sanitize_dict(data: dict[str, Any], remove_keys: Optional[list[str]] = None) -> dict[str, Any]:
     """
     Remove sensitive keys from dictionary.
@@ -0,0 +1,108 @@
+"""Microbenchmark: AccessLogMiddleware vs. the BaseHTTPMiddleware stack.
+
+Drives a minimal Starlette app directly through the ASGI interface (no
+network, no HTTP client) so the numbers reflect middleware overhead only.
+
+Usage:
+    python -m benchmarks.bench_middleware [--requests 20000]
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+from typing import Callable
+
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+from starlette.types import ASGIApp, Message
+
+from app.middleware.access_log_middleware import AccessLogMiddleware
+from app.middleware.logging_middleware import LoggingMiddleware
+from app.middleware.timing_middleware import TimingMiddleware
+from app.utils.helpers import setup_queue_logging
+
+
+async def endpoint(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+def build_app(middleware: list[Middleware]) -> ASGIApp:
+    return Starlette(routes=[Route("/bench", endpoint)], middleware=middleware)
+
+
+STACKS: dict[str, Callable[[], ASGIApp]] = {
+    "no middleware": lambda: build_app([]),
+    "Timing + Logging (BaseHTTPMiddleware)": lambda: build_app(
+        [Middleware(LoggingMiddleware), Middleware(TimingMiddleware)]
+    ),
+    "AccessLogMiddleware (pure ASGI)": lambda: build_app([Middleware(AccessLogMiddleware)]),
+}
+
+
+async def run(app: ASGIApp, requests: int) -> list[float]:
+    """Send ``requests`` GET requests and return per-request latency in µs."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/bench",
+        "raw_path": b"/bench",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        pass
+
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter_ns()
+        await app(dict(scope), receive, send)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    return samples
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main(requests: int) -> None:
+    # Send every access log record to /dev/null: the legacy stack logs
+    # synchronously, the new middleware goes through a queue listener.
+    devnull = open(os.devnull, "w")
+    logging.basicConfig(level=logging.INFO, stream=devnull)
+    listener = setup_queue_logging("app.access", "INFO")
+
+    print(f"{'stack':<40} {'mean µs':>9} {'p50 µs':>9} {'p99 µs':>9}")
+    for name, factory in STACKS.items():
+        app = factory()
+        await run(app, min(1000, requests))  # warm-up
+        samples = await run(app, requests)
+        print(
+            f"{name:<40} {statistics.fmean(samples):>9.1f} "
+            f"{percentile(samples, 50):>9.1f} {percentile(samples, 99):>9.1f}"
+        )
+
+    listener.stop()
+    devnull.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20000)
+    asyncio.run(main(parser.parse_args().requests))
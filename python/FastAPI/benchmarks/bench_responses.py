@@ -0,0 +1,153 @@
+"""Microbenchmark: 1000-row list response, standard path vs. fast JSON path.
+
+The endpoint builds a ``CursorPage[UserResponse]`` from 1000 row dicts the
+same way ``UserService.get_users`` does and returns it from an app whose
+default response class matches the path. It is run twice:
+
+- ``FAST_JSON_RESPONSES=false``: rows validated into models,
+  ``response_model`` processing, ``JSONResponse``
+- ``FAST_JSON_RESPONSES=true``: ``from_rows`` (no re-validation),
+  ``FastJSONResponse`` (pydantic-core serializer straight to bytes)
+
+Requests are driven through the ASGI interface directly, so the numbers
+cover routing, validation and serialization only. Peak memory is measured
+with tracemalloc in a separate pass so it does not skew the latencies.
+
+Usage:
+    python -m benchmarks.bench_responses [--requests 100] [--rows 1000]
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Message
+
+from app.core.config import settings
+from app.core.responses import FastJSONResponse, from_rows
+from app.schemas.sample_schema import CursorPage, UserResponse
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_rows(count: int) -> list[dict]:
+    return [
+        {
+            "id": f"user-{i:06d}",
+            "email": f"user{i}@example.com",
+            "username": f"user{i}",
+            "first_name": "Test",
+            "last_name": None,
+            "password": "$2b$12$" + "x" * 53,
+            "is_active": True,
+            "created_at": NOW,
+            "updated_at": NOW,
+        }
+        for i in range(count)
+    ]
+
+
+def build_app(rows: list[dict], response_class: type) -> ASGIApp:
+    app = FastAPI(default_response_class=response_class)
+
+    @app.get("/users", response_model=CursorPage[UserResponse])
+    async def get_users() -> Any:
+        return CursorPage[UserResponse](items=from_rows(UserResponse, rows), next_cursor="next")
+
+    return app
+
+
+# name -> (FAST_JSON_RESPONSES, default response class)
+PATHS: dict[str, tuple[bool, type]] = {
+    "before (FAST_JSON_RESPONSES=false)": (False, JSONResponse),
+    "after (FAST_JSON_RESPONSES=true)": (True, FastJSONResponse),
+}
+
+
+async def request(app: ASGIApp) -> int:
+    """Send one GET /users and return the response body size."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/users",
+        "raw_path": b"/users",
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("bench", 80),
+    }
+    size = 0
+
+    async def receive() -> Message:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: Message) -> None:
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return size
+
+
+async def latencies(app: ASGIApp, requests: int) -> list[float]:
+    """Per-request latency in µs."""
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter_ns()
+        await request(app)
+        samples.append((time.perf_counter_ns() - start) / 1000)
+    return samples
+
+
+async def peak_memory(app: ASGIApp, requests: int) -> float:
+    """Mean tracemalloc peak per request in KiB."""
+    peaks = []
+    tracemalloc.start()
+    for _ in range(requests):
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        await request(app)
+        peaks.append((tracemalloc.get_traced_memory()[1] - baseline) / 1024)
+    tracemalloc.stop()
+    return statistics.fmean(peaks)
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main(requests: int, rows: int) -> None:
+    data = make_rows(rows)
+    print(f"{rows} rows per response")
+    print(f"{'path':<36} {'p50 µs':>9} {'p99 µs':>9} {'peak KiB':>9} {'bytes':>8}")
+    for name, (fast, response_class) in PATHS.items():
+        settings.FAST_JSON_RESPONSES = fast
+        app = build_app(data, response_class)
+        size = await request(app)
+        await latencies(app, min(50, requests))  # warm-up
+        samples = await latencies(app, requests)
+        peak = await peak_memory(app, min(50, requests))
+        print(
+            f"{name:<36} {percentile(samples, 50):>9.0f} {percentile(samples, 99):>9.0f} "
+            f"{peak:>9.0f} {size:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=100)
+    parser.add_argument("--rows", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rows))
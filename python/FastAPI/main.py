@@ -5,28 +5,43 @@ from typing import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from strawberry.fastapi import GraphQLRouter
 
 from app.api import api_router
+from app.api.metrics import router as metrics_router
+from app.core.cache import cache_backend
 from app.core.config import settings
-from app.core.database import prisma
+from app.core.database import prisma, warm_pool
+from app.core.responses import FastJSONResponse
+from app.core.security import password_hasher
+from app.graphql.context import get_context
+from app.graphql.persisted_queries import PersistedQueryRouter, persisted_query_store
 from app.graphql.schemas.schema import graphql_schema
-from app.middleware.logging_middleware import LoggingMiddleware
-from app.middleware.timing_middleware import TimingMiddleware
+from app.middleware.access_log_middleware import AccessLogMiddleware
+from app.utils.helpers import setup_queue_logging
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager for startup and shutdown events."""
     # Startup
+    access_log_listener = setup_queue_logging("app.access", settings.LOG_LEVEL)
     await prisma.connect()
     print("✅ Database connected")
+    warmed = await warm_pool(settings.DB_POOL_WARMUP_CONNECTIONS)
+    if warmed:
+        print(f"✅ Database pool warmed with {warmed} connections")
+    if settings.GRAPHQL_PERSISTED_QUERIES_FILE:
+        registered = persisted_query_store.load_manifest(settings.GRAPHQL_PERSISTED_QUERIES_FILE)
+        print(f"✅ {registered} persisted GraphQL operations registered")
     
     yield
     
     # Shutdown
+    password_hasher.shutdown()
+    await cache_backend.close()
     await prisma.disconnect()
     print("❌ Database disconnected")
+    access_log_listener.stop()
 
 
 # Create FastAPI application
@@ -38,6 +53,7 @@ app = FastAPI(
     redoc_url="/redoc" if settings.DEBUG else None,
     openapi_url="/openapi.json" if settings.DEBUG else None,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
 )
 
 # CORS Middleware
@@ -50,14 +66,20 @@ app.add_middleware(
 )
 
 # Custom Middlewares
-app.add_middleware(TimingMiddleware)
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(
+    AccessLogMiddleware,
+    sample_rate=settings.ACCESS_LOG_SAMPLE_RATE,
+    route_sample_rates=settings.ACCESS_LOG_ROUTE_SAMPLE_RATES,
+)
 
 # Include REST API routes
 app.include_router(api_router, prefix="/api")
 
-# Include GraphQL endpoint
-graphql_app = GraphQLRouter(graphql_schema)
+# Include metrics endpoint (Prometheus scrape target)
+app.include_router(metrics_router)
+
+# Include GraphQL endpoint (resolves persisted queries before execution)
+graphql_app = PersistedQueryRouter(graphql_schema, context_getter=get_context)
 app.include_router(graphql_app, prefix="/graphql")
 
 
@@ -0,0 +1,61 @@
+"""Tests for the pure ASGI access log middleware."""
+
+import logging
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from app.middleware.access_log_middleware import AccessLogMiddleware
+
+
+async def ok(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("ok")
+
+
+async def boom(request: Request) -> PlainTextResponse:
+    return PlainTextResponse("boom", status_code=503)
+
+
+def build_app(**options: object) -> Starlette:
+    return Starlette(
+        routes=[Route("/ok", ok), Route("/health", ok), Route("/boom", boom)],
+        middleware=[Middleware(AccessLogMiddleware, **options)],
+    )
+
+
+@pytest.mark.asyncio
+async def test_timing_headers_and_log_record(caplog: pytest.LogCaptureFixture) -> None:
+    """Responses carry timing headers and produce one structured record."""
+    transport = ASGITransport(app=build_app())
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get("/ok")
+
+    assert response.status_code == 200
+    assert float(response.headers["x-process-time"]) >= 0
+    assert response.headers["server-timing"].startswith("app;dur=")
+
+    [record] = caplog.records
+    assert record.http_method == "GET"
+    assert record.http_path == "/ok"
+    assert record.http_status == 200
+
+
+@pytest.mark.asyncio
+async def test_route_sampling_keeps_server_errors(caplog: pytest.LogCaptureFixture) -> None:
+    """Sampled-out routes are skipped, but 5xx responses are always logged."""
+    app = build_app(route_sample_rates={"/health": 0.0, "/boom": 0.0})
+    transport = ASGITransport(app=app)
+    with caplog.at_level(logging.INFO, logger="app.access"):
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            for _ in range(5):
+                await client.get("/health")
+            await client.get("/ok")
+            await client.get("/boom")
+
+    assert [record.http_path for record in caplog.records] == ["/ok", "/boom"]
@@ -0,0 +1,338 @@
+"""Tests for the bulk user/post batch endpoints' service layer."""
+
+import asyncio
+import re
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, List, Optional, Tuple
+
+import pytest
+from fastapi import HTTPException
+from prisma.errors import RecordNotFoundError
+
+import app.repositories.sample_repository as repository_module
+import app.services.sample_service as service_module
+from app.core.config import settings
+from app.repositories.sample_repository import PostRepository, UserRepository
+from app.schemas.sample_schema import (
+    PostBatchRequest,
+    PostBatchUpdate,
+    PostCreate,
+    PostUpdate,
+    UserBatchRequest,
+    UserCreate,
+    UserUpdate,
+)
+from app.services.sample_service import PostService, UserService
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class MemoryRepository:
+    """In-memory repository that counts round trips per method."""
+
+    def __init__(self, rows: Optional[List[dict]] = None) -> None:
+        self.rows = {row["id"]: row for row in rows or []}
+        self.calls: List[str] = []
+
+    async def get_many_by_ids(self, ids: List[str]) -> List[dict]:
+        self.calls.append("get_many_by_ids")
+        return [self.rows[row_id] for row_id in ids if row_id in self.rows]
+
+    async def get_by_emails_or_usernames(self, emails: List[str], usernames: List[str]) -> List[dict]:
+        self.calls.append("get_by_emails_or_usernames")
+        return [
+            row for row in self.rows.values()
+            if row["email"] in emails or row["username"] in usernames
+        ]
+
+    async def delete_many(self, ids: List[str]) -> int:
+        self.calls.append("delete_many")
+        for row_id in ids:
+            del self.rows[row_id]
+        return len(ids)
+
+
+class MemoryUserRepository(MemoryRepository):
+    async def create_many(self, users: List[Tuple[UserCreate, str]]) -> List[Optional[dict]]:
+        self.calls.append("create_many")
+        created = []
+        for user_data, _ in users:
+            row = make_user(f"u{len(self.rows) + 1}", user_data.username)
+            self.rows[row["id"]] = row
+            created.append(row)
+        return created
+
+
+class MemoryPostRepository(MemoryRepository):
+    async def get_ids_by_authors(self, author_ids: List[str]) -> List[str]:
+        self.calls.append("get_ids_by_authors")
+        return [row["id"] for row in self.rows.values() if row["author_id"] in author_ids]
+
+    async def create_many(self, posts: List[PostCreate]) -> List[dict]:
+        self.calls.append("create_many")
+        created = []
+        for post_data in posts:
+            row = make_post(f"p{len(self.rows) + 1}", post_data.author_id, post_data.title)
+            self.rows[row["id"]] = row
+            created.append(row)
+        return created
+
+    async def update_many(self, updates: List[Tuple[str, PostUpdate]]) -> List[Optional[dict]]:
+        self.calls.append("update_many")
+        if any(post_id not in self.rows for post_id, _ in updates):
+            raise RecordNotFoundError({"user_facing_error": {"message": "not found"}})
+        for post_id, post_data in updates:
+            self.rows[post_id].update(post_data.model_dump(exclude_none=True))
+        return [self.rows[post_id] for post_id, _ in updates]
+
+    async def update(self, post_id: str, post_data: PostUpdate) -> Optional[dict]:
+        self.calls.append("update")
+        if post_id not in self.rows:
+            return None
+        self.rows[post_id].update(post_data.model_dump(exclude_none=True))
+        return self.rows[post_id]
+
+
+def make_user(user_id: str, username: str) -> dict:
+    """Build a user row as returned by the repository."""
+    return {
+        "id": user_id,
+        "email": f"{username}@example.com",
+        "username": username,
+        "is_active": True,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+def make_post(post_id: str, author_id: str, title: str = "Title") -> dict:
+    """Build a post row as returned by the repository."""
+    return {
+        "id": post_id,
+        "title": title,
+        "published": False,
+        "author_id": author_id,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+def new_user(username: str) -> UserCreate:
+    return UserCreate(email=f"{username}@example.com", username=username, password="password123")
+
+
+@pytest.fixture(autouse=True)
+def fast_hashing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Skip bcrypt; the batch logic only needs some hash value."""
+
+    async def fake_hash(password: str) -> str:
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(service_module, "get_password_hash_async", fake_hash)
+
+
+@pytest.mark.asyncio
+async def test_user_batch_reports_per_item_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Conflicts fail individually and each chunk costs a fixed number of queries."""
+    monkeypatch.setattr(settings, "BATCH_CHUNK_SIZE", 2)
+    service = UserService()
+    service.repository = MemoryUserRepository([make_user("u1", "alice")])
+    service.post_repository = MemoryPostRepository([make_post("p1", "u1")])
+
+    response = await service.batch(
+        UserBatchRequest(
+            create=[new_user("alice"), new_user("bob"), new_user("bob"), new_user("carol")],
+            delete=["u1", "missing"],
+        )
+    )
+
+    assert [(r.index, r.ok, r.error) for r in response.created] == [
+        (0, False, "Email already registered"),
+        (1, True, None),
+        (2, False, "Email already registered"),
+        (3, True, None),
+    ]
+    assert response.created[1].item.username == "bob"
+    assert [(r.id, r.ok, r.error) for r in response.deleted] == [
+        ("u1", True, None),
+        ("missing", False, "User not found"),
+    ]
+    assert service.repository.calls == [
+        "get_by_emails_or_usernames", "create_many",
+        "get_by_emails_or_usernames", "create_many",
+        "get_many_by_ids", "delete_many",
+    ]
+    assert service.post_repository.calls == ["get_ids_by_authors"]
+
+
+@pytest.mark.asyncio
+async def test_post_batch_checks_authors_and_targets() -> None:
+    """Missing authors, missing posts and empty updates fail without aborting the batch."""
+    service = PostService()
+    service.user_repository = MemoryUserRepository([make_user("u1", "alice")])
+    service.repository = MemoryPostRepository([make_post("p1", "u1"), make_post("p2", "u1")])
+
+    response = await service.batch(
+        PostBatchRequest(
+            create=[PostCreate(title="New", author_id="u1"), PostCreate(title="x", author_id="nobody")],
+            update=[
+                PostBatchUpdate(id="p1", title="Renamed"),
+                PostBatchUpdate(id="p2"),
+                PostBatchUpdate(id="missing", title="x"),
+            ],
+            delete=["p2"],
+        )
+    )
+
+    assert [(r.ok, r.error) for r in response.created] == [(True, None), (False, "Author not found")]
+    assert [(r.id, r.ok, r.error) for r in response.updated] == [
+        ("p1", True, None),
+        ("p2", False, "No fields to update"),
+        ("missing", False, "Post not found"),
+    ]
+    assert response.updated[0].item.title == "Renamed"
+    assert [(r.id, r.ok) for r in response.deleted] == [("p2", True)]
+    assert service.repository.calls == [
+        "create_many", "get_many_by_ids", "update_many", "get_many_by_ids", "delete_many",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_oversized_batch_is_rejected(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Batches above BATCH_MAX_ITEMS are refused before touching the database."""
+    monkeypatch.setattr(settings, "BATCH_MAX_ITEMS", 2)
+    service = PostService()
+    service.repository = MemoryPostRepository()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.batch(PostBatchRequest(delete=["a", "b", "c"]))
+
+    assert exc_info.value.status_code == 413
+    assert service.repository.calls == []
+
+
+@pytest.mark.asyncio
+async def test_post_deleted_during_batch_update_fails_only_that_item() -> None:
+    """A post removed between the existence check and the update is reported per item."""
+    service = PostService()
+    repository = MemoryPostRepository([make_post("p1", "u1"), make_post("p2", "u1")])
+    service.repository = repository
+    get_many_by_ids = repository.get_many_by_ids
+
+    async def check_then_delete(ids: List[str]) -> List[dict]:
+        rows = await get_many_by_ids(ids)
+        del repository.rows["p2"]  # concurrent delete after the check
+        return rows
+
+    repository.get_many_by_ids = check_then_delete  # type: ignore[method-assign]
+
+    response = await service.batch(
+        PostBatchRequest(
+            update=[PostBatchUpdate(id="p1", title="Renamed"), PostBatchUpdate(id="p2", title="x")]
+        )
+    )
+
+    assert [(r.id, r.ok, r.error) for r in response.updated] == [
+        ("p1", True, None),
+        ("p2", False, "Post not found"),
+    ]
+    assert repository.rows["p1"]["title"] == "Renamed"
+
+
+@pytest.mark.asyncio
+async def test_duplicate_delete_ids_are_reported_once() -> None:
+    """Only the first occurrence of an ID in a delete batch is reported as deleted."""
+    service = PostService()
+    service.repository = MemoryPostRepository([make_post("p1", "u1")])
+
+    response = await service.batch(PostBatchRequest(delete=["p1", "p1"]))
+
+    assert [(r.index, r.ok, r.error) for r in response.deleted] == [
+        (0, True, None),
+        (1, False, "Post not found"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_batch_hashing_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A batch never has more than BATCH_HASH_CONCURRENCY passwords in the hasher at once."""
+    monkeypatch.setattr(settings, "BATCH_HASH_CONCURRENCY", 2)
+    running = peak = 0
+
+    async def slow_hash(password: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001)
+        running -= 1
+        return f"hashed:{password}"
+
+    monkeypatch.setattr(service_module, "get_password_hash_async", slow_hash)
+    service = UserService()
+    service.repository = MemoryUserRepository()
+
+    response = await service.batch(
+        UserBatchRequest(create=[new_user(f"user{i}") for i in range(10)])
+    )
+
+    assert all(result.ok for result in response.created)
+    assert peak == 2
+
+
+SCHEMA = Path(__file__).resolve().parents[1] / "prisma" / "schema.prisma"
+
+
+def prisma_fields(model: str) -> set:
+    """Field names of a model in prisma/schema.prisma."""
+    body = re.search(rf"^model {model} {{(.*?)^}}", SCHEMA.read_text(), re.M | re.S).group(1)
+    return {
+        line.split()[0]
+        for line in body.splitlines()
+        if line.strip() and not line.strip().startswith(("//", "@@"))
+    }
+
+
+def test_create_payloads_use_prisma_field_names() -> None:
+    """The create/create_many payloads only use fields of the Prisma models."""
+    user = UserCreate(
+        email="a@example.com", username="alice", password="secret123", first_name="A", last_name="B"
+    )
+    post = PostCreate(title="T", content="C", published=True, author_id="u1")
+
+    assert UserRepository._create_data(user, "hashed").keys() <= prisma_fields("User")
+    assert PostRepository._create_data(post).keys() <= prisma_fields("Post")
+    assert "id" in prisma_fields("User") and "id" in prisma_fields("Post")
+
+
+@pytest.mark.asyncio
+async def test_update_payloads_use_prisma_field_names(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Every updatable field maps to a field of the Prisma model."""
+    sent: dict = {}
+
+    async def update(model: str, where: dict, data: dict) -> None:
+        sent[model] = data
+
+    async def update_user(**kwargs: Any) -> None:
+        await update("User", **kwargs)
+
+    async def update_post(**kwargs: Any) -> None:
+        await update("Post", **kwargs)
+
+    fake = SimpleNamespace(
+        user=SimpleNamespace(update=update_user), post=SimpleNamespace(update=update_post)
+    )
+    monkeypatch.setattr(repository_module, "prisma", fake)
+
+    await UserRepository.update(
+        "u1",
+        UserUpdate(
+            email="b@example.com", username="bob", first_name="B", last_name="C", is_active=False
+        ),
+    )
+    await PostRepository.update("p1", PostUpdate(title="T", content="C", published=False))
+
+    assert sent["User"].keys() == {"email", "username", "firstName", "lastName", "isActive"}
+    assert sent["User"].keys() <= prisma_fields("User")
+    assert sent["Post"].keys() <= prisma_fields("Post")
@@ -0,0 +1,98 @@
+"""Tests for the read-through cache."""
+
+import asyncio
+from typing import Optional
+
+import pytest
+from pydantic import BaseModel
+
+from app.core.cache import MemoryCacheBackend, ReadThroughCache
+
+
+class Item(BaseModel):
+    id: str
+    version: int = 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_load() -> None:
+    """Concurrent misses for one key run the loader once; later reads hit."""
+    cache = ReadThroughCache(MemoryCacheBackend(), "item", Item, ttl=60)
+    calls = 0
+
+    async def loader() -> Optional[Item]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return Item(id="a")
+
+    results = await asyncio.gather(*(cache.get_or_load("a", loader) for _ in range(10)))
+    await cache.get_or_load("a", loader)
+
+    assert calls == 1
+    assert all(result == Item(id="a") for result in results)
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 1, "coalesced": 9, "invalidations": 0}
+
+
+@pytest.mark.asyncio
+async def test_invalidation_drops_entry_and_racing_load() -> None:
+    """A write during an in-flight load prevents the stale value from being stored."""
+    cache = ReadThroughCache(MemoryCacheBackend(), "item", Item, ttl=60)
+    version = 1
+    started = asyncio.Event()
+
+    async def loader() -> Optional[Item]:
+        loaded = version
+        started.set()
+        await asyncio.sleep(0.01)
+        return Item(id="a", version=loaded)
+
+    pending = asyncio.ensure_future(cache.get_or_load("a", loader))
+    await started.wait()
+    version = 2
+    await cache.invalidate("a")
+
+    assert (await pending).version == 1
+    assert (await cache.get_or_load("a", loader)).version == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_fail_waiters() -> None:
+    """Cancelling the caller that started a load leaves the coalesced callers' result intact."""
+    cache = ReadThroughCache(MemoryCacheBackend(), "item", Item, ttl=60)
+    calls = 0
+
+    async def loader() -> Optional[Item]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return Item(id="a")
+
+    leader = asyncio.ensure_future(cache.get_or_load("a", loader))
+    await asyncio.sleep(0)
+    followers = [asyncio.ensure_future(cache.get_or_load("a", loader)) for _ in range(3)]
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.gather(*followers) == [Item(id="a")] * 3
+    assert leader.cancelled()
+    assert calls == 1
+    assert await cache.get_or_load("a", loader) == Item(id="a")
+    assert cache.stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_memory_backend_is_bounded_and_expires() -> None:
+    """The in-memory backend evicts least recently used entries and honours TTLs."""
+    backend = MemoryCacheBackend(max_entries=2)
+    await backend.set("a", 1, ttl=60)
+    await backend.set("b", 2, ttl=60)
+    await backend.get("a")
+    await backend.set("c", 3, ttl=60)
+
+    assert await backend.get("b") is None
+    assert await backend.get("a") == 1
+    assert backend.evictions == 1
+
+    await backend.set("a", 1, ttl=-1)
+    assert await backend.get("a") is None
@@ -0,0 +1,70 @@
+"""Tests for the database pool settings, warm-up and metrics endpoint."""
+
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from httpx import AsyncClient
+
+from app.core import database
+from app.core.config import settings
+from main import app
+
+
+def test_datasource_url_gets_pool_settings(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Pool settings are added to PostgreSQL URLs without overriding explicit ones."""
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 7)
+    monkeypatch.setattr(settings, "DB_STATEMENT_TIMEOUT_MS", 1500)
+
+    url = database.build_datasource_url("postgresql://u:p@db:5432/app?pool_timeout=3")
+    params = parse_qs(urlsplit(url).query)
+
+    assert params["connection_limit"] == ["7"]
+    assert params["pool_timeout"] == ["3"]
+    assert params["options"] == ["-c statement_timeout=1500"]
+    assert database.build_datasource_url("file:./app.db") == "file:./app.db"
+
+
+class FakePrisma:
+    """Records raw queries and serves canned metrics."""
+
+    def __init__(self) -> None:
+        self.queries: list[str] = []
+
+    async def query_raw(self, query: str) -> list[dict]:
+        self.queries.append(query)
+        return []
+
+    async def get_metrics(self, format: str = "json") -> Any:
+        if format == "prometheus":
+            return "prisma_pool_connections_busy 1\n"
+        return {"gauges": [{"key": "prisma_pool_connections_busy", "value": 1}]}
+
+
+@pytest.mark.asyncio
+async def test_warm_pool_is_capped_by_pool_size(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Warm-up runs one overlapping query per connection, up to DB_POOL_SIZE."""
+    fake = FakePrisma()
+    monkeypatch.setattr(database, "prisma", fake)
+    monkeypatch.setattr(settings, "DATABASE_URL", "postgresql://u:p@db:5432/app")
+    monkeypatch.setattr(settings, "DB_POOL_SIZE", 3)
+
+    assert await database.warm_pool(5) == 3
+    assert len(fake.queries) == 3
+
+    monkeypatch.setattr(settings, "DATABASE_URL", "file:./app.db")
+    assert await database.warm_pool(5) == 0
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_formats(monkeypatch: pytest.MonkeyPatch) -> None:
+    """/metrics serves Prometheus text by default and JSON on request."""
+    monkeypatch.setattr(database, "prisma", FakePrisma())
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        text = await client.get("/metrics")
+        as_json = await client.get("/metrics", params={"format": "json"})
+
+    assert text.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert text.text == "prisma_pool_connections_busy 1\n"
+    assert as_json.json()["gauges"][0]["key"] == "prisma_pool_connections_busy"
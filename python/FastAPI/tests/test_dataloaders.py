@@ -0,0 +1,101 @@
+"""Tests for the per-request GraphQL DataLoader registry."""
+
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from app.graphql.context import GraphQLContext
+from app.graphql.dataloaders import DataLoaderRegistry, loader_stats
+from app.graphql.schemas.schema import graphql_schema
+from app.repositories.sample_repository import PostRepository, UserRepository
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_user(user_id: str) -> dict:
+    """Build a repository-shaped user row."""
+    return {
+        "id": user_id,
+        "email": f"{user_id}@example.com",
+        "username": user_id,
+        "password": "hashed",
+        "first_name": None,
+        "last_name": None,
+        "is_active": True,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+def make_post(post_id: str, author_id: str) -> dict:
+    """Build a repository-shaped post row."""
+    return {
+        "id": post_id,
+        "title": f"Post {post_id}",
+        "content": None,
+        "published": True,
+        "author_id": author_id,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+
+
+@pytest.fixture
+def fake_repositories(monkeypatch: pytest.MonkeyPatch) -> list[list[str]]:
+    """Replace the batch repository methods and record every call."""
+    calls: list[list[str]] = []
+    users = {uid: make_user(uid) for uid in ("u1", "u2")}
+    posts = {"p1": make_post("p1", "u1"), "p2": make_post("p2", "u1"), "p3": make_post("p3", "u2")}
+
+    async def get_users(user_ids: list[str]) -> list[dict]:
+        calls.append(user_ids)
+        return [users[uid] for uid in user_ids if uid in users]
+
+    async def get_posts(post_ids: list[str]) -> list[dict]:
+        calls.append(post_ids)
+        return [posts[pid] for pid in post_ids if pid in posts]
+
+    monkeypatch.setattr(UserRepository, "get_many_by_ids", staticmethod(get_users))
+    monkeypatch.setattr(PostRepository, "get_many_by_ids", staticmethod(get_posts))
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_concurrent_loads_are_batched(fake_repositories: list[list[str]]) -> None:
+    """Concurrent loads share one query and keep key order."""
+    loaders = DataLoaderRegistry()
+
+    rows = await asyncio.gather(
+        loaders.users.load("u1"),
+        loaders.users.load("u2"),
+        loaders.users.load("u1"),
+        loaders.users.load("missing"),
+    )
+
+    assert [row["id"] if row else None for row in rows] == ["u1", "u2", "u1", None]
+    assert fake_repositories == [["u1", "u2", "missing"]]
+    assert loaders.stats()["users"] == {"loads": 4, "batches": 1, "keys": 3, "coalesced": 3}
+
+
+@pytest.mark.asyncio
+async def test_nested_authors_resolve_in_one_query(fake_repositories: list[list[str]]) -> None:
+    """Resolving ``author`` on several posts issues one user query."""
+    query = """
+        query {
+            a: getPost(postId: "p1") { author { username } }
+            b: getPost(postId: "p2") { author { username } }
+            c: getPost(postId: "p3") { author { username } }
+        }
+    """
+    context = GraphQLContext()
+    coalesced_before = loader_stats()["users"]["coalesced"]
+
+    result = await graphql_schema.execute(query, context_value=context)
+
+    assert result.errors is None
+    assert result.data["c"]["author"]["username"] == "u2"
+    assert fake_repositories == [["p1", "p2", "p3"], ["u1", "u2"]]
+    assert context.loaders.stats()["users"]["coalesced"] == 2
+    assert result.extensions["dataloaders"] == context.loaders.stats()
+    assert loader_stats()["users"]["coalesced"] == coalesced_before + 2
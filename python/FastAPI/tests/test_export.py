@@ -0,0 +1,138 @@
+"""Tests for the streaming export endpoints."""
+
+import csv
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import Any, List, Optional
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+import app.repositories.sample_repository as repository_module
+from app.core.pagination import Keyset, iter_keyset
+from app.schemas.sample_schema import PostResponse
+from app.services.sample_service import PostService
+from main import app
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class Row:
+    """Stand-in for a Prisma model instance."""
+
+    def __init__(self, data: dict) -> None:
+        self.data = data
+
+    def model_dump(self) -> dict:
+        return dict(self.data)
+
+
+def make_post(index: int, published: bool = True) -> Row:
+    """Build a Post record in (created_at DESC, id DESC) order by index."""
+    return Row(
+        {
+            "id": f"p{index:03d}",
+            "title": f"Post, \"{index}\"",
+            "content": None,
+            "published": published,
+            "authorId": "u1",
+            "createdAt": NOW - timedelta(minutes=index),
+            "updatedAt": NOW,
+        }
+    )
+
+
+class PostTable:
+    """``prisma.post`` stand-in whose ``find_many`` honours the keyset bound."""
+
+    def __init__(self, records: List[Row]) -> None:
+        self.records = records
+        self.queries: List[dict] = []
+
+    async def find_many(self, **query: Any) -> List[Row]:
+        self.queries.append(query)
+        where = query.get("where") or {}
+        start = 0
+        for condition in where.get("AND", [where]):
+            if "OR" in condition:
+                bound = condition["OR"][1]["id"]["lt"]
+                start = next(
+                    i for i, record in enumerate(self.records) if record.data["id"] == bound
+                ) + 1
+        return self.records[start:start + query["take"]]
+
+
+@pytest.mark.asyncio
+async def test_iter_keyset_walks_in_fixed_size_batches() -> None:
+    """Every batch is one bounded query that starts after the previous batch."""
+    table = PostTable([make_post(i) for i in range(7)])
+
+    batches = [
+        batch async for batch in iter_keyset(table.find_many, 3, where={"published": True})
+    ]
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert all(query["take"] == 3 for query in table.queries)
+    assert table.queries[0]["where"] == {"published": True}
+    assert Keyset.from_row(batches[0][-1]).id == "p002"
+    assert batches[0][0]["author_id"] == "u1"
+    assert PostResponse(**batches[0][0]).created_at == NOW
+
+
+class AuthorRepository:
+    async def get_by_id(self, user_id: str) -> Optional[dict]:
+        return {"id": user_id} if user_id == "u1" else None
+
+
+@pytest.fixture
+def post_table(monkeypatch: pytest.MonkeyPatch) -> PostTable:
+    """Route PostService exports through the real repository over an in-memory table."""
+    table = PostTable([make_post(i) for i in range(5)])
+    original_init = PostService.__init__
+
+    def init(self: PostService) -> None:
+        original_init(self)
+        self.user_repository = AuthorRepository()
+
+    monkeypatch.setattr(repository_module, "prisma", SimpleNamespace(post=table))
+    monkeypatch.setattr(PostService, "__init__", init)
+    monkeypatch.setattr(settings, "EXPORT_BATCH_SIZE", 2)
+    return table
+
+
+@pytest.mark.asyncio
+async def test_export_posts_ndjson_and_csv(post_table: PostTable) -> None:
+    """Both formats contain every row; filters reach the Prisma query."""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        ndjson = await client.get(
+            "/api/posts:export", params={"author_id": "u1", "published": "true"}
+        )
+        exported_csv = await client.get("/api/posts:export", params={"format": "csv"})
+
+    assert ndjson.status_code == 200
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert [line["id"] for line in lines] == ["p000", "p001", "p002", "p003", "p004"]
+
+    assert exported_csv.headers["content-disposition"] == 'attachment; filename="posts.csv"'
+    records = list(csv.DictReader(io.StringIO(exported_csv.text)))
+    assert len(records) == 5
+    assert records[1]["title"] == 'Post, "1"'
+    assert records[1]["author_id"] == "u1"
+    # Five rows in batches of two: three queries per export
+    assert [query.get("where") for query in post_table.queries[::3]] == [
+        {"authorId": "u1", "published": True},
+        None,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_export_posts_unknown_author(post_table: PostTable) -> None:
+    """An unknown author is a 404 rather than an empty download."""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/api/posts:export", params={"author_id": "nobody"})
+
+    assert response.status_code == 404
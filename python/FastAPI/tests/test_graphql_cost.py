@@ -0,0 +1,104 @@
+"""Tests for GraphQL query cost analysis, depth limiting and cost scheduling."""
+
+import asyncio
+
+import pytest
+from graphql import parse
+from httpx import AsyncClient
+from strawberry.extensions import QueryDepthLimiter
+
+from app.core.config import settings
+from app.graphql.extensions import CostEstimator, CostScheduler, ServerBusyError
+from app.graphql.schemas.schema import graphql_schema
+from main import app
+
+
+def estimate(query: str, variables: dict | None = None) -> int:
+    document = parse(query)
+    estimator = CostEstimator(graphql_schema._schema, document, variables, default_list_size=10)
+    return estimator.operation_cost(document)
+
+
+def test_cost_uses_declared_multipliers_and_weights() -> None:
+    """List sizes come from arguments (or defaults); scalars are free."""
+    assert estimate("{ getSample(id: 1) { id name } }") == 1
+    assert estimate("{ getSamplesByIds(ids: [1, 2, 3]) { id } }") == 3
+    assert estimate("query($n: Int!) { paginatedSamples(limit: $n) { id } }", {"n": 50}) == 50
+    assert estimate("{ paginatedSamples { id user { name } } }") == 10 * (1 + 1)
+    assert estimate("{ searchSamples(keyword: \"a\") { id } }") == 5 * 10
+    assert estimate("{ nestedSamples { id } }") == 10 * 10
+    assert estimate("{ countSamples __typename }") == 0
+
+
+def test_cost_follows_fragments() -> None:
+    """Named and inline fragments are expanded into the estimate."""
+    query = """
+        query {
+            getSampleWithUser(id: 1) { ...WithUser }
+            getNode(id: 1) { ... on Sample { user { id } } }
+        }
+        fragment WithUser on Sample { user { id name } }
+    """
+    assert estimate(query) == (1 + 1) + (1 + 1)
+
+
+@pytest.mark.asyncio
+async def test_expensive_operation_is_rejected_before_execution() -> None:
+    """Over-budget operations get no data, an error and the cost extension."""
+    query = "{ getSamplesByIds(ids: $ids) { id } }".replace("$ids", str(list(range(2000))))
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        rejected = await client.post("/graphql", json={"query": query})
+        accepted = await client.post("/graphql", json={"query": "{ getSample(id: 1) { id } }"})
+
+    body = rejected.json()
+    assert body["data"] is None
+    assert body["errors"][0]["extensions"]["code"] == "QUERY_TOO_EXPENSIVE"
+    assert body["extensions"]["cost"]["requested"] == 2000
+
+    assert accepted.json()["data"] == {"getSample": {"id": 1}}
+    assert accepted.json()["extensions"]["cost"] == {
+        "requested": 1,
+        "maximum": settings.GRAPHQL_MAX_COST,
+        "queuedMs": 0.0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_depth_limit_is_enforced(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Deeply nested selections fail validation."""
+    extensions = [QueryDepthLimiter(max_depth=1), *graphql_schema.extensions[1:]]
+    monkeypatch.setattr(graphql_schema, "extensions", extensions)
+
+    result = await graphql_schema.execute("{ getSampleWithUser(id: 1) { user { id } } }")
+
+    assert result.errors and "exceeds maximum operation depth" in result.errors[0].message
+
+
+@pytest.mark.asyncio
+async def test_scheduler_queues_in_order_and_times_out() -> None:
+    """Operations wait for budget first-in first-out and give up after the timeout."""
+    scheduler = CostScheduler(capacity=10, timeout=0.05)
+    await scheduler.acquire(8)
+
+    order: list[str] = []
+
+    async def run(name: str, requested: int) -> None:
+        await scheduler.acquire(requested)
+        order.append(name)
+
+    big = asyncio.create_task(run("big", 5))
+    await asyncio.sleep(0)
+    small = asyncio.create_task(run("small", 1))
+    await asyncio.sleep(0)
+    assert order == []  # small fits, but must not overtake big
+
+    scheduler.release(8)
+    await asyncio.gather(big, small)
+    assert order == ["big", "small"]
+    assert scheduler.in_flight == 6
+
+    with pytest.raises(ServerBusyError):
+        await scheduler.acquire(50)
+    assert scheduler.stats()["rejected"] == 1
+    assert scheduler.stats()["waiting"] == 0
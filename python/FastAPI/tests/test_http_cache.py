@@ -0,0 +1,113 @@
+"""Tests for ETag / conditional GET handling and the shared response cache."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.core.http_cache import CachePolicy, ResponseCache, compute_etag, response_cache
+from app.schemas.sample_schema import CursorPage, PostResponse, PostUpdate
+from app.services.sample_service import PostService
+from main import app
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_post(updated_at: datetime = NOW) -> PostResponse:
+    return PostResponse(
+        id="p1", title="Title", author_id="u1", created_at=NOW, updated_at=updated_at
+    )
+
+
+class PostStore:
+    """Stands in for the service: counts loads and lets tests bump updated_at."""
+
+    def __init__(self) -> None:
+        self.post = make_post()
+        self.loads = 0
+
+    async def get_post(self, post_id: str) -> PostResponse:
+        self.loads += 1
+        return self.post
+
+
+@pytest.fixture
+def store(monkeypatch: pytest.MonkeyPatch) -> PostStore:
+    store = PostStore()
+
+    async def get_post(service: PostService, post_id: str) -> PostResponse:
+        return await store.get_post(post_id)
+
+    monkeypatch.setattr(PostService, "get_post", get_post)
+    response_cache.clear()
+    return store
+
+
+def test_etag_tracks_ids_and_updated_at() -> None:
+    """The tag changes with updated_at and with the page cursors."""
+    page = CursorPage[PostResponse](items=[make_post()], next_cursor="a")
+
+    assert compute_etag(make_post()) == compute_etag(make_post())
+    assert compute_etag(make_post()) != compute_etag(make_post(NOW + timedelta(seconds=1)))
+    assert compute_etag(page) != compute_etag(page.model_copy(update={"next_cursor": "b"}))
+    assert CachePolicy(max_age=5).header_value() == "private, max-age=5"
+    assert CachePolicy(private=False).header_value() == "public, no-cache"
+
+
+@pytest.mark.asyncio
+async def test_conditional_get_returns_304(store: PostStore) -> None:
+    """A matching If-None-Match is answered with an empty 304."""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        first = await client.get("/api/posts/p1")
+        etag = first.headers["etag"]
+        not_modified = await client.get("/api/posts/p1", headers={"If-None-Match": etag})
+        store.post = make_post(NOW + timedelta(minutes=1))
+        changed = await client.get("/api/posts/p1", headers={"If-None-Match": etag})
+
+    assert first.json()["id"] == "p1"
+    assert first.headers["cache-control"] == "private, max-age=5"
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_shared_cache_is_invalidated_by_writes(
+    store: PostStore, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Cached bodies skip the service until a write invalidates their tags."""
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+
+    class UpdateRepository:
+        async def update(self, post_id: str, post_data: PostUpdate) -> dict:
+            return make_post().model_dump()
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        await client.get("/api/posts/p1")
+        await client.get("/api/posts/p1")
+        assert store.loads == 1
+
+        service = PostService()
+        service.repository = UpdateRepository()
+        await service.update_post("p1", PostUpdate(title="New"))
+
+        await client.get("/api/posts/p1")
+        assert store.loads == 2
+
+
+def test_response_cache_drops_every_entry_with_a_tag() -> None:
+    """Invalidating a tag removes all entries carrying it and nothing else."""
+    cache = ResponseCache(max_entries=10, ttl=60)
+    entry = type("Entry", (), {})()
+    cache.set("/posts?", entry, ("posts",))
+    cache.set("/posts/p1?", entry, ("post:p1", "user:u1"))
+    cache.set("/users/u2?", entry, ("user:u2",))
+
+    cache.invalidate("user:u1")
+
+    assert cache.get("/posts/p1?") is None
+    assert cache.get("/posts?") is entry
+    assert cache.get("/users/u2?") is entry
@@ -0,0 +1,149 @@
+"""Tests for keyset (cursor) pagination."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.pagination import (
+    InvalidCursorError,
+    Keyset,
+    build_keyset_page,
+    decode_cursor,
+    encode_cursor,
+    keyset_query,
+)
+from app.core.database import to_row
+from app.schemas.sample_schema import UserResponse
+from main import app
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def make_rows(count: int) -> list[dict]:
+    """Build rows in (created_at DESC, id DESC) order."""
+    return [
+        {"id": f"id-{i:03d}", "created_at": NOW - timedelta(minutes=i)} for i in range(count)
+    ]
+
+
+class UserRecord:
+    """Stand-in for a Prisma ``User`` record (camelCase fields)."""
+
+    def __init__(self, index: int) -> None:
+        self.index = index
+
+    def model_dump(self) -> dict:
+        return {
+            "id": f"id-{self.index:03d}",
+            "email": f"user{self.index}@example.com",
+            "username": f"user{self.index}",
+            "password": "hashed",
+            "firstName": "First",
+            "lastName": None,
+            "isActive": True,
+            "createdAt": NOW - timedelta(minutes=self.index),
+            "updatedAt": NOW,
+            "posts": None,
+        }
+
+
+def test_repository_rows_serve_pagination_and_responses() -> None:
+    """One row shape feeds both the keyset and the response model."""
+    rows = [to_row(UserRecord(i)) for i in range(4)]
+
+    page = build_keyset_page(rows, 3)
+    users = [UserResponse(**row) for row in page.rows]
+
+    assert Keyset.from_cursor(page.next_cursor) == Keyset.from_row(rows[2])
+    assert rows[2]["created_at"] == NOW - timedelta(minutes=2)
+    assert users[0].first_name == "First"
+    assert users[0].created_at == NOW
+
+
+def test_cursor_round_trip() -> None:
+    """A keyset survives encoding and decoding."""
+    keyset = Keyset(created_at=NOW, id="abc")
+    assert Keyset.from_cursor(keyset.to_cursor()) == keyset
+
+
+def test_tampered_cursor_is_rejected() -> None:
+    """Changing the payload invalidates the signature."""
+    _, signature = encode_cursor(1).split(".")
+    forged = encode_cursor(2).split(".")[0]
+
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(f"{forged}.{signature}")
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not-a-cursor")
+
+
+def test_keyset_query_bounds() -> None:
+    """`after` pages backwards in time, `before` pages forwards."""
+    bound = Keyset(created_at=NOW, id="abc")
+
+    after = keyset_query(10, after=bound, where={"authorId": "u1"})
+    assert after["take"] == 11
+    assert after["order"] == [{"createdAt": "desc"}, {"id": "desc"}]
+    assert after["where"]["AND"][0] == {"authorId": "u1"}
+    assert after["where"]["AND"][1]["OR"][0] == {"createdAt": {"lt": NOW}}
+
+    before = keyset_query(10, before=bound)
+    assert before["order"] == [{"createdAt": "asc"}, {"id": "asc"}]
+    assert before["where"]["OR"][1] == {"createdAt": NOW, "id": {"gt": "abc"}}
+
+
+def test_build_keyset_page_cursors() -> None:
+    """Cursors are emitted only where a neighbouring page exists."""
+    rows = make_rows(6)
+
+    first = build_keyset_page(rows[:4], 3)
+    assert [row["id"] for row in first.rows] == ["id-000", "id-001", "id-002"]
+    assert first.prev_cursor is None
+    assert Keyset.from_cursor(first.next_cursor) == Keyset.from_row(rows[2])
+
+    after = Keyset.from_row(rows[2])
+    last = build_keyset_page(rows[3:6], 3, after=after)
+    assert last.next_cursor is None
+    assert Keyset.from_cursor(last.prev_cursor) == Keyset.from_row(rows[3])
+
+    before = Keyset.from_row(rows[3])
+    back = build_keyset_page(list(reversed(rows[:3])), 3, before=before)
+    assert [row["id"] for row in back.rows] == ["id-000", "id-001", "id-002"]
+    assert back.prev_cursor is None
+    assert back.next_cursor is not None
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_rejects_invalid_cursor() -> None:
+    """A forged cursor is answered with 400 before touching the database."""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/api/posts", params={"after": "bogus"})
+        assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("position", ["x", 1.5, True, None])
+async def test_relay_samples_rejects_non_integer_cursor(position: object) -> None:
+    """A correctly signed cursor with a non-int position is reported as invalid, not a crash."""
+    query = "query ($after: String) { relaySamples(after: $after) { edges { node { id } } } }"
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post(
+            "/graphql",
+            json={"query": query, "variables": {"after": encode_cursor(position)}},
+        )
+    assert response.status_code == 200
+    assert response.json()["errors"][0]["message"] == "Malformed cursor"
+
+
+@pytest.mark.asyncio
+async def test_relay_samples_pages_with_cursor() -> None:
+    query = (
+        "query ($after: String) { relaySamples(first: 2, after: $after) { edges { node { id } } } }"
+    )
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post(
+            "/graphql", json={"query": query, "variables": {"after": encode_cursor(2)}}
+        )
+    edges = response.json()["data"]["relaySamples"]["edges"]
+    assert [edge["node"]["id"] for edge in edges] == [3, 4]
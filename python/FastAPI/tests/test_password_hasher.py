@@ -0,0 +1,77 @@
+"""Tests for the async password hashing worker pool."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from httpx import AsyncClient
+
+from app.core.security import PasswordHashBusyError, PasswordHasher, password_hasher
+from main import app
+
+
+class Tracker:
+    """Blocking callable that records how many copies run at once."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.running = 0
+        self.peak = 0
+
+    def __call__(self, seconds: float) -> float:
+        with self.lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        time.sleep(seconds)
+        with self.lock:
+            self.running -= 1
+        return seconds
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped() -> None:
+    """No more than ``workers`` operations run at the same time."""
+    hasher = PasswordHasher(workers=2)
+    tracker = Tracker()
+
+    results = await asyncio.gather(*(hasher._run(tracker, 0.02) for _ in range(6)))
+
+    assert results == [0.02] * 6
+    assert tracker.peak == 2
+    stats = hasher.stats()
+    assert stats["completed"] == 6
+    assert stats["queue_depth"] == 0
+    assert stats["peak_queue_depth"] >= 4
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_sheddable_calls_are_rejected_when_queue_is_full() -> None:
+    """Admission control rejects sheddable calls but still queues the others."""
+    hasher = PasswordHasher(workers=1, max_queue=1)
+    tracker = Tracker()
+
+    running = asyncio.ensure_future(hasher._run(tracker, 0.05))
+    queued = asyncio.ensure_future(hasher._run(tracker, 0.01))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PasswordHashBusyError):
+        await hasher._run(tracker, 0.01, sheddable=True)
+    not_shed = asyncio.ensure_future(hasher._run(tracker, 0.01))
+
+    await asyncio.gather(running, queued, not_shed)
+    assert hasher.stats()["rejected"] == 1
+    assert hasher.stats()["completed"] == 3
+    hasher.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_is_reported_in_cache_stats() -> None:
+    """The hashing queue counters are readable from /cache/stats."""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.get("/api/cache/stats")
+
+    stats = response.json()["password_hasher"]
+    assert stats["max_queue"] == password_hasher.max_queue
+    assert {"queue_depth", "peak_queue_depth", "rejected", "avg_wait_ms"} <= stats.keys()
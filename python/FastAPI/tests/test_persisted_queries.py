@@ -0,0 +1,123 @@
+"""Tests for persisted GraphQL queries and the parsed-document cache."""
+
+import json
+from pathlib import Path
+
+import pytest
+import strawberry.schema.execute as execute_module
+from httpx import AsyncClient
+
+from app.core.config import settings
+from app.graphql.extensions import document_cache
+from app.graphql.persisted_queries import main as register_cli
+from app.graphql.persisted_queries import persisted_query_store, query_hash
+from main import app
+
+QUERY = "{ getSample(id: 1) { id name } }"
+
+
+def apq(sha256_hash: str, query: str | None = None) -> dict:
+    body: dict = {"extensions": {"persistedQuery": {"version": 1, "sha256Hash": sha256_hash}}}
+    if query is not None:
+        body["query"] = query
+    return body
+
+
+@pytest.fixture(autouse=True)
+def clean_caches() -> None:
+    persisted_query_store.clear()
+    document_cache.clear()
+    # The counters outlive clear(); other GraphQL tests share the cache
+    document_cache.hits = document_cache.misses = 0
+
+
+@pytest.mark.asyncio
+async def test_automatic_persisted_query_round_trip() -> None:
+    """Unknown hash -> PersistedQueryNotFound; after one full request the hash alone works."""
+    sha = query_hash(QUERY)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        missing = await client.post("/graphql", json=apq(sha))
+        registered = await client.post("/graphql", json=apq(sha, QUERY))
+        by_hash = await client.post("/graphql", json=apq(sha))
+        by_get = await client.get(
+            "/graphql", params={"extensions": json.dumps(apq(sha)["extensions"])}
+        )
+
+    assert missing.json()["errors"][0]["message"] == "PersistedQueryNotFound"
+    assert missing.json()["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_NOT_FOUND"
+    assert registered.json()["data"] == {"getSample": {"id": 1, "name": "sample"}}
+    assert by_hash.json()["data"] == registered.json()["data"]
+    assert by_get.json()["data"] == registered.json()["data"]
+    assert document_cache.stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+async def test_hash_mismatch_is_rejected() -> None:
+    """A query is never stored under a hash it does not produce."""
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        response = await client.post("/graphql", json=apq("0" * 64, QUERY))
+
+    assert response.json()["errors"][0]["extensions"]["code"] == "PERSISTED_QUERY_HASH_MISMATCH"
+    assert persisted_query_store.stats()["persisted"] == 0
+
+
+@pytest.mark.asyncio
+async def test_cached_documents_skip_parse_and_validation(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The second execution of a query neither parses nor validates it."""
+    calls = {"parse": 0, "validate": 0}
+    original_parse, original_validate = execute_module.parse_document, execute_module.validate_document
+
+    def parse_document(*args: object, **kwargs: object) -> object:
+        calls["parse"] += 1
+        return original_parse(*args, **kwargs)
+
+    def validate_document(*args: object, **kwargs: object) -> object:
+        calls["validate"] += 1
+        return original_validate(*args, **kwargs)
+
+    monkeypatch.setattr(execute_module, "parse_document", parse_document)
+    monkeypatch.setattr(execute_module, "validate_document", validate_document)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        for _ in range(3):
+            response = await client.post("/graphql", json={"query": QUERY})
+            assert response.json()["data"]["getSample"]["id"] == 1
+        invalid = await client.post("/graphql", json={"query": "{ nope }"})
+
+    assert calls == {"parse": 2, "validate": 2}
+    assert invalid.json()["errors"]
+    assert document_cache.stats()["entries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_allow_list_only_runs_registered_operations(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """In allow-list mode unregistered operations fail and nothing is auto-persisted."""
+    source = tmp_path / "queries.ts"
+    source.write_text(
+        "export const GET_SAMPLE = gql`\n  query GetSample {\n    getSample(id: 1) { id }\n  }\n`;\n"
+        "export const DYNAMIC = gql`query { ${field} }`;\n",
+        encoding="utf-8",
+    )
+    manifest = tmp_path / "persisted-queries.json"
+    assert register_cli(["register", str(tmp_path), "--manifest", str(manifest)]) == 0
+
+    entries = json.loads(manifest.read_text(encoding="utf-8"))
+    assert len(entries) == 1
+    ((sha, registered_query),) = entries.items()
+    persisted_query_store.load_manifest(manifest)
+    monkeypatch.setattr(settings, "GRAPHQL_PERSISTED_QUERIES_ONLY", True)
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        allowed = await client.post("/graphql", json=apq(sha))
+        allowed_text = await client.post("/graphql", json={"query": registered_query})
+        ad_hoc = await client.post("/graphql", json={"query": QUERY})
+        new_hash = await client.post("/graphql", json=apq(query_hash(QUERY), QUERY))
+
+    assert allowed.json()["data"] == {"getSample": {"id": 1}}
+    assert allowed_text.json()["data"] == {"getSample": {"id": 1}}
+    assert ad_hoc.json()["errors"][0]["extensions"]["code"] == "OPERATION_NOT_ALLOWED"
+    assert new_hash.json()["errors"][0]["extensions"]["code"] == "OPERATION_NOT_ALLOWED"
+    assert persisted_query_store.stats()["persisted"] == 0
@@ -0,0 +1,115 @@
+"""Tests for the fast JSON response path."""
+
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from typing import Any, List
+
+import pytest
+from httpx import AsyncClient
+
+import app.repositories.sample_repository as repository_module
+from app.core.config import settings
+from app.core.database import to_row
+from app.core.responses import FastJSONResponse, from_rows
+from app.schemas.sample_schema import CursorPage, UserResponse
+from main import app
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+class UserRecord:
+    """Stand-in for a Prisma ``User`` instance (camelCase fields)."""
+
+    def __init__(self, index: int, **overrides: Any) -> None:
+        self.data = {
+            "id": f"u{index}",
+            "email": f"u{index}@example.com",
+            "username": f"user{index}",
+            "password": "hashed",
+            "firstName": "First",
+            "lastName": None,
+            "isActive": False,
+            "createdAt": NOW,
+            "updatedAt": NOW,
+        } | overrides
+
+    def model_dump(self) -> dict:
+        return dict(self.data)
+
+
+def test_fast_response_matches_model_json() -> None:
+    """Models render exactly like ``model_dump_json``; dicts go through orjson."""
+    page = CursorPage[UserResponse](
+        items=from_rows(UserResponse, [to_row(UserRecord(1))]), next_cursor="next"
+    )
+
+    assert FastJSONResponse(page).body == page.model_dump_json().encode()
+    assert json.loads(FastJSONResponse({"page": page, 1: None}).body) == {
+        "page": page.model_dump(mode="json"),
+        "1": None,
+    }
+
+
+@pytest.mark.parametrize("fast", [True, False])
+def test_from_rows_keeps_every_field(monkeypatch: pytest.MonkeyPatch, fast: bool) -> None:
+    """Repository rows fill every response field on both paths; the password never leaks."""
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", fast)
+
+    (user,) = from_rows(UserResponse, [to_row(UserRecord(1))])
+
+    assert user.model_dump() == {
+        "id": "u1",
+        "email": "u1@example.com",
+        "username": "user1",
+        "first_name": "First",
+        "last_name": None,
+        "is_active": False,
+        "created_at": NOW,
+        "updated_at": NOW,
+    }
+    assert "password" not in user.model_dump_json()
+
+
+def test_from_rows_skips_validation_only_on_fast_path(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Trusted rows are not re-validated unless FAST_JSON_RESPONSES is off."""
+    row = to_row(UserRecord(1, email="not-an-email"))
+
+    (user,) = from_rows(UserResponse, [row])
+    assert user.email == "not-an-email"
+
+    monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+    with pytest.raises(ValueError):
+        from_rows(UserResponse, [row])
+
+
+def test_from_rows_rejects_unmapped_rows() -> None:
+    """Raw camelCase records are refused instead of losing fields."""
+    with pytest.raises(ValueError, match="is_active, created_at, updated_at"):
+        from_rows(UserResponse, [UserRecord(1).model_dump()])
+
+
+@pytest.mark.asyncio
+async def test_list_endpoint_body_is_unchanged(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The fast path returns the same JSON as the validated path."""
+
+    async def find_many(**query: Any) -> List[UserRecord]:
+        return [UserRecord(1), UserRecord(2, isActive=True, lastName="Last")]
+
+    monkeypatch.setattr(
+        repository_module, "prisma", SimpleNamespace(user=SimpleNamespace(find_many=find_many))
+    )
+
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        fast = await client.get("/api/users")
+        monkeypatch.setattr(settings, "FAST_JSON_RESPONSES", False)
+        validated = await client.get("/api/users")
+
+    assert fast.status_code == validated.status_code == 200
+    assert fast.headers["content-type"] == "application/json"
+    assert fast.json() == validated.json()
+    assert [(user["is_active"], user["last_name"]) for user in fast.json()["items"]] == [
+        (False, None),
+        (True, "Last"),
+    ]
+    assert fast.json()["items"][0]["created_at"] == "2024-01-01T00:00:00Z"
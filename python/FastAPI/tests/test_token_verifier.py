@@ -0,0 +1,73 @@
+"""Tests for the cached access token verifier."""
+
+import time
+from typing import Any
+
+import pytest
+from fastapi import Depends, FastAPI
+from httpx import AsyncClient
+from jose import jwt
+
+from app.core import security
+from app.core.security import TokenVerifier, get_token_claims
+
+SECRET = "test-secret"
+
+
+def make_token(exp: float, **claims: Any) -> str:
+    return jwt.encode({"sub": "u1", "exp": exp, **claims}, SECRET, algorithm="HS256")
+
+
+def test_verified_tokens_are_cached_until_exp(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Repeat verifications are cache hits; expiry and bad signatures still apply."""
+    verifier = TokenVerifier(SECRET, "HS256")
+    token = make_token(time.time() + 60)
+
+    assert verifier.verify(token)["sub"] == "u1"
+    verifier.verify(token)["sub"] = "mutated"
+    assert verifier.verify(token)["sub"] == "u1"
+    assert verifier.stats()["hits"] == 2
+    assert verifier.stats()["misses"] == 1
+
+    forged = jwt.encode({"sub": "u1", "exp": time.time() + 60}, "other", algorithm="HS256")
+    assert verifier.verify(forged) is None
+
+    # Once the cached exp has passed the token is decoded (and rejected) again
+    expired = make_token(time.time() - 1)
+    assert verifier.verify(expired) is None
+    real_time = time.time
+    monkeypatch.setattr(security.time, "time", lambda: real_time() + 120)
+    verifier.verify(token)
+    assert verifier.stats()["misses"] == 4
+
+
+def test_cache_is_bounded() -> None:
+    """The least recently used token is evicted once the cache is full."""
+    verifier = TokenVerifier(SECRET, "HS256", max_entries=2)
+    tokens = [make_token(time.time() + 60, n=n) for n in range(3)]
+
+    for token in tokens:
+        verifier.verify(token)
+
+    assert verifier.stats()["entries"] == 2
+    assert verifier.stats()["evictions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_token_claims_dependency(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The dependency returns the claims or answers 401."""
+    monkeypatch.setattr(security, "token_verifier", TokenVerifier(SECRET, "HS256"))
+    app = FastAPI()
+
+    @app.get("/me")
+    async def me(claims: dict = Depends(get_token_claims)) -> dict:
+        return {"sub": claims["sub"]}
+
+    token = make_token(time.time() + 60)
+    async with AsyncClient(app=app, base_url="http://test") as client:
+        ok = await client.get("/me", headers={"Authorization": f"Bearer {token}"})
+        missing = await client.get("/me")
+        invalid = await client.get("/me", headers={"Authorization": "Bearer nope"})
+
+    assert ok.json() == {"sub": "u1"}
+    assert missing.status_code == invalid.status_code == 401
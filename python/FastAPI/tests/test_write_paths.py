@@ -0,0 +1,130 @@
+"""Tests for the constraint-driven service write paths."""
+
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import pytest
+from fastapi import HTTPException
+from prisma.errors import ForeignKeyViolationError, UniqueViolationError
+
+import app.services.sample_service as service_module
+from app.core.cache import MemoryCacheBackend, ReadThroughCache
+from app.schemas.sample_schema import PostCreate, PostResponse, PostUpdate, UserUpdate
+from app.services.sample_service import PostService, UserService
+
+NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def prisma_error(error_class: type, target: Any) -> Exception:
+    """Build a Prisma data error as raised by the query engine."""
+    return error_class({"user_facing_error": {"meta": {"target": target}, "message": "error"}})
+
+
+class FakeRepository:
+    """Repository stub that records calls and replays a scripted result."""
+
+    def __init__(self, result: Any = None, error: Optional[Exception] = None) -> None:
+        self.result = result
+        self.error = error
+        self.calls: list[str] = []
+
+    def __getattr__(self, name: str) -> Any:
+        async def method(*args: Any, **kwargs: Any) -> Any:
+            self.calls.append(name)
+            if self.error is not None:
+                raise self.error
+            return self.result
+
+        return method
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("target", "detail"),
+    [(["email"], "Email already registered"), ("users_username_key", "Username already taken")],
+)
+async def test_update_user_maps_unique_violation(target: Any, detail: str) -> None:
+    """A unique violation becomes a 400 without any pre-check queries."""
+    service = UserService()
+    service.repository = FakeRepository(error=prisma_error(UniqueViolationError, target))
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.update_user("u1", UserUpdate(email="taken@example.com"))
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == detail
+    assert service.repository.calls == ["update"]
+
+
+@pytest.mark.asyncio
+async def test_missing_rows_map_to_404() -> None:
+    """Updates and deletes of missing rows are single queries answered with 404."""
+    user_service = UserService()
+    user_service.repository = FakeRepository(result=None)
+    post_service = PostService()
+    post_service.repository = FakeRepository(result=False)
+
+    with pytest.raises(HTTPException) as update_error:
+        await user_service.update_user("missing", UserUpdate(username="newname"))
+    with pytest.raises(HTTPException) as delete_error:
+        await post_service.delete_post("missing")
+
+    assert update_error.value.status_code == 404
+    assert delete_error.value.status_code == 404
+    assert user_service.repository.calls == ["update"]
+    assert post_service.repository.calls == ["delete"]
+
+
+@pytest.mark.asyncio
+async def test_delete_user_evicts_cascaded_posts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Posts removed by ON DELETE CASCADE are evicted from the post cache."""
+    monkeypatch.setattr(service_module, "post_cache", ReadThroughCache(
+        MemoryCacheBackend(), "post", PostResponse, ttl=60
+    ))
+    post = PostResponse(
+        id="p1", title="Title", published=False, author_id="u1", created_at=NOW, updated_at=NOW
+    )
+
+    async def load_post() -> Optional[PostResponse]:
+        return post
+
+    await service_module.post_cache.get_or_load("p1", load_post)
+    service = UserService()
+    service.repository = FakeRepository(result=True)
+    service.post_repository = FakeRepository(result=["p1"])
+
+    await service.delete_user("u1")
+
+    assert service.post_repository.calls == ["get_ids_by_authors"]
+    assert await service_module.post_cache.backend.get("post:p1") is None
+
+
+@pytest.mark.asyncio
+async def test_empty_update_is_rejected_without_query(monkeypatch: pytest.MonkeyPatch) -> None:
+    """An update with nothing to change is a 400 and never reaches the database."""
+    import app.repositories.sample_repository as repository_module
+
+    class NoDatabase:
+        def __getattr__(self, name: str) -> Any:
+            raise AssertionError("database was queried")
+
+    monkeypatch.setattr(repository_module, "prisma", NoDatabase())
+
+    with pytest.raises(HTTPException) as exc_info:
+        await PostService().update_post("p1", PostUpdate())
+
+    assert exc_info.value.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_create_post_maps_missing_author() -> None:
+    """A foreign key violation on create means the author does not exist."""
+    service = PostService()
+    service.repository = FakeRepository(error=prisma_error(ForeignKeyViolationError, "authorId"))
+    service.user_repository = FakeRepository()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await service.create_post(PostCreate(title="t", author_id="missing"))
+
+    assert exc_info.value.status_code == 404
+    assert service.user_repository.calls == []